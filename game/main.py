@@ -6,26 +6,32 @@ and creates a main menu using imported classes from game.src.menus
 and game.src.screen modules.
 
 Modules imported:
-- Menu, MainMenu: Classes for handling menus from game.src.menus
+- constants: Game settings from game.src.constants
+- ImageCache: Image cache from game.src.cache
+- MainMenu: Class of the main menu from game.src.menus
+- SceneManager: Scene stack that runs the menus and the game from game.src.scenes
 - screen_obj: Object managing the screen from game.src.screen
 - pygame: Pygame library for game development
 
 Initialization steps:
 1. Sets the window caption to "CS-3".
 2. Sets the window icon using an image loaded from "image/icon_game.webp".
+   Enables the on-disk image cache if constants.IMAGE_DISK_CACHE is set.
 3. Loads a custom font from "fonts/Honk-Regular-VariableFont_MORF,SHLN.ttf" with a size of 30.
 4. Renders a text surface with the text 'Long time ago...' using the loaded font and orange color.
 5. Creates an instance of MainMenu() to initialize the main menu.
 
 Execution:
-- If this script is run directly (__name__ == "__main__"), it calls Menu.draw_menu() 
-  to draw the main menu
+- If this script is run directly (__name__ == "__main__"), it pushes the main menu
+  onto a SceneManager and runs its loop, which draws every scene
   on the screen managed by screen_obj.screen.
 
 Note: The paths and specific functionalities are assumed based on the provided code snippet.
 """
-from game.src.menus import Menu, MainMenu
-from game.src.screen import screen_obj
+from game.src import constants
+from game.src.cache import ImageCache
+from game.src.menus import MainMenu
+from game.src.scenes import SceneManager
 
 import pygame
 
@@ -34,6 +40,9 @@ pygame.init()
 pygame.display.set_caption("CS-3")
 pygame.display.set_icon(pygame.image.load("image/icon_game.webp"))
 
+if constants.IMAGE_DISK_CACHE:
+    ImageCache.enable_disk_cache()
+
 # проработать шрифт
 myfont = pygame.font.Font("fonts/Honk-Regular-VariableFont_MORF,SHLN.ttf", 30)
 text_surface = myfont.render('Long time ago...', True, 'orange')
@@ -42,4 +51,6 @@ text_surface = myfont.render('Long time ago...', True, 'orange')
 main_menu = MainMenu()
 
 if __name__ == "__main__":
-    Menu.draw_menu(main_menu, screen_obj.screen)
+    scene_manager = SceneManager()
+    scene_manager.push(main_menu)
+    scene_manager.run()
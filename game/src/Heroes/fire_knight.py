@@ -71,6 +71,8 @@ class FireKnight(Player):
             Checks and updates the animation count, and adjusts position during attack animations.
     """
 
+    asset_dirs = ("image/Heros/Fire-knight",)
+
     def __init__(self, x, y):
         """
         Initialize the Fire Knight with specific attributes and animations.
@@ -92,16 +94,16 @@ class FireKnight(Player):
         self.knockback = constants.PLAYER_MAIN_KNOCKBACK - 10
 
         run = [f"image/Heros/Fire-knight/02_run/run_{i}.png" for i in range(1, 9)]
-        self.run = ImageCache.get_images(run, (1.5, 1.5))
+        self.run = ImageCache.get_animation(run, (1.5, 1.5))
 
         stay = [f"image/Heros/Fire-knight/01_idle/idle_{i}.png" for i in range(1, 9)]
-        self.stay_images = ImageCache.get_images(stay, (1.5, 1.5))
+        self.stay_images = ImageCache.get_animation(stay, (1.5, 1.5))
 
         jump = [f"image/Heros/Fire-knight/03_jump/jump_{i}.png" for i in range(1, 21)]
-        self.jump = ImageCache.get_images(jump, (1.5, 1.5))
+        self.jump = ImageCache.get_animation(jump, (1.5, 1.5))
 
         attack_1 = [f"image/Heros/Fire-knight/05_1_atk/1_atk_{i}.png" for i in range(1, 12)]
-        self.attack_1 = ImageCache.get_images(attack_1, (1.5, 1.5))
+        self.attack_1 = ImageCache.get_animation(attack_1, (1.5, 1.5))
 
         self.rect = self.run[0].get_rect(topleft=(self.x, self.y))
         self.rect = pygame.Rect(self.x, self.y, self.rect.width, self.rect.height)
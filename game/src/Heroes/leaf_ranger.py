@@ -19,7 +19,7 @@ Attributes:
 - ulta_range (float): Range of the Leaf Ranger's ultimate attack.
 - attack_damage (int): Damage inflicted by the Leaf Ranger's attack.
 - knockback (int): Knockback effect on enemies when hit by the Leaf Ranger.
-- arrows (pygame.sprite.Group): Group containing Arrow sprites for the Leaf Ranger.
+- arrows (ShockwavePool): Group containing Arrow sprites for the Leaf Ranger.
 - create_arrow (bool): Flag indicating if an arrow should be created by the Leaf Ranger.
 - can_use_ability_flying (bool):
     Flag indicating if the ability can be used while the Leaf Ranger is flying.
@@ -29,10 +29,10 @@ Methods:
     Initializes the Leaf Ranger with specific attributes and animations.
 - ability(self, game, *args):
     Executes the Leaf Ranger's ability action.
-- move_environment(direction, game):
-    Moves the environment based on the player's movement direction.
-- update(self, screen, game):
+- update(self, game):
     Updates the Leaf Ranger's state and actions.
+- draw(self, screen, position=None):
+    Draws the Leaf Ranger and its arrows.
 
 Usage:
 from game.src.Heroes.leaf_ranger import LeafRanger
@@ -52,8 +52,7 @@ from game.src import constants
 from game.src.Heroes.super_player import SuperPlayer
 from game.src.cache import ImageCache
 from game.src.screen import screen_obj
-from game.src.shokwave import Shockwave
-import pygame.sprite
+from game.src.shokwave import ShockwavePool
 
 
 class LeafRanger(SuperPlayer):
@@ -75,7 +74,7 @@ class LeafRanger(SuperPlayer):
         attack_range (float): Range of the Leaf Ranger's attack.
         attack_damage (int): Damage inflicted by the Leaf Ranger's attack.
         knockback (int): Knockback effect on enemies when hit by the Leaf Ranger.
-        arrows (pygame.sprite.Group): Group containing Arrow sprites.
+        arrows (ShockwavePool): Group containing Arrow sprites.
         create_arrow (bool): Flag indicating if an arrow should be created.
         can_use_ability_flying (bool): Flag indicating if ability can be used while flying.
 
@@ -86,13 +85,15 @@ class LeafRanger(SuperPlayer):
         ability(self, game, *args):
             Executes the Leaf Ranger's ability action.
 
-        move_environment(direction, game):
-            Moves the environment based on player's movement direction.
-
-        update(self, screen, game):
+        update(self, game):
             Updates the Leaf Ranger's state and actions.
+
+        draw(self, screen, position=None):
+            Draws the Leaf Ranger and its arrows.
     """
 
+    asset_dirs = ("image/Heros/leaf_ranger",)
+
     def __init__(self, x, y):
         """
         Initialize the Leaf Ranger with specific attributes and animations.
@@ -102,22 +103,22 @@ class LeafRanger(SuperPlayer):
             y (int): The y-coordinate of the Leaf Ranger's initial position.
         """
         run = [f"image/Heros/leaf_ranger/run/run_{i}.png" for i in range(1, 11)]
-        self.run = ImageCache.get_images(run, (1.5, 1.5))
+        self.run = ImageCache.get_animation(run, (1.5, 1.5))
 
         stay = [f"image/Heros/leaf_ranger/idle/idle_{i}.png" for i in range(1, 13)]
-        self.stay_images = ImageCache.get_images(stay, (1.5, 1.5))
+        self.stay_images = ImageCache.get_animation(stay, (1.5, 1.5))
 
         jump = [f"image/Heros/leaf_ranger/jump_full/jump_{i}.png" for i in range(1, 22)]
-        self.jump = ImageCache.get_images(jump, (1.5, 1.5))
+        self.jump = ImageCache.get_animation(jump, (1.5, 1.5))
 
         attack_1 = [f"image/Heros/leaf_ranger/1_atk/1_atk_{i}.png" for i in range(1, 11)]
-        self.attack_1 = ImageCache.get_images(attack_1, (1.5, 1.5))
+        self.attack_1 = ImageCache.get_animation(attack_1, (1.5, 1.5))
 
         ulta_images_paths = [f'image/Heros/leaf_ranger/sp_atk/sp_atk_{i}.png' for i in range(1, 18)]
-        self.ulta_images = ImageCache.get_images(ulta_images_paths, (1.5, 1.5))
+        self.ulta_images = ImageCache.get_animation(ulta_images_paths, (1.5, 1.5))
 
         ability_images_paths = [f'image/Heros/leaf_ranger/2_atk/2_atk_{i}.png' for i in range(1, 16)]
-        self.ability_images = ImageCache.get_images(ability_images_paths, (1.5, 1.5))
+        self.ability_images = ImageCache.get_animation(ability_images_paths, (1.5, 1.5))
 
         super().__init__(x, y, 60, 60)
 
@@ -132,7 +133,7 @@ class LeafRanger(SuperPlayer):
         self.attack_damage = constants.PLAYER_ATTACK_DAMAGE
         self.knockback = constants.PLAYER_MAIN_KNOCKBACK
 
-        self.arrows = pygame.sprite.Group()
+        self.arrows = ShockwavePool()
         self.create_arrow = False
 
         self.can_use_ability_flying = True
@@ -148,33 +149,30 @@ class LeafRanger(SuperPlayer):
         if self.ability_animation_count == 0 and not self.use_ulta:
             self.create_arrow = True
 
-    @staticmethod
-    def move_environment(direction, game):
+    def update(self, game):
         """
-        Move the environment based on the player's movement direction.
+        Update the Leaf Ranger's state and actions.
 
         Args:
-            direction (str): The direction to move ('left' or 'right').
             game: The game instance.
         """
-        super().move_environment(direction, game)
+        super().update(game)
+
+        if self.ability_animation_count == len(self.ability_images) // 2 and self.create_arrow:
+            self.arrows.spawn(self.rect.centerx, self.rect.centery, 10, 0, self.attack_direction, "arrow")
+            self.create_arrow = False
 
-        for arrow in game.player.arrows:
-            arrow.move_sprite(direction)
+        self.arrows.update(self.arrows, game, "enemies")
 
-    def update(self, screen, game):
+    def draw(self, screen, position=None):
         """
-        Update the Leaf Ranger's state and actions.
+        Draw the Leaf Ranger and its arrows.
 
         Args:
             screen: The Pygame screen surface.
-            game: The game instance.
+            position: The screen position to draw the Leaf Ranger at (default is None).
         """
-        super().update(screen, game)
-
-        if self.ability_animation_count == len(self.ability_images) // 2 and self.create_arrow:
-            arrow = Shockwave(self.rect.centerx, self.rect.centery, 10, 0, self.attack_direction, "arrow")
-            self.arrows.add(arrow)
-            self.create_arrow = False
+        super().draw(screen, position)
 
-        self.arrows.update(screen, self.arrows, game, "enemies")
+        for arrow in self.arrows:
+            arrow.draw(screen)
@@ -8,7 +8,7 @@ Attributes:
 - stay_images (list): List of images for standing animation.
 - jump (list): List of images for jumping animation.
 - attack_1 (list): List of images for attack animation.
-- x (int): X-coordinate of the player's current position.
+- x (int): World x-coordinate of the player's current position.
 - y (int): Y-coordinate of the player's current position.
 - attack_direction (int): Direction of the player's attack (-1 for left, 1 for right).
 - hp (int): Total hit points (health) of the player.
@@ -41,7 +41,14 @@ Attributes:
 - coins (int): Amount of coins collected by the player.
 - inventory (list): List of items in the player's inventory.
 - hp_image (tuple): Tuple of heart images for displaying player's health.
-- rect (pygame.Rect): Rectangular area representing the player in the game world.
+- rect (pygame.Rect): Rectangular area representing the player in world coordinates.
+- prev_x (float): World x-coordinate before the last simulation step, used for interpolation.
+- prev_y (float): Y-coordinate before the last simulation step, used for interpolation.
+- run_direction (int): Direction of the run animation (-1 for left, 1 for right, 0 when standing).
+- key_source (callable): Returns the state of the keyboard, pygame.key.get_pressed by default.
+  Benchmarks replace it with a scripted key timeline.
+- time_source (callable): Returns the time in milliseconds used for the cooldowns, pygame.time.get_ticks
+  by default. Benchmarks replace it with the simulation time of the key timeline.
 
 Methods:
 - __init__(self, x, y):
@@ -56,22 +63,26 @@ Methods:
     Handle the player taking damage.
 - check_invincibility(self):
     Check and update the player's invincibility status.
-- blink(self, image):
-    Make the player blink when invincible.
-- check_damage(self, enemies):
+- is_visible(self):
+    Return whether the player is drawn, so that it blinks when invincible.
+- check_damage(self, broadphase):
     Check for collisions with enemies and apply damage.
-- attack(self, enemies):
+- attack(self, broadphase):
     Handle the player's attack action.
-- draw(self, screen, keys, position=None):
+- get_run_direction(self, keys):
+    Return the direction of the run animation for the pressed keys.
+- get_interpolation_offset(self):
+    Return how far back towards the previous position the player is drawn.
+- draw(self, screen, position=None):
     Draw the player on the screen.
-- move_environment(direction, game):
-    Move the environment based on the player's movement direction.
+- move_with_camera(self, dx, game):
+    Move the player and the camera together.
 - move(self, keys, game):
     Handle the player's movement.
 - check_collisions(self, platforms):
     Check for collisions with platforms.
-- update(self, screen, game):
-    Update the player's state.
+- update(self, game):
+    Update the player's state by one simulation step.
 
 Usage:
 from game.src.Heroes.player import Player
@@ -89,7 +100,8 @@ and game mechanics should be made as per specific game requirements.
 """
 import time
 from game.src import constants
-from game.src.enemies.enemies_base import CommonEnemy
+from game.src.camera import camera_obj
+from game.src.profiler import profiler_obj
 from game.src.screen import screen_obj
 import pygame
 
@@ -104,7 +116,7 @@ class Player(pygame.sprite.Sprite):
             jump (list): List of images for jumping animation.
             attack_1 (list): List of images for attack animation.
 
-            x (int): X-coordinate of the player's current position.
+            x (int): World x-coordinate of the player's current position.
             y (int): Y-coordinate of the player's current position.
             attack_direction (int): Direction of the player's attack (-1 for left, 1 for right).
             hp (int): Total hit points (health) of the player.
@@ -146,9 +158,19 @@ class Player(pygame.sprite.Sprite):
 
             hp_image (tuple): Tuple of heart images for displaying player's health.
 
-            rect (pygame.Rect): Rectangular area representing the player in the game world.
+            rect (pygame.Rect): Rectangular area representing the player in world coordinates.
+            prev_x (float): World x-coordinate before the last simulation step, used for interpolation.
+            prev_y (float): Y-coordinate before the last simulation step, used for interpolation.
+            run_direction (int): Direction of the run animation (-1 for left, 1 for right, 0 when standing).
+            key_source (callable): Returns the state of the keyboard, pygame.key.get_pressed by default.
+            time_source (callable): Returns the time in milliseconds used for the cooldowns,
+                pygame.time.get_ticks by default.
+
+            asset_dirs (tuple): Directories with the hero's images, used for preloading.
         """
 
+    asset_dirs = ()
+
     run = []
     stay_images = []
     jump = []
@@ -158,13 +180,18 @@ class Player(pygame.sprite.Sprite):
         """
         Initialize the Player with specific attributes and animations.
 
-        :param x: The x-coordinate of the Player's initial position.
+        :param x: The world x-coordinate of the Player's initial position.
         :param y: The y-coordinate of the Player's initial position.
         :rtype: object
         """
         super().__init__()
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.run_direction = 0
+        self.key_source = pygame.key.get_pressed
+        self.time_source = pygame.time.get_ticks
         self.attack_direction = constants.PLAYER_ATTACK_DIRECTION
         self.hp = constants.PLAYER_HP_COUNT
         self.current_hp = self.hp
@@ -267,6 +294,7 @@ class Player(pygame.sprite.Sprite):
     def correction(self):
         """
         Correct the player's position if needed.
+        The player is moved back towards the middle of the screen by one pixel per frame.
 
         :rtype: None
         """
@@ -274,10 +302,11 @@ class Player(pygame.sprite.Sprite):
             self.can_left = True
             self.can_right = True
 
-        if self.x == screen_obj.width // 2:
+        offset = self.x - camera_obj.x - screen_obj.width // 2
+        if abs(offset) < 1:
             return
 
-        if self.x > screen_obj.width // 2:
+        if offset > 0:
             self.x -= 1
         else:
             self.x += 1
@@ -317,129 +346,106 @@ class Player(pygame.sprite.Sprite):
         if self.invincible and (current_time - self.last_hit_time) > self.invincibility_duration:
             self.invincible = False
 
-    def blink(self, image):
+    def is_visible(self):
         """
-        Make the player blink when invincible.
+        Return whether the player is drawn, so that it blinks when invincible.
+        The frames are shared through ImageCache, so blinking skips drawing them instead of changing their alpha.
 
-        :param image: The current image of the player.
-        :rtype: None
+        :rtype: bool
         """
-        if self.invincible:
-            current_time = time.time()
-            if int(current_time * 10) % 2 == 0:
-                image.set_alpha(255)  # Fully visible
-            else:
-                image.set_alpha(0)  # Fully transparent
-        else:
-            image.set_alpha(255)  # Fully visible in normal state
+        return not self.invincible or int(time.time() * 10) % 2 == 0
 
-    def check_damage(self, enemies):
+    def check_damage(self, broadphase):
         """
-        Check for collisions with enemies and apply damage.
+        Check for collisions with enemies and apply damage from the first enemy hit.
 
-        :param enemies: The list of enemy groups.
+        :param broadphase: The Broadphase of the enemies.
         :rtype: None
         """
-        for group_enemies in enemies:
-            collided_enemy = pygame.sprite.spritecollideany(self, group_enemies)
-            if collided_enemy:
-                self.take_damage(collided_enemy.damage, collided_enemy)
+        collided_enemies = broadphase.query(self.rect)
+        if collided_enemies:
+            self.take_damage(collided_enemies[0].damage, collided_enemies[0])
 
-    def attack(self, enemies):
+    def attack(self, broadphase):
         """
         Handle the player's attack action.
 
-        :param enemies: The list of enemy groups.
+        :param broadphase: The Broadphase of the enemies.
         :rtype: None
         """
-        self.last_attack_time = pygame.time.get_ticks()
+        self.last_attack_time = self.time_source()
 
         if self.attack_direction == 1:
             attack_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width + self.attack_range, self.rect.height)
         else:
             attack_rect = pygame.Rect(self.rect.x, self.rect.y, -self.attack_range, self.rect.height)
 
-        for group in enemies:
-            for enemy in group:
-                if attack_rect.colliderect(enemy.rect):
-                    enemy.take_damage(self.attack_damage)
+        for enemy in broadphase.query(attack_rect):
+            enemy.take_damage(self.attack_damage)
+
+    def get_run_direction(self, keys):
+        """
+        Return the direction of the run animation for the pressed keys.
+        The player does not run towards an edge of the screen it has reached.
 
-    def draw(self, screen, keys, position=None):
+        :param keys: The current state of all keyboard buttons.
+        :rtype: int
+        :return: -1 for left, 1 for right, 0 when standing.
+        """
+        screen_x = self.x - camera_obj.x
+        if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and screen_x > screen_obj.width * 0.03:
+            return -1
+        if (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and screen_x < screen_obj.width * 0.97:
+            return 1
+        return 0
+
+    def get_interpolation_offset(self):
+        """
+        Return how far back towards the position before the last simulation step the player is drawn.
+        The camera is interpolated the same way, so the player keeps its place on the screen.
+
+        :rtype: tuple
+        """
+        t = 1 - camera_obj.alpha
+        return (self.prev_x - self.x) * t, (self.prev_y - self.y) * t
+
+    def draw(self, screen, position=None):
         """
         Draw the player on the screen.
 
         :param screen: The Pygame screen surface.
-        :param keys: The current state of all keyboard buttons.
-        :param position: The position to draw the player at.
+        :param position: The screen position to draw the player at.
         :rtype: None
         """
         self.animate_hp(screen)
 
         if not position:
-            position = (self.x, self.y)
+            dx, dy = self.get_interpolation_offset()
+            position = camera_obj.apply_point(self.x + dx, self.y + dy)
 
         if self.is_attacking:
-            if self.attack_direction == 1:
-                image = self.attack_1[self.attack_animation_count]
-                self.blink(image)
-                screen.blit(image, position)
-            else:
-                image = pygame.transform.flip(self.attack_1[self.attack_animation_count], True, False)
-                self.blink(image)
-                screen.blit(image, position)
+            image = self.attack_1.get(self.attack_animation_count, self.attack_direction)
         elif not self.is_jump:
-            if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and self.x > screen_obj.width * 0.03:
-                image = pygame.transform.flip(self.run[self.run_animation_count], True, False)
-                self.blink(image)
-                screen.blit(image, position)
-            elif (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and self.x < screen_obj.width * 0.97:
-                image = self.run[self.run_animation_count]
-                self.blink(image)
-                screen.blit(image, position)
+            if self.run_direction:
+                image = self.run.get(self.run_animation_count, self.run_direction)
             else:
-                if self.attack_direction == 1:
-                    image = self.stay_images[self.stay_animation_count]
-                else:
-                    image = pygame.transform.flip(self.stay_images[self.stay_animation_count], True, False)
-
-                self.blink(image)
-                screen.blit(image, position)
+                image = self.stay_images.get(self.stay_animation_count, self.attack_direction)
         else:
-            if self.attack_direction == -1:
-                image = pygame.transform.flip(self.jump[self.jump_animation_count], True, False)
-                self.blink(image)
-                screen.blit(image, position)
-            else:
-                image = self.jump[self.jump_animation_count]
-                self.blink(image)
-                screen.blit(image, position)
+            image = self.jump.get(self.jump_animation_count, self.attack_direction)
 
-        self.check_animation_count()
+        if self.is_visible():
+            screen.blit(image, position)
 
-    @staticmethod
-    def move_environment(direction, game):
+    def move_with_camera(self, dx, game):
         """
-        Move the environment based on the player's movement direction.
+        Move the player and the camera together, so the player keeps its place on the screen.
 
-        :param direction: The direction to move the environment ('left' or 'right').
-        :param game: The game instance containing environment elements.
+        :param dx: The distance to move before scaling to the screen width.
+        :param game: The game instance.
         :rtype: None
         """
-        game.main_location.move_background(direction)
-        for platform in game.platforms:
-            platform.move_platform(direction)
-
-        for part_back in game.partial_backgrounds:
-            part_back.move_background(direction)
-
-        for npc in game.npcs:
-            npc.move_npc(direction)
-
-        CommonEnemy.move_group(direction, game.enemies)
-
-        if game.bosses:
-            for boss in game.bosses:
-                boss.move_sprites(direction)
+        self.x += dx * screen_obj.width_scale
+        game.change_absolute_x(dx)
 
     def move(self, keys, game):
         """
@@ -453,16 +459,12 @@ class Player(pygame.sprite.Sprite):
         if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and self.can_left:
             self.can_right = True
             self.attack_direction = -constants.PLAYER_ATTACK_DIRECTION
-            game.change_absolute_x(constants.VELOCITY)
-
-            Player.move_environment("left", game)
+            self.move_with_camera(constants.VELOCITY, game)
 
         elif (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and self.can_right:
             self.can_left = True
             self.attack_direction = constants.PLAYER_ATTACK_DIRECTION
-            game.change_absolute_x(-constants.VELOCITY)
-
-            Player.move_environment("right", game)
+            self.move_with_camera(-constants.VELOCITY, game)
 
         if (keys[pygame.K_SPACE] or keys[pygame.K_w] or keys[pygame.K_UP]) and not self.is_jump:
             self.is_jump = True
@@ -470,9 +472,9 @@ class Player(pygame.sprite.Sprite):
             self.y_velocity = -self.jump_height
 
         if (keys[pygame.K_f] and not self.is_attacking and
-                pygame.time.get_ticks() - self.last_attack_time > self.attack_cooldown):
+                self.time_source() - self.last_attack_time > self.attack_cooldown):
             self.is_attacking = True
-            self.attack(game.enemies)
+            self.attack(game.broadphase)
 
         self.rect = pygame.Rect(self.x, self.y, self.rect.width, self.rect.height)
 
@@ -485,16 +487,16 @@ class Player(pygame.sprite.Sprite):
     def check_collisions(self, platforms):
         """
         Check for collisions with platforms.
+        Only the platforms found by the grid of the group around the player are checked.
 
-        :param platforms: The list of platforms.
+        :param platforms: The PlatformGroup of the level.
         :rtype: None
-        :param platforms:
         """
         player_rect = pygame.Rect(self.x, self.y, self.rect.width, self.rect.height)
 
         self.on_ground = False
 
-        for platform in platforms:
+        for platform in platforms.query(player_rect):
             if player_rect.colliderect(platform.rect):
 
                 if self.y_velocity > 0 and platform.rect.y > self.y + self.rect.height // 10:  # Падение
@@ -518,21 +520,25 @@ class Player(pygame.sprite.Sprite):
                         self.x = platform.rect.right
                         self.can_left = False
 
-    def update(self, screen, game):
+    def update(self, game):
         """
-        Update the player's state.
+        Update the player's state by one simulation step.
 
-        :param screen: The Pygame screen surface.
         :param game: The game instance.
         :rtype: None
         """
-        keys = pygame.key.get_pressed()
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+        keys = self.key_source()
 
         self.move(keys, game)
+        profiler_obj.mark("player.update")
         self.check_collisions(game.platforms)
-        self.draw(screen, keys)
-        self.check_damage(game.enemies)
+        profiler_obj.mark("collisions")
+        self.run_direction = self.get_run_direction(keys)
+        self.check_animation_count()
+        profiler_obj.mark("player.update")
+        self.check_damage(game.broadphase)
+        profiler_obj.mark("collisions")
         self.check_invincibility()
-
-        # pygame.draw.rect(screen, (255, 255, 255),
-        # (self.rect.x, self.rect.y, self.rect.width, self.rect.height))
@@ -66,6 +66,8 @@ class StandardHero(Player):
                 Initializes the StandardHero with specific attributes and animations.
         """
 
+    asset_dirs = ("image/Heros/standard hero",)
+
     def __init__(self, x, y):
         """
         Initialize the StandardHero with specific attributes and animations.
@@ -87,15 +89,15 @@ class StandardHero(Player):
         self.knockback = constants.PLAYER_MAIN_KNOCKBACK
 
         run = [f"image/Heros/standard hero/Run/run-{i}.png" for i in range(1, 13)]
-        self.run = ImageCache.get_images(run, (1.2, 1.2))
+        self.run = ImageCache.get_animation(run, (1.2, 1.2))
 
         stay = [f"image/Heros/standard hero/stay/idle-{i}.png" for i in range(1, 7)]
-        self.stay_images = ImageCache.get_images(stay, (1.2, 1.2))
+        self.stay_images = ImageCache.get_animation(stay, (1.2, 1.2))
 
         jump = [f"image/Heros/standard hero/Jump/jump-{i}.png" for i in range(1, 15)]
-        self.jump = ImageCache.get_images(jump, (1.2, 1.2))
+        self.jump = ImageCache.get_animation(jump, (1.2, 1.2))
 
         attack_1 = [f"image/Heros/standard hero/Attack/attack-A{i}.png" for i in range(1, 8)]
-        self.attack_1 = ImageCache.get_images(attack_1, (1.2, 1.2))
+        self.attack_1 = ImageCache.get_animation(attack_1, (1.2, 1.2))
 
         self.rect = self.run[0].get_rect(topleft=(self.x, self.y))
@@ -23,7 +23,7 @@ Methods:
 - __init__(self, x, y, rect_x, rect_y):
     Initializes the SuperPlayer with specific attributes and animations.
 
-- draw(self, screen, keys, position=None):
+- draw(self, screen, position=None):
     Draws the SuperPlayer on the screen, handling ability and ultimate attack animations.
 
 - check_animation_count(self):
@@ -32,7 +32,7 @@ Methods:
 - ability(self, game, *args):
     Perform the SuperPlayer's ability. Should be overridden in subclasses.
 
-- ulta(self, enemies):
+- ulta(self, broadphase):
     Perform the SuperPlayer's ultimate attack, dealing damage to enemies within range.
 
 - move(self, keys, game):
@@ -55,6 +55,7 @@ in ImageCache.get_images calls should be made as per specific game requirements.
 """
 from game.src import constants
 from game.src.Heroes.player import Player
+from game.src.camera import camera_obj
 from game.src.screen import screen_obj
 import pygame
 
@@ -83,7 +84,7 @@ class SuperPlayer(Player):
             __init__(self, x, y, rect_x, rect_y):
                 Initializes the SuperPlayer with specific attributes and animations.
 
-            draw(self, screen, keys, position=None):
+            draw(self, screen, position=None):
                 Draws the SuperPlayer on the screen,
                 handling ability and ultimate attack animations.
 
@@ -93,7 +94,7 @@ class SuperPlayer(Player):
             ability(self, game, *args):
                 Perform the SuperPlayer's ability. Should be overridden in subclasses.
 
-            ulta(self, enemies):
+            ulta(self, broadphase):
                 Perform the SuperPlayer's ultimate attack, dealing damage to enemies within range.
 
             move(self, keys, game):
@@ -141,45 +142,33 @@ class SuperPlayer(Player):
         self.ability_animation_count = 0
         self.ulta_animation_count = 0
 
-    def draw(self, screen, keys, position=None):
+    def draw(self, screen, position=None):
         """
         Draw the SuperPlayer on the screen, handling ability and ulta animations.
 
         :param screen: The screen surface to draw the SuperPlayer on.
-        :param keys: The current state of all keyboard buttons.
-        :param position: The position to draw the SuperPlayer. Defaults to None.
+        :param position: The screen position to draw the SuperPlayer. Defaults to None.
         :rtype: object
         """
+        if not position:
+            dx, dy = self.get_interpolation_offset()
+            position = camera_obj.apply_point(self.rect.x - self.dx + dx, self.rect.y - self.dy + dy)
+
         if not self.use_ability and not self.use_ulta:
-            super().draw(screen, keys, (self.rect.x - self.dx, self.rect.y - self.dy))
+            super().draw(screen, position)
             return
 
         self.animate_hp(screen)
 
-        if not position:
-            position = (self.rect.x - self.dx, self.rect.y - self.dy)
-
         if self.use_ability and not self.use_ulta:
-            if self.attack_direction == 1:
-                image = self.ability_images[self.ability_animation_count]
-                self.blink(image)
-                screen.blit(image, position)
-            else:
-                image = pygame.transform.flip(self.ability_images[self.ability_animation_count], True, False)
-                self.blink(image)
+            image = self.ability_images.get(self.ability_animation_count, self.attack_direction)
+            if self.is_visible():
                 screen.blit(image, position)
 
         if self.use_ulta and not self.use_ability:
-            if self.attack_direction == 1:
-                image = self.ulta_images[self.ulta_animation_count]
-                self.blink(image)
+            image = self.ulta_images.get(self.ulta_animation_count, self.attack_direction)
+            if self.is_visible():
                 screen.blit(image, position)
-            else:
-                image = pygame.transform.flip(self.ulta_images[self.ulta_animation_count], True, False)
-                self.blink(image)
-                screen.blit(image, position)
-
-        self.check_animation_count()
 
     def check_animation_count(self):
         """
@@ -215,24 +204,22 @@ class SuperPlayer(Player):
         """
         self.use_ability = False
 
-    def ulta(self, enemies):
+    def ulta(self, broadphase):
         """
         Perform the SuperPlayer's ulta attack, dealing damage to enemies within range.
 
-        :param enemies: A list of enemy groups to check for collisions with the ulta attack.
+        :param broadphase: The Broadphase of the enemies to check for collisions with the ulta attack.
         :rtype: object
         """
-        self.last_ulta_time = pygame.time.get_ticks()
+        self.last_ulta_time = self.time_source()
 
         if self.attack_direction == 1:
             attack_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width + self.ulta_range, self.rect.height)
         else:
             attack_rect = pygame.Rect(self.rect.x, self.rect.y, -self.ulta_range, self.rect.height)
 
-        for group in enemies:
-            for enemy in group:
-                if attack_rect.colliderect(enemy.rect):
-                    enemy.take_damage(self.ulta_damage)
+        for enemy in broadphase.query(attack_rect):
+            enemy.take_damage(self.ulta_damage)
 
     def move(self, keys, game):
         """
@@ -247,11 +234,11 @@ class SuperPlayer(Player):
 
         if (keys[pygame.K_r] and not self.use_ulta and not self.use_ability and
                 (not self.is_jump or self.can_use_ability_flying) and
-                pygame.time.get_ticks() - self.last_ability_time > self.ability_cooldown):
+                self.time_source() - self.last_ability_time > self.ability_cooldown):
             self.use_ability = True
             self.ability(game)
 
         if (keys[pygame.K_q] and not self.is_attacking and not self.use_ability and not self.use_ulta and
-                pygame.time.get_ticks() - self.last_ulta_time > self.ulta_cooldown):
+                self.time_source() - self.last_ulta_time > self.ulta_cooldown):
             self.use_ulta = True
-            self.ulta(game.enemies)
+            self.ulta(game.broadphase)
@@ -75,6 +75,8 @@ class WaterPrincess(SuperPlayer):
             which heals her if her current HP is below her maximum HP.
     """
 
+    asset_dirs = ("image/Heros/water_princess",)
+
     def __init__(self, x, y):
         """
         Initialize the WaterPrincess character with specific attributes and animations.
@@ -84,23 +86,23 @@ class WaterPrincess(SuperPlayer):
         :rtype: object
         """
         run = [f"image/Heros/water_princess/02_walk/walk_{i}.png" for i in range(1, 11)]
-        self.run = ImageCache.get_images(run, (1.5, 1.5))
+        self.run = ImageCache.get_animation(run, (1.5, 1.5))
 
         stay = [f"image/Heros/water_princess/01_idle/idle_{i}.png" for i in range(1, 9)]
-        self.stay_images = ImageCache.get_images(stay, (1.5, 1.5))
+        self.stay_images = ImageCache.get_animation(stay, (1.5, 1.5))
 
         jump = ([f"image/Heros/water_princess/04_jump/j_up_{i}.png" for i in range(1, 4)] +
                 [f"image/Heros/water_princess/04_jump/j_down_{i}.png" for i in range(1, 4)])
-        self.jump = ImageCache.get_images(jump, (1.5, 1.5))
+        self.jump = ImageCache.get_animation(jump, (1.5, 1.5))
 
         attack_1 = [f"image/Heros/water_princess/07_1_atk/1_atk_{i}.png" for i in range(1, 8)]
-        self.attack_1 = ImageCache.get_images(attack_1, (1.5, 1.5))
+        self.attack_1 = ImageCache.get_animation(attack_1, (1.5, 1.5))
 
         ability_images_paths = [f'image/Heros/water_princess/11_heal/heal_{i}.png' for i in range(1, 13)]
-        self.ability_images = ImageCache.get_images(ability_images_paths, (1.5, 1.5))
+        self.ability_images = ImageCache.get_animation(ability_images_paths, (1.5, 1.5))
 
         ulta_images_paths = [f'image/Heros/water_princess/10_sp_atk/sp_atk_{i}.png' for i in range(1, 33)]
-        self.ulta_images = ImageCache.get_images(ulta_images_paths, (1.5, 1.5))
+        self.ulta_images = ImageCache.get_animation(ulta_images_paths, (1.5, 1.5))
 
         super().__init__(x, y, 50, 50)
 
@@ -67,6 +67,8 @@ class WindHashahin(Player):
                 Initializes the WindHashahin character with specific attributes and animations.
         """
 
+    asset_dirs = ("image/Heros/Wind_hashahin",)
+
     def __init__(self, x, y):
         """
         Initialize the WindHashahin character with specific attributes and animations.
@@ -88,17 +90,17 @@ class WindHashahin(Player):
         self.knockback = constants.PLAYER_MAIN_KNOCKBACK + 10
 
         run = [f"image/Heros/Wind_hashahin/run/run_{i}.png" for i in range(1, 9)]
-        self.run = ImageCache.get_images(run, (1.5, 1.5))
+        self.run = ImageCache.get_animation(run, (1.5, 1.5))
 
         stay = [f"image/Heros/Wind_hashahin/idle/idle_{i}.png" for i in range(1, 9)]
-        self.stay_images = ImageCache.get_images(stay, (1.5, 1.5))
+        self.stay_images = ImageCache.get_animation(stay, (1.5, 1.5))
 
         jump = ([f"image/Heros/Wind_hashahin/jump/j_up_{i}.png" for i in range(1, 4)] +
                 [f"image/Heros/Wind_hashahin/jump/j_down_{i}.png" for i in range(1, 4)])
-        self.jump = ImageCache.get_images(jump, (1.5, 1.5))
+        self.jump = ImageCache.get_animation(jump, (1.5, 1.5))
 
         attack_1 = [f"image/Heros/Wind_hashahin/1_atk/1_atk_{i}.png" for i in range(1, 9)]
-        self.attack_1 = ImageCache.get_images(attack_1, (1.5, 1.5))
+        self.attack_1 = ImageCache.get_animation(attack_1, (1.5, 1.5))
 
         self.rect = self.run[0].get_rect(topleft=(self.x, self.y))
         self.rect = pygame.Rect(self.x, self.y, self.rect.width - 30 * screen_obj.width_scale, self.rect.height)
@@ -0,0 +1,239 @@
+"""
+Module: game.src.atlas
+
+This module packs the animation frames of every character, enemy and NPC into
+per-entity texture atlases and loads them back at runtime.
+
+Each atlas is a single PNG (`<name>.png`) plus a frame table (`<name>.json`) that maps
+the original frame path (for example "image/enemys/fireball/1_0.png") to the
+rectangle of that frame inside the atlas.
+
+Functions:
+- collect_frames(directory):
+    Collect all PNG files under a directory.
+- pack_atlas(name, directory, out_dir=constants.ATLAS_DIR):
+    Pack all PNG files found under a directory into one atlas and write its frame table.
+- pack_all(out_dir=constants.ATLAS_DIR):
+    Pack an atlas for every entity directory listed in `ATLAS_SOURCES`.
+
+Classes:
+- TextureAtlas:
+    A static class that reads the frame tables and locates frames inside their atlas.
+
+Usage:
+Build the atlases offline from the `game` directory, with the project root on PYTHONPATH:
+    PYTHONPATH=.. python -m game.src.atlas
+
+`ImageCache` uses `TextureAtlas.get_frame` automatically: it loads and caches the whole atlas
+as one image and hands out its frames as subsurfaces, and falls back to the separate PNG
+files when no atlas contains the requested frame.
+
+Notes:
+- Atlases are generated files; rebuild them after adding or changing any frame.
+"""
+
+import json
+import math
+import os
+from game.src import constants
+import pygame
+
+ATLAS_SOURCES = ("image/Heros", "image/enemys", "image/npc")
+
+
+def collect_frames(directory):
+    """
+    Collect all PNG files under a directory.
+
+    :param directory: The directory to search.
+    :rtype: list
+    :return: sorted list of frame paths with forward slashes.
+    """
+    paths = []
+    for root, _, files in os.walk(directory):
+        for file_name in files:
+            if file_name.lower().endswith(".png"):
+                paths.append(os.path.join(root, file_name).replace(os.sep, "/"))
+
+    return sorted(paths)
+
+
+def _shelf_pack(sizes, max_width, padding):
+    """
+    Place rectangles row by row ("shelves"), tallest first.
+
+    :param sizes: Dictionary of path -> (width, height).
+    :param max_width: Maximum width of the atlas.
+    :param padding: Empty pixels between frames.
+    :rtype: tuple
+    :return: (dictionary of path -> (x, y, width, height), atlas width, atlas height).
+    """
+    area = sum((w + padding) * (h + padding) for w, h in sizes.values())
+    widest = max(w for w, _ in sizes.values()) + padding
+    width = min(max_width, max(widest, 2 ** math.ceil(math.log2(max(1, math.sqrt(area))))))
+
+    order = sorted(sizes, key=lambda path: (-sizes[path][1], -sizes[path][0], path))
+
+    rects = {}
+    x, y, shelf_height = 0, 0, 0
+    for path in order:
+        w, h = sizes[path]
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+
+        rects[path] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+
+    return rects, width, y + shelf_height
+
+
+def pack_atlas(name, directory, out_dir=constants.ATLAS_DIR):
+    """
+    Pack all PNG files found under a directory into one atlas and write its frame table.
+
+    :param name: Name of the atlas (used for the file names).
+    :param directory: Directory with the frames of one entity.
+    :param out_dir: Directory to write the atlas and frame table to.
+    :rtype: int
+    :return: number of packed frames.
+    """
+    paths = collect_frames(directory)
+    if not paths:
+        return 0
+
+    images = {path: pygame.image.load(path) for path in paths}
+    sizes = {path: image.get_size() for path, image in images.items()}
+    rects, width, height = _shelf_pack(sizes, constants.ATLAS_MAX_WIDTH, constants.ATLAS_PADDING)
+
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    for path, (x, y, _, _) in rects.items():
+        atlas.blit(images[path], (x, y))
+
+    os.makedirs(out_dir, exist_ok=True)
+    pygame.image.save(atlas, os.path.join(out_dir, f"{name}.png"))
+    with open(os.path.join(out_dir, f"{name}.json"), "w", encoding="utf-8") as file:
+        json.dump({"image": f"{name}.png", "frames": rects}, file, indent=1, sort_keys=True)
+
+    return len(paths)
+
+
+def pack_all(out_dir=constants.ATLAS_DIR):
+    """
+    Pack an atlas for every entity directory listed in ATLAS_SOURCES.
+
+    :param out_dir: Directory to write the atlases and frame tables to.
+    :rtype: dict
+    :return: atlas name -> number of packed frames.
+    """
+    packed = {}
+    for source in ATLAS_SOURCES:
+        for entity in sorted(os.listdir(source)):
+            directory = os.path.join(source, entity)
+            if os.path.isdir(directory):
+                name = entity.lower().replace(" ", "_")
+                packed[name] = pack_atlas(name, directory, out_dir)
+
+    return packed
+
+
+class TextureAtlas:
+    """
+        A static class that locates animation frames inside packed atlases.
+
+        Attributes:
+            frames (dict or None): Frame path -> (atlas image path, rect).
+                None until the frame tables are read.
+            sheets (dict): Atlas image path -> sorted list of the frame paths it contains.
+
+        Methods:
+            load_index(directory=constants.ATLAS_DIR):
+                Read every frame table in the directory.
+            get_atlas_path(path):
+                Return the image path of the atlas containing the frame, or None.
+            get_frame(path):
+                Return the atlas image path and the rect of the frame, or None if no atlas has it.
+            get_frames(image_path):
+                Return the frame paths packed into an atlas image.
+        """
+
+    frames = None
+    sheets = {}
+
+    @staticmethod
+    def load_index(directory=constants.ATLAS_DIR):
+        """
+        Read every frame table found in the directory.
+
+        :param directory: Directory with the atlases and frame tables.
+        :rtype: None
+        """
+        TextureAtlas.frames = {}
+        TextureAtlas.sheets = {}
+        if not os.path.isdir(directory):
+            return
+
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith(".json"):
+                continue
+
+            with open(os.path.join(directory, file_name), encoding="utf-8") as file:
+                table = json.load(file)
+
+            image_path = os.path.join(directory, table["image"])
+            for path, rect in table["frames"].items():
+                TextureAtlas.frames[path] = (image_path, pygame.Rect(rect))
+            TextureAtlas.sheets[image_path] = sorted(table["frames"])
+
+    @staticmethod
+    def get_atlas_path(path):
+        """
+        Return the image path of the atlas containing the frame.
+
+        :param path: The original file path of the frame.
+        :rtype: str | None
+        :return: the atlas image path, or None if no atlas contains the frame.
+        """
+        if TextureAtlas.frames is None:
+            TextureAtlas.load_index()
+
+        if path not in TextureAtlas.frames:
+            return None
+
+        return TextureAtlas.frames[path][0]
+
+    @staticmethod
+    def get_frame(path):
+        """
+        Return where a frame is packed.
+
+        :param path: The original file path of the frame.
+        :rtype: tuple | None
+        :return: (atlas image path, rect), or None if no atlas contains the frame.
+        """
+        if TextureAtlas.get_atlas_path(path) is None:
+            return None
+
+        return TextureAtlas.frames[path]
+
+    @staticmethod
+    def get_frames(image_path):
+        """
+        Return the frame paths packed into an atlas image.
+
+        :param image_path: The image path of the atlas.
+        :rtype: list
+        :return: the frame paths, empty if the image is not an atlas.
+        """
+        if TextureAtlas.frames is None:
+            TextureAtlas.load_index()
+
+        return TextureAtlas.sheets.get(image_path, [])
+
+
+if __name__ == "__main__":
+    for atlas_name, count in pack_all().items():
+        print(f"{atlas_name}: {count} frames")
@@ -0,0 +1,414 @@
+"""
+Module: game.src.benchmark
+
+This module runs named gameplay scenarios headless and reports how long the frames take.
+
+Each scenario creates a fresh GameOn, feeds the player a scripted key timeline instead of
+pygame.key.get_pressed(), and runs frames as fast as possible until the scenario is complete or
+its frame limit is reached. Every frame runs exactly one simulation step. The player is invincible,
+so a run cannot end early by dying. Attack and ability cooldowns are measured in simulation time
+(the step of the key timeline), so a run takes the same number of frames on every machine.
+
+For every scenario the report holds the mean, p50, p95 and p99 frame time, the mean time of every
+profiler section (see game.src.profiler), the peak memory of the process and the ImageCache usage.
+The report is written as JSON, so runs can be compared across commits.
+
+Peak memory is the peak resident set size of the whole process, so it only grows from one scenario
+to the next. Run one scenario per process (`--scenario`) to measure it in isolation. It is not
+available on platforms without the `resource` module.
+
+Attributes:
+- SCENARIOS (dict): Scenario name -> Scenario.
+
+Classes:
+- ScriptedKeys:
+    Keyboard state holding a set of pressed keys, indexed like pygame.key.get_pressed().
+- KeyTimeline:
+    Recorded key presses, returning the keyboard state of one simulation step per call.
+- Scenario:
+    A named hero, key timeline, setup, steering and completion condition.
+
+Functions:
+- go_to_boss(game):
+    Move the camera and the player to where the boss appears.
+- approach_enemy(game):
+    Move the camera and the player next to the leftmost enemy still alive.
+- percentile(values, fraction):
+    Return a percentile of a list of values.
+- run_scenario(scenario):
+    Run a scenario and return its report.
+- main(args):
+    Command-line entry point.
+
+Usage (from the `game` directory):
+PYTHONPATH=.. python -m game.src.benchmark --output bench.json
+PYTHONPATH=.. python -m game.src.benchmark --scenario boss_fight --scenario arrow_spam
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Headless mode has to be selected before the screen module creates the display.
+os.environ.setdefault("CS3_HEADLESS", "1")
+
+from game.src import constants
+from game.src.cache import ImageCache
+from game.src.headless import create_game
+from game.src.profiler import profiler_obj
+from game.src.screen import screen_obj
+import pygame
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class ScriptedKeys:
+    """
+        Keyboard state holding a set of pressed keys, indexed like pygame.key.get_pressed().
+
+        Attributes:
+            pressed (frozenset): Key codes of the pressed keys.
+        """
+
+    def __init__(self, pressed):
+        """
+        Initialize the ScriptedKeys.
+
+        :param pressed: Iterable of pressed key codes.
+        :rtype: object
+        """
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        """
+        Return whether a key is pressed.
+
+        :param key: The key code, such as pygame.K_d.
+        :rtype: bool
+        """
+        return key in self.pressed
+
+
+class KeyTimeline:
+    """
+        Recorded key presses, returning the keyboard state of one simulation step per call.
+        Set an instance as Player.key_source to drive the player, and its get_time as
+        Player.time_source to measure the cooldowns in steps.
+
+        Attributes:
+            states (list): ScriptedKeys of every step.
+            step (int): Index of the next step.
+
+        Methods:
+            hold(start, end, *keys): Add keys held from step start up to step end.
+            tap(start, end, period, *keys): Add keys pressed for one step every period steps.
+            get_time(): Return the simulation time in milliseconds.
+            __call__(): Return the keyboard state of the next step.
+        """
+
+    def __init__(self, length):
+        """
+        Initialize an empty KeyTimeline. Steps after the end have no keys pressed.
+
+        :param length: The number of recorded steps.
+        :rtype: object
+        """
+        self.states = [ScriptedKeys(()) for _ in range(length)]
+        self.step = 0
+
+    def add(self, steps, keys):
+        """
+        Press keys during the given steps.
+
+        :param steps: Iterable of step indices.
+        :param keys: Key names, as understood by pygame.key.key_code, such as "d" or "space".
+        :rtype: KeyTimeline
+        :return: the timeline itself, so calls can be chained.
+        """
+        codes = [pygame.key.key_code(key) for key in keys]
+        for step in steps:
+            if step < len(self.states):
+                self.states[step] = ScriptedKeys(self.states[step].pressed.union(codes))
+        return self
+
+    def hold(self, start, end, *keys):
+        """
+        Hold keys from step start up to, but not including, step end.
+
+        :param start: The first step.
+        :param end: The step after the last one.
+        :param keys: Key names.
+        :rtype: KeyTimeline
+        """
+        return self.add(range(start, end), keys)
+
+    def tap(self, start, end, period, *keys):
+        """
+        Press keys for one step every period steps, from step start up to step end.
+
+        :param start: The first step.
+        :param end: The step after the last one.
+        :param period: The number of steps between presses.
+        :param keys: Key names.
+        :rtype: KeyTimeline
+        """
+        return self.add(range(start, end, period), keys)
+
+    def get_time(self):
+        """
+        Return the simulation time in milliseconds, counted from the steps played so far.
+
+        :rtype: float
+        """
+        return self.step * 1000 / constants.SIMULATION_FPS
+
+    def __call__(self):
+        """
+        Return the keyboard state of the next step.
+
+        :rtype: ScriptedKeys
+        """
+        state = self.states[self.step] if self.step < len(self.states) else ScriptedKeys(())
+        self.step += 1
+        return state
+
+
+class Scenario:
+    """
+        A named benchmark scenario.
+
+        Attributes:
+            name (str): The name of the scenario.
+            hero (str): The hero to play, a key of game.src.headless.HEROES.
+            frames (int): The maximum number of frames to run.
+            timeline (function): Returns a new KeyTimeline for the scenario.
+            setup (function or None): Prepares a new game before the first frame.
+            steer (function or None): Moves the player after every frame.
+            done (function or None): Returns True once the scenario is complete.
+        """
+
+    def __init__(self, name, hero, frames, timeline, setup=None, steer=None, done=None):
+        """
+        Initialize the Scenario.
+
+        :param name: The name of the scenario.
+        :param hero: The hero to play.
+        :param frames: The maximum number of frames to run.
+        :param timeline: Function of the frame count returning a new KeyTimeline.
+        :param setup: Optional function of the game, called before the first frame.
+        :param steer: Optional function of the game, called after every frame.
+        :param done: Optional function of the game, returning True once the scenario is complete.
+        :rtype: object
+        """
+        self.name = name
+        self.hero = hero
+        self.frames = frames
+        self.timeline = timeline
+        self.setup = setup
+        self.steer = steer
+        self.done = done
+
+    def is_done(self, game):
+        """
+        Steer the player, then return whether the scenario is complete.
+        Passed to GameOn.run_frames, which calls it after every frame.
+
+        :param game: The game.
+        :rtype: bool
+        """
+        if self.steer:
+            self.steer(game)
+        return bool(self.done and self.done(game))
+
+
+def go_to_boss(game):
+    """
+    Move the camera and the player to where the boss appears.
+
+    :param game: The game to prepare.
+    :rtype: None
+    """
+    distance = game.level.arena_trigger
+    game.camera.scroll(distance)
+    game.player.x += distance
+
+
+def approach_enemy(game):
+    """
+    Move the camera and the player next to the leftmost enemy still alive, facing it, so the next
+    attack hits it. When no enemy is loaded, move one chunk to the right, so the next chunk is loaded.
+
+    :param game: The game.
+    :rtype: None
+    """
+    player = game.player
+    enemies = [enemy for group in game.enemies for enemy in group if not enemy.is_dead]
+
+    if enemies:
+        target = min(enemies, key=lambda enemy: enemy.rect.x)
+        distance = target.rect.centerx - (player.x + player.rect.width)
+        player.y = target.rect.bottom - player.rect.height
+        player.y_velocity = 0
+        player.attack_direction = constants.PLAYER_ATTACK_DIRECTION
+    else:
+        distance = game.streamer.chunk_width
+
+    game.camera.scroll(distance)
+    player.x += distance
+
+
+def count_enemies(game):
+    """
+    Return the number of enemies of the level not defeated yet, not counting the boss.
+    Enemies in chunks that are not loaded are counted from the level records.
+
+    :param game: The game.
+    :rtype: int
+    """
+    return game.streamer.count_enemies_left()
+
+
+def is_boss_defeated(game):
+    """
+    Return whether the boss has been created and killed.
+
+    :param game: The game.
+    :rtype: bool
+    """
+    return game.is_boss_created and not game.bosses
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    Scenario("walk_level", "standard_hero", 3000,
+             lambda frames: KeyTimeline(frames).hold(0, frames, "d").tap(0, frames, 40, "w"),
+             done=lambda game: game.is_boss_created),
+    Scenario("fight_enemies", "fire_knight", 3000,
+             lambda frames: KeyTimeline(frames).tap(0, frames, 2, "f").tap(1, frames, 60, "q"),
+             steer=approach_enemy, done=lambda game: count_enemies(game) == 0),
+    Scenario("boss_fight", "leaf_ranger", 5000,
+             lambda frames: KeyTimeline(frames).hold(0, 5, "d").tap(5, frames, 15, "f")
+             .tap(10, frames, 20, "r").tap(20, frames, 90, "w"),
+             setup=go_to_boss, done=is_boss_defeated),
+    Scenario("arrow_spam", "leaf_ranger", 1200,
+             lambda frames: KeyTimeline(frames).hold(0, 300, "d").hold(600, 900, "a")
+             .tap(0, frames, 5, "r")),
+)}
+
+
+def percentile(values, fraction):
+    """
+    Return a percentile of a list of values, by the nearest-rank method.
+
+    :param values: The values.
+    :param fraction: The percentile as a fraction, such as 0.95.
+    :rtype: float
+    """
+    if not values:
+        return 0
+
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def get_peak_memory():
+    """
+    Return the peak resident set size of the process in kilobytes, or None if it is unknown.
+
+    :rtype: int or None
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_scenario(scenario):
+    """
+    Run a scenario and return its report.
+
+    :param scenario: The scenario to run.
+    :rtype: dict
+    """
+    game = create_game(scenario.hero)
+    timeline = scenario.timeline(scenario.frames)
+    game.player.key_source = timeline
+    game.player.time_source = timeline.get_time
+    game.player.invincible = True
+    game.player.invincibility_duration = float("inf")
+
+    if scenario.setup:
+        scenario.setup(game)
+
+    profiler_obj.enable(history=None)
+    frames = game.run_frames(screen_obj.screen, scenario.frames, scenario.is_done)
+    profiler_obj.disable()
+
+    timings = profiler_obj.get_frames()
+    frame_times = [timing["frame"] for timing in timings]
+
+    sections = {}
+    for timing in timings:
+        for name, milliseconds in timing.items():
+            if name != "frame" and name not in profiler_obj.counter_names:
+                sections[name] = sections.get(name, 0) + milliseconds
+
+    count = len(timings) or 1
+    return {
+        "hero": scenario.hero,
+        "frames": frames,
+        "completed": scenario.done(game) if scenario.done else frames == scenario.frames,
+        "enemies_left": count_enemies(game),
+        "mean_ms": sum(frame_times) / count,
+        "p50_ms": percentile(frame_times, 0.5),
+        "p95_ms": percentile(frame_times, 0.95),
+        "p99_ms": percentile(frame_times, 0.99),
+        "max_ms": max(frame_times, default=0),
+        "sections_ms": {name: total / count for name, total in sorted(sections.items())},
+        "peak_memory_kb": get_peak_memory(),
+        "image_cache_bytes": ImageCache.get_stats()["resident_bytes"],
+    }
+
+
+def main(args):
+    """
+    Run the benchmark scenarios and write the report.
+
+    :param args: Command-line arguments.
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(prog="python -m game.src.benchmark", description=__doc__.split("\n\n")[1])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run; may be repeated (default: all)")
+    parser.add_argument("--output", help="write the JSON report to this file instead of standard output")
+    options = parser.parse_args(args)
+
+    pygame.init()
+
+    report = {
+        "screen": [screen_obj.width, screen_obj.height],
+        "scenarios": {},
+    }
+
+    for name in options.scenario or SCENARIOS:
+        result = run_scenario(SCENARIOS[name])
+        report["scenarios"][name] = result
+        print(f"{name}: {result['frames']} frames, mean {result['mean_ms']:.2f} ms, "
+              f"p95 {result['p95_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
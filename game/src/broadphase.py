@@ -0,0 +1,93 @@
+"""
+Module: game.src.broadphase
+
+This module defines the `Broadphase` class, a sort-and-sweep index of the enemies used to find
+the enemies hit by attacks, ultas, projectiles and the player's body.
+
+Once per simulation step, after the enemies have moved, `rebuild(groups)` sorts every enemy by the
+left edge of its rect. `query(rect)` then finds the first enemy that could overlap the rect with a
+binary search and sweeps to the right while the left edges are before the rect's right edge, so a
+query costs O(log n + k), where k is the number of enemies in that window.
+
+Classes:
+- Broadphase:
+    Sorted interval list of the enemies.
+
+    Methods:
+    - rebuild(groups):
+        Sort the enemies of all groups by the left edge of their rects.
+    - query(rect):
+        Return the enemies whose rects collide with a rect.
+
+Usage:
+from game.src.broadphase import Broadphase
+
+broadphase = Broadphase()
+broadphase.rebuild(game.enemies)
+for enemy in broadphase.query(attack_rect):
+    enemy.take_damage()
+"""
+
+from bisect import bisect_left
+
+
+class Broadphase:
+    """
+        A sorted interval list of the enemies.
+
+        Attributes:
+            entries (list): (left edge, group order, enemy) tuples sorted by left edge.
+            lefts (list): The left edges of the entries, for binary search.
+            max_width (int): Width of the widest enemy rect, which bounds how far left a query looks.
+
+        Methods:
+            rebuild(groups): Sort the enemies of all groups by the left edge of their rects.
+            query(rect): Return the enemies whose rects collide with a rect.
+        """
+
+    def __init__(self):
+        """
+        Initialize an empty Broadphase.
+
+        :rtype: object
+        """
+        self.entries = []
+        self.lefts = []
+        self.max_width = 0
+
+    def rebuild(self, groups):
+        """
+        Sort the enemies of all groups by the left edge of their rects.
+        Must be called again after the enemies have moved.
+
+        :param groups: The list of enemy groups.
+        :rtype: None
+        """
+        enemies = [enemy for group in groups for enemy in group]
+
+        self.entries = sorted(((enemy.rect.left, order, enemy) for order, enemy in enumerate(enemies)),
+                              key=lambda entry: entry[:2])
+        self.lefts = [entry[0] for entry in self.entries]
+        self.max_width = max((enemy.rect.width for enemy in enemies), default=0)
+
+    def query(self, rect):
+        """
+        Return the enemies whose rects collide with a rect, in the order of their groups.
+        A rect with a negative width, such as a leftward attack, is handled like colliderect does.
+
+        :param rect: The rect in world coordinates.
+        :rtype: list
+        """
+        area = rect.copy()
+        area.normalize()
+
+        found = []
+        for i in range(bisect_left(self.lefts, area.left - self.max_width), len(self.entries)):
+            left, order, enemy = self.entries[i]
+            if left >= area.right:
+                break
+            if rect.colliderect(enemy.rect):
+                found.append((order, enemy))
+
+        found.sort(key=lambda entry: entry[0])
+        return [enemy for _, enemy in found]
@@ -57,8 +57,10 @@ correctly imported and initialized before using this module.
 - Provide paths to image and sound files to fully utilize button functionalities.
 - Adjust the font and text rendering specifics according to your
 game's requirements in the `draw` method.
+- The label is rendered once through `text_cache_obj` and reused on later frames.
 
 """
+from game.src.text import text_cache_obj
 import pygame
 
 
@@ -144,8 +146,7 @@ class Button:
         screen.blit(current_image, self.rect.topleft)
 
         if self.text:
-            font = pygame.font.Font(None, 36)  # добавить шрифт
-            text_surface = font.render(self.text, True, (255, 255, 255))
+            text_surface = text_cache_obj.render(self.text, 36, (255, 255, 255))  # добавить шрифт
             text_rect = text_surface.get_rect(center=self.rect.center)
             screen.blit(text_surface, text_rect)
 
@@ -6,17 +6,54 @@ with optional scaling based on screen scaling factors.
 
 Attributes:
 - cache (dict): A dictionary to store loaded images keyed by their file paths.
+- scaled_cache (dict): A dictionary to store scaled images keyed by
+  (path, scale, screen width scale, screen height scale).
+- flipped_cache (dict): A dictionary to store horizontally mirrored copies of scaled images,
+  keyed the same way as `scaled_cache`.
+- hits (int): Number of scaled image requests served from `scaled_cache`.
+- misses (int): Number of scaled image requests that had to be scaled.
+- disk_hits (int): Number of misses served from the disk cache instead of being scaled.
+- disk_cache_dir (str or None): Versioned directory of the disk cache, None while it is off.
+- lru (OrderedDict): (cache level name, key) -> size in bytes of every cached image,
+  least recently used first.
+- evictable (OrderedDict): The entries of `lru` that are not pinned, in the same order,
+  so eviction never walks the pinned images.
+- pinned (set): Path prefixes of images that must not be evicted.
+- resident_bytes (int): Total size of all cached images.
+- budget (int): Maximum resident size before least recently used images are evicted.
+- evictions (int): Number of evicted images.
+
+Classes:
+- Animation:
+    A list-like bank of animation frames holding both the right-facing frames
+    and their pre-built mirrored (left-facing) copies.
 
 Methods:
 - get_images(paths, scale=None):
     Load images from specified paths and optionally scale them based on provided scaling factors.
     If no scaling factors are provided, default screen scaling factors are used.
+- load_image(path):
+    Return the unscaled source image, taken from a packed texture atlas when available.
+- get_animation(paths, scale=None):
+    Same as `get_images`, but returns an `Animation` that also holds the mirrored frames.
+- enable_disk_cache(directory=constants.IMAGE_DISK_CACHE_DIR):
+    Store scaled images as raw RGBA blobs on disk and reuse them on later launches.
+- is_on_disk(path):
+    Check whether scaled images of a source were stored on disk, so the source need not be decoded.
+- pin(prefixes) / unpin(prefixes):
+    Protect the images of assets in use from eviction, or release them.
+- get_memory_stats():
+    Return the resident bytes of every asset group.
+- get_stats():
+    Return the hit/miss counters and the size of the cache levels.
 
 Usage:
 images = ImageCache.get_images(["path/to/image.png", "path/to/another/image.png"], (2, 2))
+run = ImageCache.get_animation(["path/to/run_1.png", "path/to/run_2.png"], (2, 2))
+screen.blit(run.get(0, -1), (x, y))
 
 This class is useful for efficiently loading and managing images in a game, ensuring that
-images are loaded only once and optionally scaled to match the current screen resolution.
+images are loaded and scaled only once for the current screen resolution.
 
 Example:
     from game.src.image_cache import ImageCache
@@ -28,11 +65,76 @@ Example:
 Notes:
 - Ensure that `screen_obj` from `game.src.screen` is correctly initialized before using this module,
   as it is used for scaling images based on screen dimensions.
+- Returned surfaces are shared between all callers with the same request,
+  so they must not be modified in place.
+- Surfaces are sized as width * height * bytes per pixel. A texture atlas is cached and evicted as
+  one source image; its frames are subsurfaces of it and are not counted.
+- Evicting an image only drops the cache's reference; sprites that still hold it keep it alive,
+  so pin the assets in use.
 
 """
+from collections import OrderedDict
+import hashlib
+import mmap
+import os
+import struct
+from game.src import constants
+from game.src.atlas import TextureAtlas
 from game.src.screen import screen_obj
 import pygame
 
+DISK_CACHE_HEADER = "<II"
+
+
+class Animation:
+    """
+        A list-like bank of animation frames with pre-built mirrored copies.
+
+        Indexing, iterating and `len` behave like the plain list of right-facing frames,
+        so an Animation can be used wherever a list of images was used before.
+
+        Attributes:
+            frames (list): Right-facing frames.
+            flipped_frames (list): Left-facing (horizontally mirrored) frames.
+
+        Methods:
+            get(index, direction=1):
+                Return the frame for the given direction (-1 for left, 1 for right).
+        """
+
+    def __init__(self, frames, flipped_frames):
+        """
+        Initialize the Animation with both orientations of the frames.
+
+        :param frames: list of right-facing frames.
+        :param flipped_frames: list of left-facing frames in the same order.
+        :rtype: object
+        """
+        self.frames = frames
+        self.flipped_frames = flipped_frames
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+    def __iter__(self):
+        return iter(self.frames)
+
+    def get(self, index, direction=1):
+        """
+        Return the frame at the index for the given direction.
+
+        :param index: Index of the frame.
+        :param direction: -1 for the left-facing frame, anything else for the right-facing one.
+        :rtype: pygame.Surface
+        :return: the pre-built frame.
+        """
+        if direction == -1:
+            return self.flipped_frames[index]
+        return self.frames[index]
+
 
 class ImageCache:
     """
@@ -41,10 +143,61 @@ class ImageCache:
 
         Attributes:
             cache (dict): A dictionary to store loaded images keyed by their file paths.
+            scaled_cache (dict): A dictionary to store scaled images keyed by
+                (path, scale, screen width scale, screen height scale).
+            flipped_cache (dict): A dictionary to store mirrored copies of scaled images.
+            hits (int): Number of scaled image requests served from the cache.
+            misses (int): Number of scaled image requests that had to be scaled.
+            disk_hits (int): Number of misses served from the disk cache.
+            disk_cache_dir (str or None): Versioned directory of the disk cache.
+            lru (OrderedDict): (cache level name, key) -> size in bytes, least recently used first.
+            evictable (OrderedDict): The entries of lru that are not pinned, in the same order.
+            pinned (set): Path prefixes of images that must not be evicted.
+            resident_bytes (int): Total size of all cached images.
+            budget (int): Maximum resident size in bytes.
+            evictions (int): Number of evicted images.
 
         Methods:
             get_images(paths, scale=None):
                 Load images from specified paths and scale them if required.
+            load_image(path):
+                Return the unscaled source image, from a texture atlas if one contains it.
+            get_animation(paths, scale=None):
+                Load images like `get_images` and return them with their mirrored copies.
+            enable_disk_cache(directory=constants.IMAGE_DISK_CACHE_DIR):
+                Store scaled images on disk and reuse them on later launches.
+            get_disk_cache_dir(path):
+                Return the directory of the blobs of a source image.
+            get_disk_cache_path(key):
+                Return the blob path of a scaled image.
+            is_on_disk(path):
+                Check whether scaled images of a source are stored on disk.
+            read_disk_cache(key):
+                Rebuild a scaled image from its memory-mapped blob.
+            write_disk_cache(key, image):
+                Save a scaled image as a raw RGBA blob.
+            store(cache_name, key, image):
+                Put an image into a cache level and evict old images if over budget.
+            touch(cache_name, key):
+                Mark an image as the most recently used one.
+            evict():
+                Drop least recently used, unpinned images until the budget is met.
+            update_evictable():
+                Rebuild the unpinned entries after the pinned prefixes changed.
+            pin(prefixes):
+                Protect images under the path prefixes from eviction.
+            unpin(prefixes):
+                Allow images under the path prefixes to be evicted again.
+            is_pinned(path):
+                Check whether an image is protected from eviction.
+            get_path(cache_name, key):
+                Return the file path of a cached image.
+            get_group(path):
+                Return the asset group of an image.
+            get_memory_stats():
+                Return the resident bytes of every asset group.
+            get_stats():
+                Return the cache counters.
 
         Usage:
             images = ImageCache.get_images(["path/to/image.png",
@@ -52,6 +205,19 @@ class ImageCache:
         """
 
     cache = {}
+    scaled_cache = {}
+    flipped_cache = {}
+    hits = 0
+    misses = 0
+    disk_hits = 0
+    disk_cache_dir = None
+
+    lru = OrderedDict()
+    evictable = OrderedDict()
+    pinned = set()
+    resident_bytes = 0
+    budget = constants.IMAGE_CACHE_BUDGET
+    evictions = 0
 
     @staticmethod
     def get_images(paths, scale=None):
@@ -65,17 +231,353 @@ class ImageCache:
         """
         images = []
         for path in paths:
-            if path not in ImageCache.cache:
-                ImageCache.cache[path] = pygame.image.load(path).convert_alpha()
-
-            if scale:
-                images.append(pygame.transform.scale(ImageCache.cache[path],
-                                                     (ImageCache.cache[path].get_width() * scale[
-                                                         0] * screen_obj.width_scale,
-                                                      ImageCache.cache[path].get_height() * scale[
-                                                          1] * screen_obj.height_scale)))
+            key = ImageCache.get_key(path, scale)
+
+            if key in ImageCache.scaled_cache:
+                ImageCache.hits += 1
+                ImageCache.touch("scaled_cache", key)
+                image = ImageCache.scaled_cache[key]
             else:
-                images.append(pygame.transform.scale(ImageCache.cache[path],
-                                                     (ImageCache.cache[path].get_width() * screen_obj.width_scale,
-                                                      ImageCache.cache[path].get_height() * screen_obj.height_scale)))
+                ImageCache.misses += 1
+                image = ImageCache.read_disk_cache(key)
+                if image is None:
+                    image = ImageCache.load_image(path)
+                    image = pygame.transform.scale(
+                        image, (image.get_width() * key[1][0] * screen_obj.width_scale,
+                                image.get_height() * key[1][1] * screen_obj.height_scale))
+                    ImageCache.write_disk_cache(key, image)
+
+                ImageCache.store("scaled_cache", key, image)
+
+            images.append(image)
         return images
+
+    @staticmethod
+    def load_image(path):
+        """
+        Return the unscaled source image, loading it on first use.
+        Frames packed into a texture atlas are returned as subsurfaces of the atlas, which is cached
+        as a single image; the subsurfaces themselves are not cached, so they cost no memory of their own.
+
+        :param path: file path of the image.
+        :rtype: pygame.Surface
+        :return: the source image.
+        """
+        frame = TextureAtlas.get_frame(path)
+        if frame:
+            atlas_path, rect = frame
+            return ImageCache.load_image(atlas_path).subsurface(rect)
+
+        if path in ImageCache.cache:
+            ImageCache.touch("cache", path)
+            return ImageCache.cache[path]
+
+        image = pygame.image.load(path).convert_alpha()
+        ImageCache.store("cache", path, image)
+        return image
+
+    @staticmethod
+    def enable_disk_cache(directory=constants.IMAGE_DISK_CACHE_DIR):
+        """
+        Store scaled images on disk and reuse them on later launches.
+        Blobs are kept in a subdirectory named after IMAGE_DISK_CACHE_VERSION,
+        so bumping the version invalidates every old blob.
+
+        :param directory: Root directory of the disk cache.
+        :rtype: None
+        """
+        ImageCache.disk_cache_dir = os.path.join(directory, f"v{constants.IMAGE_DISK_CACHE_VERSION}")
+        os.makedirs(ImageCache.disk_cache_dir, exist_ok=True)
+
+    @staticmethod
+    def get_disk_cache_dir(path):
+        """
+        Return the directory of the blobs of a source image.
+        The name depends on the source modification time and the screen resolution,
+        so editing the image or changing the resolution produces a new directory.
+
+        :param path: file path of the source image.
+        :rtype: str
+        :return: path of the directory.
+        """
+        mtime = os.path.getmtime(path)
+        name = repr((path, mtime, screen_obj.width, screen_obj.height))
+        return os.path.join(ImageCache.disk_cache_dir, hashlib.sha1(name.encode()).hexdigest())
+
+    @staticmethod
+    def get_disk_cache_path(key):
+        """
+        Return the blob path of a scaled image, in the directory of its source.
+
+        :param key: Cache key returned by `get_key`.
+        :rtype: str
+        :return: path of the blob file.
+        """
+        name = hashlib.sha1(repr(key[1:]).encode()).hexdigest() + ".rgba"
+        return os.path.join(ImageCache.get_disk_cache_dir(key[0]), name)
+
+    @staticmethod
+    def is_on_disk(path):
+        """
+        Check whether scaled images of a source were stored on disk by an earlier launch,
+        so they can be read back without decoding the source.
+        A texture atlas is on disk when scaled images of any of its frames are.
+
+        :param path: file path of the source image or texture atlas.
+        :rtype: bool
+        """
+        if not ImageCache.disk_cache_dir:
+            return False
+
+        for source in TextureAtlas.get_frames(path) or (path,):
+            try:
+                if os.listdir(ImageCache.get_disk_cache_dir(source)):
+                    return True
+            except OSError:
+                continue
+
+        return False
+
+    @staticmethod
+    def read_disk_cache(key):
+        """
+        Rebuild a scaled image from its memory-mapped RGBA blob.
+
+        :param key: Cache key returned by `get_key`.
+        :rtype: pygame.Surface | None
+        :return: the scaled image, or None if the disk cache is off or has no blob for it.
+        """
+        if not ImageCache.disk_cache_dir:
+            return None
+
+        try:
+            with open(ImageCache.get_disk_cache_path(key), "rb") as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as blob:
+                width, height = struct.unpack_from(DISK_CACHE_HEADER, blob)
+                with memoryview(blob) as pixels:
+                    image = pygame.image.frombuffer(pixels[struct.calcsize(DISK_CACHE_HEADER):],
+                                                    (width, height), "RGBA").convert_alpha()
+        except (OSError, ValueError, struct.error):
+            return None
+
+        ImageCache.disk_hits += 1
+        return image
+
+    @staticmethod
+    def write_disk_cache(key, image):
+        """
+        Save a scaled image as a raw RGBA blob, if the disk cache is on.
+
+        :param key: Cache key returned by `get_key`.
+        :param image: The scaled image.
+        :rtype: None
+        """
+        if not ImageCache.disk_cache_dir:
+            return
+
+        path = ImageCache.get_disk_cache_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as file:
+            file.write(struct.pack(DISK_CACHE_HEADER, *image.get_size()))
+            file.write(pygame.image.tobytes(image, "RGBA"))
+
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def get_animation(paths, scale=None):
+        """
+        Load the images like `get_images` and return them together with their mirrored copies.
+        Mirrored frames are built once per (path, scale) and shared by every caller.
+
+        :param paths: list of file paths for the frames.
+        :param scale: Tuple (width_scale, height_scale) for scaling the frames.
+        If None, default scaling is used.
+        :rtype: Animation
+        :return: the animation frame bank.
+        """
+        frames = ImageCache.get_images(paths, scale)
+
+        flipped_frames = []
+        for path, frame in zip(paths, frames):
+            key = ImageCache.get_key(path, scale)
+            if key in ImageCache.flipped_cache:
+                ImageCache.touch("flipped_cache", key)
+                flipped_frame = ImageCache.flipped_cache[key]
+            else:
+                flipped_frame = pygame.transform.flip(frame, True, False)
+                ImageCache.store("flipped_cache", key, flipped_frame)
+
+            flipped_frames.append(flipped_frame)
+
+        return Animation(frames, flipped_frames)
+
+    @staticmethod
+    def get_key(path, scale=None):
+        """
+        Build the cache key of a scaled image for the current screen resolution.
+
+        :param path: file path of the image.
+        :param scale: Tuple (width_scale, height_scale) or None.
+        :rtype: tuple
+        :return: (path, scale, screen width scale, screen height scale).
+        """
+        scale = tuple(scale) if scale else (1, 1)
+        return path, scale, screen_obj.width_scale, screen_obj.height_scale
+
+    @staticmethod
+    def store(cache_name, key, image):
+        """
+        Put an image into one of the cache levels and evict old images if over budget.
+
+        :param cache_name: "cache", "scaled_cache" or "flipped_cache".
+        :param key: The key of the image in that cache level.
+        :param image: The image to store.
+        :rtype: None
+        """
+        getattr(ImageCache, cache_name)[key] = image
+
+        size = image.get_width() * image.get_height() * image.get_bytesize()
+        ImageCache.lru[(cache_name, key)] = size
+        if not ImageCache.is_pinned(ImageCache.get_path(cache_name, key)):
+            ImageCache.evictable[(cache_name, key)] = size
+        ImageCache.resident_bytes += size
+
+        ImageCache.evict()
+
+    @staticmethod
+    def touch(cache_name, key):
+        """
+        Mark an image as the most recently used one.
+
+        :param cache_name: "cache", "scaled_cache" or "flipped_cache".
+        :param key: The key of the image in that cache level.
+        :rtype: None
+        """
+        ImageCache.lru.move_to_end((cache_name, key))
+        if (cache_name, key) in ImageCache.evictable:
+            ImageCache.evictable.move_to_end((cache_name, key))
+
+    @staticmethod
+    def evict():
+        """
+        Drop the least recently used images that are not pinned
+        until the resident size fits into the budget, or only pinned images are left.
+
+        :rtype: None
+        """
+        while ImageCache.resident_bytes > ImageCache.budget and ImageCache.evictable:
+            (cache_name, key), size = ImageCache.evictable.popitem(last=False)
+
+            del getattr(ImageCache, cache_name)[key]
+            del ImageCache.lru[(cache_name, key)]
+            ImageCache.resident_bytes -= size
+            ImageCache.evictions += 1
+
+    @staticmethod
+    def update_evictable():
+        """
+        Rebuild the unpinned entries from the whole cache after the pinned prefixes changed.
+
+        :rtype: None
+        """
+        ImageCache.evictable = OrderedDict(
+            (entry, size) for entry, size in ImageCache.lru.items()
+            if not ImageCache.is_pinned(ImageCache.get_path(*entry)))
+
+    @staticmethod
+    def pin(prefixes):
+        """
+        Protect images whose path starts with one of the prefixes from eviction.
+
+        :param prefixes: Iterable of path prefixes, usually asset directories.
+        :rtype: None
+        """
+        ImageCache.pinned.update(prefixes)
+        ImageCache.update_evictable()
+
+    @staticmethod
+    def unpin(prefixes):
+        """
+        Allow images under the prefixes to be evicted again.
+
+        :param prefixes: Iterable of path prefixes passed to `pin` before.
+        :rtype: None
+        """
+        ImageCache.pinned.difference_update(prefixes)
+        ImageCache.update_evictable()
+        ImageCache.evict()
+
+    @staticmethod
+    def is_pinned(path):
+        """
+        Check whether an image is protected from eviction.
+        A texture atlas is protected while any of the frames packed into it is.
+
+        :param path: file path of the image.
+        :rtype: bool
+        """
+        paths = TextureAtlas.get_frames(path) or (path,)
+        return any(path.startswith(prefix) for path in paths for prefix in ImageCache.pinned)
+
+    @staticmethod
+    def get_path(cache_name, key):
+        """
+        Return the file path of a cached image.
+
+        :param cache_name: "cache", "scaled_cache" or "flipped_cache".
+        :param key: The key of the image in that cache level.
+        :rtype: str
+        """
+        if cache_name == "cache":
+            return key
+        return key[0]
+
+    @staticmethod
+    def get_group(path):
+        """
+        Return the asset group of an image: its first three path components,
+        for example "image/enemys/satyr". A texture atlas belongs to the group of its frames.
+
+        :param path: file path of the image.
+        :rtype: str
+        """
+        frames = TextureAtlas.get_frames(path)
+        if frames:
+            path = frames[0]
+        return "/".join(path.split("/")[:3])
+
+    @staticmethod
+    def get_memory_stats():
+        """
+        Return the resident bytes of every asset group, counting all cache levels.
+
+        :rtype: dict
+        :return: asset group -> resident bytes.
+        """
+        groups = {}
+        for (cache_name, key), size in ImageCache.lru.items():
+            group = ImageCache.get_group(ImageCache.get_path(cache_name, key))
+            groups[group] = groups.get(group, 0) + size
+
+        return groups
+
+    @staticmethod
+    def get_stats():
+        """
+        Return the scaled cache counters and the number of cached surfaces.
+
+        :rtype: dict
+        :return: hits, misses, disk hits, evictions, resident and budget bytes,
+        number of source, scaled and flipped surfaces.
+        """
+        return {
+            "hits": ImageCache.hits,
+            "misses": ImageCache.misses,
+            "disk_hits": ImageCache.disk_hits,
+            "evictions": ImageCache.evictions,
+            "resident_bytes": ImageCache.resident_bytes,
+            "budget": ImageCache.budget,
+            "sources": len(ImageCache.cache),
+            "scaled": len(ImageCache.scaled_cache),
+            "flipped": len(ImageCache.flipped_cache),
+        }
@@ -0,0 +1,257 @@
+"""
+Module: game.src.camera
+
+This module defines the Camera class, which holds the horizontal scroll offset of the level.
+
+Platforms, backgrounds, NPCs, enemies, shockwaves and the player are all kept in world
+coordinates. Scrolling only changes the camera offset, and every object is moved into
+screen coordinates at draw time with `apply`.
+
+Objects outside the visible part of the world (plus `constants.CULLING_MARGIN`) are culled:
+`is_visible` tells the caller to skip them and counts drawn and culled objects per frame.
+
+The game simulates at a fixed rate and may render more often. While rendering, `alpha` is set to
+the fraction of a simulation step that has passed, and the offset is interpolated between the
+position before and after the last step. Moving objects are drawn with `apply_interpolated` and
+`apply_interpolated_point`, which interpolate their own position the same way.
+
+Classes:
+- Camera:
+    Holds the scroll offset and converts between world and screen coordinates.
+
+    Attributes:
+    - x (float): World x-coordinate of the left edge of the screen.
+    - prev_x (float): Value of x before the last simulation step.
+    - alpha (float): Interpolation factor between prev_x (0) and x (1) used for drawing.
+    - margin (float): Distance around the screen within which objects are not culled.
+    - drawn (int): Number of objects found visible since the frame began.
+    - culled (int): Number of objects culled since the frame began.
+
+    Methods:
+    - reset():
+        Move the camera back to the start of the level.
+    - scroll(dx):
+        Move the camera by dx world pixels.
+    - save_position():
+        Remember the position before a simulation step.
+    - get_position():
+        Return the interpolated scroll offset.
+    - get_offset():
+        Return the interpolated scroll offset rounded to whole pixels.
+    - apply(rect):
+        Return a copy of a world rect in screen coordinates.
+    - apply_point(x, y):
+        Return a world point in screen coordinates.
+    - apply_interpolated(prev_rect, rect):
+        Return a world rect that moved during the last step in screen coordinates, interpolated by alpha.
+    - apply_interpolated_point(prev_x, prev_y, x, y):
+        Return a world point that moved during the last step in screen coordinates, interpolated by alpha.
+    - to_world(rect):
+        Return a copy of a screen rect in world coordinates.
+    - get_view_rect():
+        Return the visible part of the world.
+    - begin_frame():
+        Reset the drawn and culled counters.
+    - is_visible(rect):
+        Return whether a world rect is near enough to the screen to be drawn.
+    - get_stats():
+        Return the drawn and culled counters.
+
+Usage:
+from game.src.camera import camera_obj
+
+if camera_obj.is_visible(platform.rect):
+    screen.blit(platform.image, camera_obj.apply(platform.rect))
+"""
+
+from game.src import constants
+from game.src.screen import screen_obj
+import pygame
+
+
+class Camera:
+    """
+    A class holding the horizontal scroll offset of the level.
+
+    Attributes:
+    - x: World x-coordinate of the left edge of the screen.
+    - prev_x: Value of x before the last simulation step.
+    - alpha: Interpolation factor between prev_x (0) and x (1) used for drawing.
+    - margin: Distance around the screen within which objects are not culled.
+    - drawn: Number of objects found visible since the frame began.
+    - culled: Number of objects culled since the frame began.
+
+    Methods:
+    - reset(self): Move the camera back to the start of the level.
+    - scroll(self, dx): Move the camera by dx world pixels.
+    - save_position(self): Remember the position before a simulation step.
+    - get_position(self): Return the interpolated scroll offset.
+    - get_offset(self): Return the interpolated scroll offset rounded to whole pixels.
+    - apply(self, rect): Return a copy of a world rect in screen coordinates.
+    - apply_point(self, x, y): Return a world point in screen coordinates.
+    - apply_interpolated(self, prev_rect, rect): Return a moving world rect in screen coordinates.
+    - apply_interpolated_point(self, prev_x, prev_y, x, y): Return a moving world point in screen coordinates.
+    - to_world(self, rect): Return a copy of a screen rect in world coordinates.
+    - get_view_rect(self): Return the visible part of the world.
+    - begin_frame(self): Reset the drawn and culled counters.
+    - is_visible(self, rect): Return whether a world rect is near enough to the screen to be drawn.
+    - get_stats(self): Return the drawn and culled counters.
+    """
+
+    def __init__(self):
+        """
+        Initialize the Camera at the start of the level.
+
+        :rtype: object
+        """
+        self.x = 0
+        self.prev_x = 0
+        self.alpha = 1
+        self.margin = constants.CULLING_MARGIN * screen_obj.width_scale
+        self.drawn = 0
+        self.culled = 0
+
+    def reset(self):
+        """
+        Move the camera back to the start of the level.
+
+        :rtype: None
+        """
+        self.x = 0
+        self.prev_x = 0
+        self.alpha = 1
+        self.margin = constants.CULLING_MARGIN * screen_obj.width_scale
+        self.begin_frame()
+
+    def scroll(self, dx):
+        """
+        Move the camera by dx world pixels.
+
+        :param dx: The distance to move (positive moves the view to the right).
+        :rtype: None
+        """
+        self.x += dx
+
+    def save_position(self):
+        """
+        Remember the position before a simulation step, for interpolation.
+
+        :rtype: None
+        """
+        self.prev_x = self.x
+
+    def get_position(self):
+        """
+        Return the scroll offset interpolated by alpha between the last two simulation steps.
+
+        :rtype: float
+        """
+        return self.prev_x + (self.x - self.prev_x) * self.alpha
+
+    def get_offset(self):
+        """
+        Return the interpolated scroll offset rounded to whole pixels.
+
+        :rtype: int
+        """
+        return round(self.get_position())
+
+    def apply(self, rect):
+        """
+        Return a copy of a world rect in screen coordinates.
+
+        :param rect: The rect in world coordinates.
+        :rtype: pygame.Rect
+        """
+        return rect.move(-self.get_offset(), 0)
+
+    def apply_point(self, x, y):
+        """
+        Return a world point in screen coordinates.
+
+        :param x: The world x-coordinate.
+        :param y: The world y-coordinate.
+        :rtype: tuple
+        """
+        return x - self.get_offset(), y
+
+    def apply_interpolated(self, prev_rect, rect):
+        """
+        Return a copy of a world rect that moved during the last simulation step in screen coordinates,
+        interpolated by alpha between its position before and after the step.
+
+        :param prev_rect: The rect before the last simulation step, in world coordinates.
+        :param rect: The rect after the last simulation step, in world coordinates.
+        :rtype: pygame.Rect
+        """
+        x, y = self.apply_interpolated_point(prev_rect.x, prev_rect.y, rect.x, rect.y)
+        return rect.move(round(x) - rect.x, round(y) - rect.y)
+
+    def apply_interpolated_point(self, prev_x, prev_y, x, y):
+        """
+        Return a world point that moved during the last simulation step in screen coordinates,
+        interpolated by alpha between its position before and after the step.
+
+        :param prev_x: The world x-coordinate before the last simulation step.
+        :param prev_y: The y-coordinate before the last simulation step.
+        :param x: The world x-coordinate after the last simulation step.
+        :param y: The y-coordinate after the last simulation step.
+        :rtype: tuple
+        """
+        return (prev_x + (x - prev_x) * self.alpha - self.get_offset(),
+                prev_y + (y - prev_y) * self.alpha)
+
+    def to_world(self, rect):
+        """
+        Return a copy of a screen rect in world coordinates.
+
+        :param rect: The rect in screen coordinates.
+        :rtype: pygame.Rect
+        """
+        return rect.move(self.get_offset(), 0)
+
+    def get_view_rect(self):
+        """
+        Return the visible part of the world.
+
+        :rtype: pygame.Rect
+        """
+        return pygame.Rect(self.get_offset(), 0, screen_obj.width, screen_obj.height)
+
+    def begin_frame(self):
+        """
+        Reset the drawn and culled counters.
+
+        :rtype: None
+        """
+        self.drawn = 0
+        self.culled = 0
+
+    def is_visible(self, rect):
+        """
+        Return whether a world rect is near enough to the screen to be drawn, and count it
+        as drawn or culled.
+
+        :param rect: The rect in world coordinates.
+        :rtype: bool
+        """
+        left = self.get_offset() - self.margin
+        visible = rect.right > left and rect.left < left + screen_obj.width + 2 * self.margin
+
+        if visible:
+            self.drawn += 1
+        else:
+            self.culled += 1
+
+        return visible
+
+    def get_stats(self):
+        """
+        Return the drawn and culled counters of the current frame.
+
+        :rtype: dict
+        """
+        return {"drawn": self.drawn, "culled": self.culled}
+
+
+camera_obj = Camera()
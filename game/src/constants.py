@@ -7,11 +7,12 @@ enemy attributes, game physics, attack parameters, and cooldown times.
 
 Constants:
 - VELOCITY (int): Default velocity for movement.
-- BACKGROUND_SPEED (int): Speed of the background scrolling.
-- PARTIAL_BACKGROUND_SPEED (int): Speed of partial background scrolling.
+- BACKGROUND_SPEED (int): Speed of the background scrolling, per VELOCITY of camera movement.
 
-- MAX_FPS (int): Maximum frames per second for the game loop.
-- DELAY (int): Delay time in milliseconds between game loops.
+- MAX_FPS (int): Maximum frames per second rendered by the game loop and the menus.
+- SIMULATION_FPS (int): Number of fixed simulation steps per second of the game.
+- MAX_SIMULATION_STEPS (int): Maximum number of simulation steps run before one frame is rendered.
+- INTERPOLATION (bool): Whether frames are drawn between the last two simulation steps.
 - GRAVITY (float): Gravity constant affecting player and enemy falls.
 
 - PLAYER_ATTACK_DIRECTION (int): Default direction of player's attack.
@@ -35,17 +36,48 @@ Constants:
 
 - BOSS_HP (int): Hit points (HP) of the boss enemy.
 
+- ATLAS_DIR (str): Directory with the packed texture atlases and their frame tables.
+- ATLAS_MAX_WIDTH (int): Maximum width of a packed texture atlas.
+- ATLAS_PADDING (int): Empty pixels between frames in a texture atlas.
+- PRELOADER_WORKERS (int): Number of threads decoding images in the background.
+- IMAGE_DISK_CACHE (bool): Whether scaled images are cached on disk between launches.
+- IMAGE_DISK_CACHE_DIR (str): Root directory of the on-disk image cache.
+- IMAGE_DISK_CACHE_VERSION (int): Version of the on-disk cache format; bump it to drop old blobs.
+- IMAGE_CACHE_BUDGET (int): Memory budget of ImageCache in bytes.
+- CULLING_MARGIN (int): Distance in pixels around the screen within which objects are still drawn and updated.
+- PLATFORM_GRID_CELL (int): Side in world pixels of a cell of the grid indexing static platforms.
+- PROFILER_HISTORY (int): Number of frames whose timings the frame profiler keeps.
+- PROFILER_OVERLAY_FRAMES (int): Number of frames averaged by the profiler overlay.
+- PROFILER_CSV_PATH (str): File the profiler log is exported to.
+- MAX_PROJECTILES (int): Maximum number of live shockwaves of one shooter; further shots are skipped.
+- TEXT_CACHE_SIZE (int): Maximum number of rendered strings kept by the text cache.
+- MENU_WAIT_TIMEOUT (int): Milliseconds an idle menu sleeps waiting for an event before it wakes up.
+- LEVEL_FILE (str): Level file, in design units, that the game loads.
+- LEVEL_CACHE_DIR (str): Root directory of the compiled levels cached per resolution.
+- LEVEL_CACHE_VERSION (int): Version of the compiled level format; bump it to drop old compiled levels.
+- LEVEL_CHUNK_WIDTH (int): Width in design units of the chunks a level is streamed in.
+- STREAM_LOAD_AHEAD (int): Distance in design units ahead of the screen within which chunks are loaded.
+- STREAM_UNLOAD_BEHIND (int): Distance in design units behind the screen within which chunks are kept.
+- STREAM_BUILD_BUDGET (int): Maximum number of objects of chunks off the screen built per simulation step.
+- ARENA_PREFETCH_DISTANCE (int): Distance in design units before the arena trigger from which the boss
+  images are scaled and the arena is built, with the build budget left over by the chunks.
+- HEADLESS (bool): Whether the game runs without a window or a sound card, on the SDL dummy drivers.
+  Enabled by setting the CS3_HEADLESS environment variable to 1.
+
 Usage:
 Import this module to access constants that are used across different parts of the game,
 such as controlling gameplay mechanics, character attributes, and game physics parameters.
 """
 
+import os
+
 VELOCITY = -5
 BACKGROUND_SPEED = 1
-PARTIAL_BACKGROUND_SPEED = 5
 
 MAX_FPS = 60
-DELAY = 30
+SIMULATION_FPS = 30
+MAX_SIMULATION_STEPS = 5
+INTERPOLATION = True
 GRAVITY = 0.3
 
 PLAYER_ATTACK_DIRECTION = 1
@@ -68,3 +100,29 @@ ENEMY_JUMP_HEIGHT = 10
 ENEMY_HP = 100
 
 BOSS_HP = 600
+
+ATLAS_DIR = "image/atlases"
+ATLAS_MAX_WIDTH = 2048
+ATLAS_PADDING = 1
+PRELOADER_WORKERS = 4
+IMAGE_DISK_CACHE = True
+IMAGE_DISK_CACHE_DIR = ".cache/images"
+IMAGE_DISK_CACHE_VERSION = 2
+IMAGE_CACHE_BUDGET = 256 * 1024 * 1024
+CULLING_MARGIN = 100
+PLATFORM_GRID_CELL = 256
+PROFILER_HISTORY = 600
+PROFILER_OVERLAY_FRAMES = 30
+PROFILER_CSV_PATH = "profiler.csv"
+MAX_PROJECTILES = 32
+TEXT_CACHE_SIZE = 256
+MENU_WAIT_TIMEOUT = 250
+LEVEL_FILE = "levels/level1.json"
+LEVEL_CACHE_DIR = ".cache/levels"
+LEVEL_CACHE_VERSION = 1
+LEVEL_CHUNK_WIDTH = 960
+STREAM_LOAD_AHEAD = 960
+STREAM_UNLOAD_BEHIND = 960
+STREAM_BUILD_BUDGET = 4
+ARENA_PREFETCH_DISTANCE = 1920
+HEADLESS = os.environ.get("CS3_HEADLESS") == "1"
@@ -10,7 +10,7 @@ Attributes:
 - ImageCache (class): Caches and manages images for efficient loading.
 - pygame (module): Library for game development in Python.
 - screen_obj (module): Screen configuration and scaling information.
-- Shockwave (class): Represents projectiles or special attacks.
+- ShockwavePool (class): Recycles the projectiles or special attacks.
 
 StalkingEnemy Class:
 Represents an enemy that moves towards the player.
@@ -47,7 +47,7 @@ Attributes:
 - hit_animation_count (int): Current frame index for hit animation.
 - attack_animation_count (int): Current frame index for attack animation.
 - attacking (None or object): Object representing the current attack state.
-- fireballs (pygame.sprite.Group): Group of Shockwave objects representing fireball attacks.
+- fireballs (ShockwavePool): Group of Shockwave objects representing fireball attacks.
 
 Methods:
 - __init__(self, x, y, image_paths_idle=None, image_paths_run=None, image_paths_attack=None,
@@ -57,8 +57,6 @@ Methods:
     Reduces the boss's current hit points by a specified amount and sets hit animation.
 - fireball_attack(self):
     Initiates a fireball attack if the boss is not stopped.
-- move_sprites(self, direction):
-    Moves all fireballs in the specified direction.
 - update_animation(self):
     Updates the boss's animation frames based on the delay.
 - attack(self, screen):
@@ -66,20 +64,20 @@ Methods:
 - idle(self, screen):
     Draws the boss's idle animation on the screen.
 - draw(self, screen):
-    Draws the boss on the screen based on its current state.
+    Draws the boss, its fireballs and its health bar based on its current state.
 - draw_boss_hp_bar(self, screen):
     Draws the boss's health bar on the screen.
 - draw_hit(self, screen):
-    Draws the boss's hit animation on the screen and updates the animation frame.
-- update(self, screen, group, game=None):
-    Updates the boss's state, movement, and animations.
+    Draws the boss's hit animation on the screen.
+- update(self, group, game=None):
+    Updates the boss's state, movement, and animations for one simulation step.
 """
 
 from game.src import constants
 from game.src.cache import ImageCache
 from game.src.enemies.enemies_base import Enemy
 from game.src.screen import screen_obj
-from game.src.shokwave import Shockwave
+from game.src.shokwave import ShockwavePool
 import pygame
 
 
@@ -161,7 +159,8 @@ class Boss(StalkingEnemy):
         hit_animation_count (int): Current frame index for hit animation.
         attack_animation_count (int): Current frame index for attack animation.
         attacking (None or object): Object representing the current attack state.
-        fireballs (pygame.sprite.Group): Group of Shockwave objects representing fireball attacks.
+        fireballs (ShockwavePool): Group of Shockwave objects representing fireball attacks.
+        can_cull (bool): Always False, the boss stalks the player and casts fireballs from off the screen too.
 
     Methods:
         __init__(self, x, y, image_paths_idle=None, image_paths_run=None, image_paths_attack=None,
@@ -175,9 +174,6 @@ class Boss(StalkingEnemy):
         fireball_attack(self):
             Initiates a fireball attack if the boss is not stopped.
 
-        move_sprites(self, direction):
-            Moves all fireballs in the specified direction.
-
         update_animation(self):
             Updates the boss's animation frames based on the delay.
 
@@ -188,24 +184,34 @@ class Boss(StalkingEnemy):
             Draws the boss's idle animation on the screen.
 
         draw(self, screen):
-            Draws the boss on the screen based on its current state.
+            Draws the boss, its fireballs and its health bar based on its current state.
 
         draw_boss_hp_bar(self, screen):
             Draws the boss's health bar on the screen.
 
         draw_hit(self, screen):
-            Draws the boss's hit animation on the screen and updates the animation frame.
+            Draws the boss's hit animation on the screen.
 
-        update(self, screen, group, game=None):
-            Updates the boss's state, movement, and animations.
+        update(self, group, game=None):
+            Updates the boss's state, movement, and animations for one simulation step.
 
     """
 
+    can_cull = False
+    animation_paths = {
+        "images": ([f"image/enemys/boss/move/Move_{i}.png" for i in range(1, 9)], (1.8, 1.8), True),
+        "images_idle": ([f"image/enemys/boss/idle/Idle_{i}.png" for i in range(1, 9)], (1.8, 1.8), True),
+        "images_attack": ([f"image/enemys/boss/attack/Attack_{i}.png" for i in range(1, 9)], (1.8, 1.8), True),
+        "death_images": ([f"image/enemys/boss/death/Death_{i}.png" for i in range(1, 6)], (1.8, 1.8), False),
+        "images_hit": ([f"image/enemys/boss/hit/Take Hit_{i}.png" for i in range(1, 5)], (1.8, 1.8), True),
+    }
+
     def __init__(self, x, y, image_paths_idle=None, image_paths_run=None, image_paths_attack=None,
                  image_paths_death=None, image_paths_hit=None):
         """
         Initializes the Boss with initial coordinates (x, y) and
         optional image paths for animations.
+        Without custom paths, the animations are shared by all Bosses, see Enemy.get_animation_set.
 
         Args:
             x (int): Initial x-coordinate of the Boss.
@@ -216,28 +222,24 @@ class Boss(StalkingEnemy):
             image_paths_death (list, optional): List of paths to death animation frames.
             image_paths_hit (list, optional): List of paths to hit animation frames.
         """
-        if not image_paths_idle:
-            image_paths_idle = [f"image/enemys/boss/idle/Idle_{i}.png" for i in range(1, 9)]
-
-        if not image_paths_run:
-            image_paths_run = [f"image/enemys/boss/move/Move_{i}.png" for i in range(1, 9)]
-
-        if not image_paths_attack:
-            image_paths_attack = [f"image/enemys/boss/attack/Attack_{i}.png" for i in range(1, 9)]
-
-        if not image_paths_death:
-            image_paths_death = [f"image/enemys/boss/death/Death_{i}.png" for i in range(1, 6)]
-
-        if not image_paths_hit:
-            image_paths_hit = [f"image/enemys/boss/hit/Take Hit_{i}.png" for i in range(1, 5)]
+        super().__init__(x, y)
 
-        self.images = ImageCache.get_images(image_paths_run, (1.8, 1.8))
-        self.images_idle = ImageCache.get_images(image_paths_idle, (1.8, 1.8))
-        self.images_attack = ImageCache.get_images(image_paths_attack, (1.8, 1.8))
-        self.death_images = ImageCache.get_images(image_paths_death, (1.8, 1.8))
+        custom_paths = {
+            "images": image_paths_run,
+            "images_idle": image_paths_idle,
+            "images_attack": image_paths_attack,
+            "death_images": image_paths_death,
+            "images_hit": image_paths_hit,
+        }
+        for name, paths in custom_paths.items():
+            if paths:
+                _, scale, mirrored = self.animation_paths[name]
+                frames = ImageCache.get_animation(paths, scale) if mirrored else ImageCache.get_images(paths, scale)
+                setattr(self, name, frames)
+
+        if image_paths_run:
+            self.rect.size = self.images[0].get_size()
 
-        super().__init__(x, y)
-        self.images_hit = ImageCache.get_images(image_paths_hit, (1.8, 1.8))
         self.current_hp = constants.BOSS_HP
         self.max_hp = self.current_hp
 
@@ -256,7 +258,7 @@ class Boss(StalkingEnemy):
 
         self.attacking = None
 
-        self.fireballs = pygame.sprite.Group()
+        self.fireballs = ShockwavePool()
 
     def take_damage(self, damage=constants.PLAYER_ATTACK_DAMAGE):
         """
@@ -279,18 +281,7 @@ class Boss(StalkingEnemy):
             return
 
         if self.current_stop_timer % (self.stop_timer - 10) == 0:
-            fireball = Shockwave(self.rect.centerx, self.rect.centery, 5, 0, self.attack_direction, 'fireball')
-            self.fireballs.add(fireball)
-
-    def move_sprites(self, direction):
-        """
-        Moves all fireballs in the specified direction.
-
-        Args:
-            direction (int): Direction of movement (-1 for left, 1 for right).
-        """
-        for fireball in self.fireballs:
-            fireball.move_sprite(direction)
+            self.fireballs.spawn(self.rect.centerx, self.rect.centery, 5, 0, self.attack_direction, 'fireball')
 
     def update_animation(self):
         """
@@ -318,11 +309,8 @@ class Boss(StalkingEnemy):
         Args:
             screen (pygame.Surface): The surface to draw on.
         """
-        if self.attack_direction == -1:
-            screen.blit(pygame.transform.flip(self.images_attack[self.attack_animation_count], True, False),
-                        (self.rect.x, self.rect.y))
-        elif self.attack_direction == 1:
-            screen.blit(self.images_attack[self.attack_animation_count], (self.rect.x, self.rect.y))
+        screen.blit(self.images_attack.get(self.attack_animation_count, self.attack_direction),
+                    self.get_screen_rect())
 
     def idle(self, screen):
         """
@@ -331,33 +319,30 @@ class Boss(StalkingEnemy):
         Args:
             screen (pygame.Surface): The surface to draw on.
         """
-        if self.attack_direction == -1:
-            screen.blit(pygame.transform.flip(self.images_idle[self.idle_animation_count], True, False),
-                        (self.rect.x, self.rect.y))
-        elif self.attack_direction == 1:
-            screen.blit(self.images_idle[self.idle_animation_count], (self.rect.x, self.rect.y))
+        screen.blit(self.images_idle.get(self.idle_animation_count, self.attack_direction),
+                    self.get_screen_rect())
 
     def draw(self, screen):
         """
-        Draws the boss on the screen based on its current state.
+        Draws the boss, its fireballs and its health bar based on its current state.
 
         Args:
             screen (pygame.Surface): The surface to draw on.
         """
-        if self.is_hit:
-            self.draw_hit(screen)
-            return
-
-        if not self.is_stop:
+        if self.is_dead or (not self.is_hit and not self.is_stop):
             super().draw(screen)
-            return
-
-        if self.distance > 250:
+        elif self.is_hit:
+            self.draw_hit(screen)
+        elif self.distance > 250:
             self.idle(screen)
         else:
             self.attack(screen)
 
-        self.update_animation()
+        for fireball in self.fireballs:
+            fireball.draw(screen)
+
+        if self.current_hp > 0:
+            self.draw_boss_hp_bar(screen)
 
     def draw_boss_hp_bar(self, screen):
         """
@@ -377,44 +362,36 @@ class Boss(StalkingEnemy):
 
     def draw_hit(self, screen):
         """
-        Draws the boss's hit animation on the screen and updates the animation frame.
+        Draws the boss's hit animation on the screen.
 
         Args:
             screen (pygame.Surface): The surface to draw on.
         """
-        if self.attack_direction == -1:
-            screen.blit(pygame.transform.flip(self.images_hit[self.hit_animation_count], True, False),
-                        (self.rect.x, self.rect.y))
-        elif self.attack_direction == 1:
-            screen.blit(self.images_hit[self.hit_animation_count], (self.rect.x, self.rect.y))
+        screen.blit(self.images_hit.get(self.hit_animation_count, self.attack_direction),
+                    self.get_screen_rect())
 
-        self.update_animation()
-
-    def update(self, screen, group, game=None):
+    def update(self, group, game=None):
         """
-        Updates the boss's state, movement, and animations.
+        Updates the boss's state, movement, and animations for one simulation step.
 
         Args:
-            screen (pygame.Surface): The surface to draw on.
             group (pygame.sprite.Group): The group containing all enemies.
             game (object, optional): The game object containing additional state (default is None).
         """
-        super().update(screen, group)
+        super().update(group)
 
         if not self.is_stop and not self.is_hit:
             self.stalk_update(game.player)
 
         self.fireball_attack()
-        self.fireballs.update(screen, self.fireballs, game)
+        self.fireballs.update(self.fireballs, game)
 
         self.current_stop_timer += 1
         if self.current_stop_timer == self.stop_timer:
             self.current_stop_timer = 0
             self.is_stop = not self.is_stop
 
-        if self.current_hp > 0:
-            self.draw_boss_hp_bar(screen)
-        else:
+        if self.current_hp <= 0:
             if self.is_create_gates:
                 for gate in game.gates:
                     game.platforms.remove(gate)
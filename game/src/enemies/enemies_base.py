@@ -8,13 +8,12 @@ Classes:
 Attributes (Enemy class):
 - images (list): List of pygame.Surface objects for animation frames.
 - death_images (list): List of pygame.Surface objects for death animation frames.
-- rect (pygame.Rect): Rectangle defining position and size on screen.
+- rect (pygame.Rect): Rectangle defining position (in world coordinates) and size.
+- prev_rect (pygame.Rect): Rectangle before the last simulation step, used for interpolation.
 - speed (int): Movement speed of the enemy.
 - animation_count (int): Current frame index for regular animation.
 - death_animation_count (int): Current frame index for death animation.
 - is_dead (bool): Flag indicating if the enemy is dead.
-- velocity (int): Velocity of movement.
-- velocity_direction (str): Direction of movement ('right' or 'left').
 - current_hp (int): Current hit points.
 - const_delay_death_animation (int): Constant delay between death animation frames.
 - delay_death_animation (int): Current delay count for death animation frames.
@@ -23,26 +22,33 @@ Attributes (Enemy class):
 - damage (int): Damage dealt by the enemy.
 - attack_direction (int): Direction the enemy is facing or moving (-1 for left, 1 for right).
 - damage_texts (list): List of tuples (damage, duration) for displaying damage.
-- font (pygame.font.Font): Font object for rendering damage numbers.
+- can_cull (bool): Whether the enemy is skipped while it is off the screen.
+- animation_paths (dict): Attribute name -> (frame paths, scale, mirrored) of the class's animations.
+- animation_sets (dict): (class, screen width scale, screen height scale) -> animation set,
+  shared by all instances of the class until the game ends.
 
 Methods (Enemy class):
+- get_animation_set(cls): Return the animations of the class for the current resolution.
+- clear_animation_sets(): Drop the shared animations, so evicting their images frees them.
 - __init__(self, x, y): Initialize with coordinates (x, y).
 - update_animation(self): Update animation frame.
-- draw(self, screen): Draw enemy on the screen.
+- get_screen_rect(self): Return the rect on the screen, interpolated between the last two steps.
+- draw(self, screen): Draw enemy (or its death animation) on the screen.
 - take_damage(self, damage): Reduce hit points by specified damage.
-- death(self, group, screen): Handle death animation and removal from group.
-- change_direction(self, direction): Change movement direction.
-- update(self, screen, group, game=None): Update state and draw on screen.
-- move_group(direction, groups): Change movement direction of all enemies in groups.
+- death(self, group): Handle death animation and removal from group.
+- update(self, group, game=None): Update state for one simulation step.
 
 Methods (CommonEnemy class, inherits Enemy):
 - __init__(self, x, y, range_place): Initialize with specific attributes.
 - move(self): Move horizontally within defined range.
-- update(self, screen, group, game=None): Update state and draw on screen.
+- update(self, group, game=None): Update state for one simulation step.
 """
 
 from game.src import constants
+from game.src.cache import ImageCache
+from game.src.camera import camera_obj
 from game.src.screen import screen_obj
+from game.src.text import text_cache_obj
 import pygame
 
 
@@ -56,13 +62,13 @@ class Enemy(pygame.sprite.Sprite):
             death_images (list):
                 A list of pygame.Surface objects representing death animation frames for the enemy.
             rect (pygame.Rect):
-                The rectangle representing the position and size of the enemy on the screen.
+                The rectangle representing the position (in world coordinates) and size of the enemy.
+            prev_rect (pygame.Rect):
+                The rectangle before the last simulation step, used for interpolation.
             speed (int): The speed of movement of the enemy.
             animation_count (int): Current frame index for animation.
             death_animation_count (int): Current frame index for death animation.
             is_dead (bool): Flag indicating if the enemy is dead.
-            velocity (int): The velocity of movement of the enemy.
-            velocity_direction (str): The direction of movement ('right' or 'left').
             current_hp (int): Current hit points of the enemy.
             const_delay_death_animation (int): Constant delay between death animation frames.
             delay_death_animation (int): Current delay count for death animation frames.
@@ -75,56 +81,113 @@ class Enemy(pygame.sprite.Sprite):
                 Direction the enemy is facing or moving towards (-1 for left, 1 for right).
             damage_texts (list):
                 List of tuples containing damage values and their display durations.
-            font (pygame.font.Font): Font object for rendering damage numbers.
+            can_cull (bool):
+                Whether the enemy is neither updated nor drawn while it is off the screen.
+            animation_paths (dict):
+                Attribute name -> (list of frame paths, scale, mirrored) of the animations of the class.
+                Mirrored animations are loaded as an Animation, the others as a list of frames.
+            animation_sets (dict):
+                (class, screen width scale, screen height scale) -> dict of attribute name -> frames.
+                Shared by all enemy classes, and only holds the sets of the current resolution
+                until the game ends.
 
         Methods:
+            get_animation_set(cls):
+                Returns the animations of the class for the current resolution, loading them once.
+
+            clear_animation_sets():
+                Drops the shared animations of every enemy class.
+
             __init__(self, x, y):
                 Initializes the Enemy with initial coordinates (x, y).
 
             update_animation(self):
                 Updates the animation frame of the Enemy.
 
+            get_screen_rect(self):
+                Returns the rect of the Enemy on the screen, interpolated between the last two steps.
+
             draw(self, screen):
-                Draws the Enemy on the screen.
+                Draws the Enemy, or its death animation, on the screen.
 
             take_damage(self, damage=constants.PLAYER_ATTACK_DAMAGE):
                 Reduces the current hit points of the Enemy by a specified amount.
 
-            death(self, group, screen):
+            death(self, group):
                 Handles the death animation and removal of the Enemy from the group upon death.
 
-            change_direction(self, direction):
-                Changes the movement direction of the Enemy.
-
-            update(self, screen, group, game=None):
-                Updates the state of the Enemy and draws it on the screen.
-
-            move_group(direction, groups):
-                Changes the movement direction of all enemies in the specified groups.
+            update(self, group, game=None):
+                Updates the state of the Enemy for one simulation step.
 
         """
 
     images = None
     death_images = []
+    can_cull = True
+    animation_paths = {}
+    animation_sets = {}
+
+    @classmethod
+    def get_animation_set(cls):
+        """
+        Return the animations of the class for the current resolution.
+
+        The frames are resolved through ImageCache the first time an instance of the class is created
+        at a resolution, and every later instance references the same Animation objects and lists,
+        so creating an enemy does not load, scale or look up any image.
+
+        Returns:
+            dict: Attribute name -> Animation or list of frames.
+        """
+        key = (cls, screen_obj.width_scale, screen_obj.height_scale)
+        animation_set = Enemy.animation_sets.get(key)
+
+        if animation_set is None:
+            # Drop the sets of a previous resolution, so their frames can be freed.
+            Enemy.animation_sets = {other: frames for other, frames in Enemy.animation_sets.items()
+                                    if other[1:] == key[1:]}
+
+            animation_set = {}
+            for name, (paths, scale, mirrored) in cls.animation_paths.items():
+                if mirrored:
+                    animation_set[name] = ImageCache.get_animation(paths, scale)
+                else:
+                    animation_set[name] = ImageCache.get_images(paths, scale)
+
+            Enemy.animation_sets[key] = animation_set
+
+        return animation_set
+
+    @staticmethod
+    def clear_animation_sets():
+        """
+        Drop the shared animations of every enemy class.
+
+        The sets reference the frames cached by ImageCache, so while they are kept, evicting those frames
+        from the cache frees nothing. They are dropped when a game ends, before its assets are unpinned.
+        """
+        Enemy.animation_sets = {}
 
     def __init__(self, x, y):
         """
         Initialize the Enemy with specific attributes.
 
         Args:
-            x (int): Initial x-coordinate of the Enemy.
+            x (int): Initial world x-coordinate of the Enemy.
             y (int): Initial y-coordinate of the Enemy.
         """
         super().__init__()
+        for name, frames in self.get_animation_set().items():
+            setattr(self, name, frames)
+
         self.rect = self.images[0].get_rect()
         self.rect.x = x
         self.rect.y = y
+        self.prev_rect = self.rect.copy()
         self.speed = constants.ENEMY_NORMAL_SPEED * screen_obj.width_scale
         self.animation_count = 0
         self.death_animation_count = 0
         self.is_dead = False
-        self.velocity = constants.VELOCITY * screen_obj.width_scale
-        self.velocity_direction = "right"
         self.current_hp = constants.ENEMY_HP
         self.const_delay_death_animation = 0
         self.delay_death_animation = 0
@@ -134,7 +197,6 @@ class Enemy(pygame.sprite.Sprite):
         self.attack_direction = 1
 
         self.damage_texts = []
-        self.font = pygame.font.Font(None, 30)
 
     def update_animation(self):
         """
@@ -149,24 +211,35 @@ class Enemy(pygame.sprite.Sprite):
         if self.animation_count >= len(self.images):
             self.animation_count = 0
 
+    def get_screen_rect(self):
+        """
+        Return the rect of the Enemy on the screen, interpolated between the last two simulation steps
+        the same way as the camera and the player.
+
+        Returns:
+            pygame.Rect: The rect in screen coordinates.
+        """
+        return camera_obj.apply_interpolated(self.prev_rect, self.rect)
+
     def draw(self, screen):
         """
-        Draw the Enemy on the screen.
+        Draw the Enemy on the screen, or its death animation once it is dead.
 
         Args:
             screen (pygame.Surface): The surface to draw the Enemy on.
         """
-        if self.attack_direction == -1:
-            screen.blit(pygame.transform.flip(self.images[self.animation_count], True, False),
-                        (self.rect.x, self.rect.y))
-        elif self.attack_direction == 1:
-            screen.blit(self.images[self.animation_count], (self.rect.x, self.rect.y))
+        position = self.get_screen_rect()
 
-        for dmg, time in self.damage_texts:
-            damage_surface = self.font.render(str(dmg), True, (139, 0, 0))
-            screen.blit(damage_surface, (self.rect.x, self.rect.y - 30 - 10))
+        if self.is_dead:
+            if self.death_animation_count < len(self.death_images):
+                screen.blit(self.death_images[self.death_animation_count], position)
+            return
+
+        screen.blit(self.images.get(self.animation_count, self.attack_direction), position)
 
-        self.update_animation()
+        for dmg, time in self.damage_texts:
+            damage_surface = text_cache_obj.render(str(dmg), 30, (139, 0, 0))
+            screen.blit(damage_surface, (position.x, position.y - 30 - 10))
 
     def take_damage(self, damage=constants.PLAYER_ATTACK_DAMAGE):
         """
@@ -178,20 +251,18 @@ class Enemy(pygame.sprite.Sprite):
         self.current_hp -= damage
         self.damage_texts.append((damage, 30))
 
-    def death(self, group, screen):
+    def death(self, group):
         """
         Handle the death animation and removal of the Enemy from the group.
 
         Args:
             group (pygame.sprite.Group): The group from which the Enemy will be removed upon death.
-            screen (pygame.Surface): The surface to draw the death animation on.
         """
         if self.current_hp > 0:
             return
 
         self.is_dead = True
         if len(self.death_images):
-            screen.blit(self.death_images[self.death_animation_count], (self.rect.x, self.rect.y))
             if self.delay_death_animation == self.const_delay_death_animation:
                 self.delay_death_animation = 0
                 self.death_animation_count += 1
@@ -202,50 +273,21 @@ class Enemy(pygame.sprite.Sprite):
             self.death_animation_count = 0
             group.remove(self)
 
-    def change_direction(self, direction):
-        """
-        Change the movement direction of the Enemy.
-
-        Args:
-            direction (str):
-                Direction to which the Enemy will change its movement ('left' or 'right').
-        """
-        if direction != self.velocity_direction:
-            self.velocity *= -1
-            self.velocity_direction = direction
-
-    def update(self, screen, group, game=None):
+    def update(self, group, game=None):
         """
-        Update the Enemy's state and draw it on the screen.
+        Update the Enemy's state for one simulation step.
 
         Args:
-            screen (pygame.Surface): The surface to draw the Enemy on.
             group (pygame.sprite.Group): The group containing all enemies.
             game (Game): The instance of the Game class.
         """
+        self.prev_rect.topleft = self.rect.topleft
         self.damage_texts = [(dmg, time - 1) for dmg, time in self.damage_texts if time > 0]
 
         if not self.is_dead:
-            self.draw(screen)
-
-        self.death(group, screen)
-
-    @staticmethod
-    def move_group(direction, groups):
-        """
-
-        :rtype: None
-        :param direction:
-        :param groups:
-        """
-        for group in groups:
-            for enemy in group:
-                enemy.change_direction(direction)
-                enemy.rect.x += enemy.velocity
+            self.update_animation()
 
-                if isinstance(enemy, CommonEnemy):
-                    enemy.left += enemy.velocity
-                    enemy.right += enemy.velocity
+        self.death(group)
 
 
 class CommonEnemy(Enemy):
@@ -253,8 +295,8 @@ class CommonEnemy(Enemy):
     Class representing a common type of Enemy in the game.
 
     Attributes:
-        left (int): Left boundary of movement range for the CommonEnemy.
-        right (int): Right boundary of movement range for the CommonEnemy.
+        left (int): Left world boundary of movement range for the CommonEnemy.
+        right (int): Right world boundary of movement range for the CommonEnemy.
 
     Methods:
         __init__(self, x, y, range_place=200 * screen_obj.width_scale):
@@ -263,8 +305,8 @@ class CommonEnemy(Enemy):
         move(self):
             Moves the CommonEnemy horizontally within its defined range.
 
-        update(self, screen, group, game=None):
-            Updates the state of the CommonEnemy and draws it on the screen.
+        update(self, group, game=None):
+            Updates the state of the CommonEnemy for one simulation step.
     """
 
     def __init__(self, x, y, range_place=200 * screen_obj.width_scale):
@@ -272,7 +314,7 @@ class CommonEnemy(Enemy):
         Initializes a CommonEnemy with specific attributes and animations.
 
         Args:
-            x (int): The x-coordinate of the CommonEnemy's initial position.
+            x (int): The world x-coordinate of the CommonEnemy's initial position.
             y (int): The y-coordinate of the CommonEnemy's initial position.
             range_place (int): The range in which the CommonEnemy can move horizontally.
         """
@@ -296,15 +338,14 @@ class CommonEnemy(Enemy):
 
         self.rect.x += self.speed
 
-    def update(self, screen, group, game=None):
+    def update(self, group, game=None):
         """
-        Update the state of the CommonEnemy and draw it on the screen.
+        Update the state of the CommonEnemy for one simulation step.
 
         Args:
-            screen (pygame.Surface): The surface to draw the CommonEnemy on.
             group (pygame.sprite.Group): The group containing all enemies.
             game (Game): The instance of the Game class.
         """
-        super().update(screen, group)
+        super().update(group)
 
         self.move()
@@ -34,7 +34,6 @@ and game mechanics should be made as per specific game requirements.
 
 """
 from game.src import constants
-from game.src.cache import ImageCache
 from game.src.enemies.enemies_base import CommonEnemy
 from game.src.screen import screen_obj
 
@@ -62,45 +61,26 @@ class Sculwolf(CommonEnemy):
             Moves the Sculwolf and handles jump movement if applicable.
     """
 
+    animation_paths = {
+        "images": ([f"image/enemys/sculwolf/move/Massacre Sprite Sheet_{i}.png" for i in range(1, 12)],
+                   None, True),
+        "death_images": ([f"image/enemys/sculwolf/deth/Massacre death_{i}.png" for i in range(1, 9)],
+                         None, False),
+    }
+
     def __init__(self, x, y, range_place=100 * screen_obj.width_scale):
         """
-        Initialize the Sculwolf with specific attributes and animations.
+        Initialize the Sculwolf with specific attributes.
+        The animations are shared by all Sculwolves, see Enemy.get_animation_set.
 
         Args:
             x (int): The x-coordinate of the Sculwolf's initial position.
             y (int): The y-coordinate of the Sculwolf's initial position.
             range_place (int): The range in which the Sculwolf can move horizontally.
         """
-        image_paths = [
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_1.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_2.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_3.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_4.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_5.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_6.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_7.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_8.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_9.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_10.png',
-            'image/enemys/sculwolf/move/Massacre Sprite Sheet_11.png',
-        ]
-
-        death_paths = [
-            'image/enemys/sculwolf/deth/Massacre death_1.png',
-            'image/enemys/sculwolf/deth/Massacre death_2.png',
-            'image/enemys/sculwolf/deth/Massacre death_3.png',
-            'image/enemys/sculwolf/deth/Massacre death_4.png',
-            'image/enemys/sculwolf/deth/Massacre death_5.png',
-            'image/enemys/sculwolf/deth/Massacre death_6.png',
-            'image/enemys/sculwolf/deth/Massacre death_7.png',
-            'image/enemys/sculwolf/deth/Massacre death_8.png',
-        ]
-
-        self.images = ImageCache.get_images(image_paths)
         super().__init__(x, y - 30 * screen_obj.height_scale, range_place)
 
         self.jump_height = constants.ENEMY_JUMP_HEIGHT * screen_obj.height_scale
-        self.death_images = ImageCache.get_images(death_paths)
 
         self.current_hp = 80
         self.const_delay_death_animation = 1
@@ -16,6 +16,8 @@ Methods:
     Initializes the Snail with specific attributes and animations.
 - move(self):
     Moves the snail if it is currently in walking mode.
+- update_animation(self):
+    Advances the walking or sniffing animation and switches between them.
 - draw(self, screen):
     Draws the snail on the screen, handling walking and sniffing animations.
 
@@ -33,10 +35,8 @@ and game mechanics should be made as per specific game requirements.
 - Ensure all necessary image files are correctly linked and available in the specified paths.
 
 """
-from game.src.cache import ImageCache
 from game.src.enemies.enemies_base import CommonEnemy
 from game.src.screen import screen_obj
-import pygame
 
 
 class Snail(CommonEnemy):
@@ -58,42 +58,31 @@ class Snail(CommonEnemy):
         move(self):
             Moves the snail if it is currently in walking mode.
 
+        update_animation(self):
+            Advances the walking or sniffing animation and switches between them.
+
         draw(self, screen):
             Draws the snail on the screen, handling walking and sniffing animations.
     """
 
+    animation_paths = {
+        "images": ([f"image/enemys/ramses_snail/Walk/Spr_Walk_{i}.png" for i in range(1, 9)], (2, 2), True),
+        "sniff": ([f"image/enemys/ramses_snail/Track/Spr_Track_{i}.png" for i in range(1, 5)], (2, 2), True),
+    }
+
     def __init__(self, x, y, range_place=100 * screen_obj.width_scale):
         """
-        Initialize the Snail with specific attributes and animations.
+        Initialize the Snail with specific attributes.
+        The animations are shared by all Snails, see Enemy.get_animation_set.
 
         Args:
             x (int): The x-coordinate of the Snail's initial position.
             y (int): The y-coordinate of the Snail's initial position.
             range_place (int): The range in which the snail can move horizontally.
         """
-        images_paths = [
-            'image/enemys/ramses_snail/Walk/Spr_Walk_1.png',
-            'image/enemys/ramses_snail/Walk/Spr_Walk_2.png',
-            'image/enemys/ramses_snail/Walk/Spr_Walk_3.png',
-            'image/enemys/ramses_snail/Walk/Spr_Walk_4.png',
-            'image/enemys/ramses_snail/Walk/Spr_Walk_5.png',
-            'image/enemys/ramses_snail/Walk/Spr_Walk_6.png',
-            'image/enemys/ramses_snail/Walk/Spr_Walk_7.png',
-            'image/enemys/ramses_snail/Walk/Spr_Walk_8.png',
-        ]
-
-        sniff_paths = [
-            'image/enemys/ramses_snail/Track/Spr_Track_1.png',
-            'image/enemys/ramses_snail/Track/Spr_Track_2.png',
-            'image/enemys/ramses_snail/Track/Spr_Track_3.png',
-            'image/enemys/ramses_snail/Track/Spr_Track_4.png',
-        ]
-
-        self.images = ImageCache.get_images(images_paths, (2, 2))
         super().__init__(x, y - 30 * screen_obj.height_scale, range_place)
         self.current_hp = 60
 
-        self.sniff = ImageCache.get_images(sniff_paths, (2, 2))
         self.is_walk = True
         self.sniff_animation_count = 0
         self.walk_count = 0
@@ -109,29 +98,34 @@ class Snail(CommonEnemy):
         if self.is_walk:
             super().move()
 
-    def draw(self, screen):
+    def update_animation(self):
         """
-        Draw the snail on the screen, handling walking and sniffing animations.
-
-        Args:
-            screen (pygame.Surface): The Pygame screen surface to draw on.
+        Advance the walking or sniffing animation.
+        The snail sniffs after every third walking cycle.
         """
         if self.is_walk:
-            super().draw(screen)
+            super().update_animation()
             if self.animation_count == 0:
                 self.walk_count += 1
             if self.walk_count == 3:
                 self.walk_count = 0
                 self.is_walk = False
         else:
-            if self.speed < 0:
-                screen.blit(
-                    pygame.transform.flip(self.sniff[self.sniff_animation_count % len(self.sniff)], True, False),
-                    (self.rect.x, self.rect.y))
-            else:
-                screen.blit(self.sniff[self.sniff_animation_count % len(self.sniff)], (self.rect.x, self.rect.y))
-
             self.sniff_animation_count += 1
             if self.sniff_animation_count == len(self.sniff) * 4:
                 self.sniff_animation_count = 0
                 self.is_walk = True
+
+    def draw(self, screen):
+        """
+        Draw the snail on the screen, handling walking and sniffing animations.
+
+        Args:
+            screen (pygame.Surface): The Pygame screen surface to draw on.
+        """
+        if self.is_walk or self.is_dead:
+            super().draw(screen)
+        else:
+            direction = -1 if self.speed < 0 else 1
+            screen.blit(self.sniff.get(self.sniff_animation_count % len(self.sniff), direction),
+                        self.get_screen_rect())
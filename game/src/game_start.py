@@ -1,46 +1,85 @@
 """
 This module implements the GameOn
-class for managing the main game loop, handling game events, gameplay mechanics,
+class, the scene of the game itself, for handling game events, gameplay mechanics,
 and user interface interactions using Pygame.
 
 Classes:
-- GameOn:
-    Manages the main game loop, game events, gameplay, and UI elements.
+- GameOn (Scene):
+    Runs the gameplay in the scene stack of game.src.scenes.
 
     Attributes:
-    - clock (pygame.time.Clock): Pygame clock object for controlling FPS.
+    - clock (pygame.time.Clock or None): Clock of the SceneManager running the game.
+    - camera (Camera): Camera holding the scroll offset of the level.
+    - level (CompiledLevel): The level the game is created from, compiled for the screen resolution.
+    - streamer (LevelStreamer): Creates the objects of the level chunk by chunk around the camera.
     - main_location (Locations): Main game location object.
     - partial_backgrounds (list): List of PartialBackground objects for additional backgrounds.
-    - platforms (pygame.sprite.Group): Group of platforms in the game.
+    - platforms (PlatformGroup): Group of platforms in the game, indexed for collision queries.
     - enemies (list): List of enemy groups in the game.
+    - broadphase (Broadphase): Enemies sorted by x, rebuilt every step for hit queries.
     - gates (None or pygame.sprite.Group): Group of gates in the game.
     - player (object): The player object.
+    - asset_dirs (tuple): Image directories in use, pinned in ImageCache while the game runs.
     - npcs (pygame.sprite.Group): Group of NPCs in the game.
     - bosses (None or object): Bosses in the game.
     - gameplay (bool): Flag indicating if the game is in active gameplay.
     - pause (bool): Flag indicating if the game is paused.
-    - running (bool): Flag indicating if the game is running.
-    - is_restart (bool): Flag indicating if the game should restart.
-    - absolute_x (int): Absolute x-coordinate of the game world.
+    - absolute_x (float): Absolute x-coordinate of the game world (the camera offset).
     - is_boss_defeated (bool): Flag indicating if the boss is defeated.
     - is_boss_created (bool): Flag indicating if the boss is created.
-    - lose_label (Label): Label object for displaying 'You Lose!' message.
-    - pause_label (Label): Label object for displaying 'Pause' message.
-    - restart_button (Button): Button object for restarting the game.
-    - continue_button (Button): Button object for continuing the game.
-    - menu_defeat_button (Button): Button object for returning to the main menu after defeat.
+    - pause_scene (PauseScene): Overlay shown when Escape is pressed.
+    - defeat_scene (PauseScene): Overlay shown when the player dies.
+    - shop_scene (ShopScene): Overlay shown while the shop of an NPC is open.
+    - lag (float): Milliseconds of simulation time not yet run.
+    - snapshot (Snapshot): State of the level and the player right after they were created.
 
     Methods:
     - __init__(player):
         Initializes the GameOn object with the specified player object.
-    - handle_events(screen, events):
-        Handles game events such as key presses and button clicks.
+    - take_snapshot():
+        Records the state of the level and the player.
+    - reset():
+        Puts the level and the player back in their recorded state.
+    - handle_event(event, manager):
+        Handles a game event such as a key press.
+    - handle_events(events):
+        Handles the events of a frame run by run_frames.
     - draw_back_and_platforms(screen):
         Draws the background and platforms on the screen.
+    - update_enemies():
+        Updates the enemies by one simulation step.
+    - draw_enemies(screen):
+        Draws the enemies near the screen.
     - change_absolute_x(dx):
-        Changes the absolute x-coordinate by a given amount.
-    - start(screen):
-        Starts the game loop and manages game state transitions.
+        Scrolls the camera by a given amount.
+    - record_counters():
+        Stores the drawn objects and the entity counts of the frame in the profiler.
+    - update():
+        Advances the game by one fixed simulation step.
+    - draw(screen):
+        Draws the current state of the game.
+    - enter(manager) / exit(manager):
+        Starts the music and pins the assets, or stops and unpins them.
+    - advance(manager, dt):
+        Runs the simulation steps due after dt milliseconds.
+    - render(screen):
+        Draws the frame, interpolated between the last two steps.
+    - run_frames(screen, frames, until=None):
+        Runs a fixed number of frames as fast as possible.
+
+The game is simulated in fixed steps of 1 / constants.SIMULATION_FPS seconds, independent of the
+frame rate. Each frame, the elapsed time is added to an accumulator and as many steps are run as
+fit in it; the frame is then drawn once, interpolated between the last two steps.
+
+The objects of the level are created chunk by chunk by a LevelStreamer (see game.src.streaming) as the
+camera moves, and the chunks left far behind are unloaded.
+
+Escape pushes the pause overlay and the death of the player the defeat overlay, whose Restart button
+resets the game in place from the snapshot taken when it was created. E opens the shop of
+a nearby NPC as an overlay: the game keeps running and drawing while it is open, number keys buy its
+items, and it closes when the player walks away.
+
+F3 toggles the profiler overlay (see game.src.profiler) and F4 exports its log to a CSV file.
 
 Dependencies:
 - External dependencies:
@@ -50,47 +89,86 @@ Dependencies:
 import sys
 from game.src import constants
 from game.src import creater
-from game.src.button import Button
-from game.src.labels import Label
-from game.src.platforms import MovingPlatform
+from game.src.broadphase import Broadphase
+from game.src.cache import ImageCache
+from game.src.camera import camera_obj
+from game.src.enemies.enemies_base import Enemy
+from game.src.level import LevelCompiler
+from game.src.platforms import PlatformGroup
+from game.src.preloader import LEVEL_ASSETS, ENEMY_ASSETS
+from game.src.profiler import profiler_obj
+from game.src.scenes import Scene, PauseScene, ShopScene
 from game.src.screen import screen_obj
+from game.src.shokwave import Shockwave
+from game.src.snapshot import Snapshot
+from game.src.streaming import LevelStreamer
 import pygame
 
 
-class GameOn:
+class GameOn(Scene):
     """
-        GameOn class manages the main game loop and handles game events, gameplay, and UI.
+        GameOn class is the scene of the game itself and handles game events, gameplay, and UI.
 
         Attributes:
-            clock (pygame.time.Clock): Pygame clock object for controlling FPS.
+            clock (pygame.time.Clock or None): Clock of the SceneManager running the game, set on enter.
+            camera (Camera): Camera holding the scroll offset of the level.
+            level (CompiledLevel): The level the game is created from, compiled for the screen resolution.
+            streamer (LevelStreamer): Creates the objects of the level chunk by chunk around the camera.
             main_location (Locations): Main game location object.
             partial_backgrounds (list):
                 List of PartialBackground objects for additional backgrounds.
-            platforms (pygame.sprite.Group): Group of platforms in the game.
+            platforms (PlatformGroup): Group of platforms in the game, indexed for collision queries.
             enemies (list): List of enemy groups in the game.
+            broadphase (Broadphase): Enemies sorted by x, rebuilt every step for hit queries.
             gates (None or pygame.sprite.Group): Group of gates in the game.
             player (object): The player object.
+            asset_dirs (tuple): Image directories in use, pinned in ImageCache while the game runs.
             npcs (pygame.sprite.Group): Group of NPCs in the game.
             bosses (None or object): Bosses in the game.
             gameplay (bool): Flag indicating if the game is in active gameplay.
             pause (bool): Flag indicating if the game is paused.
-            running (bool): Flag indicating if the game is running.
-            is_restart (bool): Flag indicating if the game should restart.
-            absolute_x (int): Absolute x-coordinate of the game world.
+            absolute_x (float): Absolute x-coordinate of the game world (the camera offset).
             is_boss_defeated (bool): Flag indicating if the boss is defeated.
             is_boss_created (bool): Flag indicating if the boss is created.
+            pause_scene (PauseScene): Overlay shown when Escape is pressed.
+            defeat_scene (PauseScene): Overlay shown when the player dies.
+            shop_scene (ShopScene): Overlay shown while the shop of an NPC is open.
+            lag (float): Milliseconds of simulation time not yet run.
+            snapshot (Snapshot): State of the level and the player right after they were created.
 
         Methods:
             __init__(player):
                 Initializes the GameOn object.
-            handle_events(screen, events):
-                Handles game events such as key presses and button clicks.
+            take_snapshot():
+                Records the state of the level and the player.
+            reset():
+                Puts the level and the player back in their recorded state.
+            handle_event(event, manager):
+                Handles a game event such as a key press.
+            handle_events(events):
+                Handles the events of a frame run by run_frames.
             draw_back_and_platforms(screen):
                 Draws the background and platforms on the screen.
+            update_enemies():
+                Updates the enemies by one simulation step.
+            draw_enemies(screen):
+                Draws the enemies near the screen.
             change_absolute_x(dx):
-                Changes the absolute x-coordinate by a given amount.
-            start(screen):
-                Starts the game loop and manages game state transitions.
+                Scrolls the camera by a given amount.
+            record_counters():
+                Stores the drawn objects and the entity counts of the frame in the profiler.
+            update():
+                Advances the game by one fixed simulation step.
+            draw(screen):
+                Draws the current state of the game.
+            enter(manager) / exit(manager):
+                Starts the music and pins the assets, or stops and unpins them.
+            advance(manager, dt):
+                Runs the simulation steps due after dt milliseconds.
+            render(screen):
+                Draws the frame, interpolated between the last two steps.
+            run_frames(screen, frames, until=None):
+                Runs a fixed number of frames as fast as possible.
         """
 
     def __init__(self, player):
@@ -100,92 +178,104 @@ class GameOn:
         :param player: The player object.
         :rtype: object
         """
-        self.clock = pygame.time.Clock()
-        self.main_location, self.partial_backgrounds = creater.create_location()
-        self.platforms = creater.create_platforms()
-        self.enemies = creater.create_enemies()
+        self.clock = None
+        self.camera = camera_obj
+        self.camera.reset()
+
+        self.level = LevelCompiler.load()
+        self.main_location = creater.create_location(self.level)
+        self.partial_backgrounds = []
+        self.platforms = PlatformGroup(cell_size=self.level.cell_size)
+        self.npcs = pygame.sprite.Group()
+        self.streamer = LevelStreamer(self, self.level)
+        self.enemies = list(self.streamer.groups.values())
+        self.broadphase = Broadphase()
         self.gates = None
 
-        creater.add_moving_platforms(self.platforms)
-
         self.player = player
-        self.npcs = creater.create_npc()
+        self.asset_dirs = LEVEL_ASSETS + ENEMY_ASSETS + player.asset_dirs
         self.bosses = None
 
         self.gameplay = True
         self.pause = False
-        self.running = True
-
-        self.is_restart = False
 
-        self.absolute_x = 0
         self.is_boss_defeated = False
         self.is_boss_created = False
 
-        self.lose_label = Label(screen_obj.width, screen_obj.height, None, 72, 'You Lose!',
-                                (193, 196, 199), "image/UI/Panel/Window/Medium.png")
-        self.pause_label = Label(screen_obj.width, screen_obj.height, None, 72, 'Pause',
-                                 (193, 196, 199), "image/UI/Panel/Window/Medium.png")
+        self.pause_scene = PauseScene(self)
+        self.defeat_scene = PauseScene(self, defeat=True)
+        self.shop_scene = ShopScene(self)
+        self.lag = 0
 
-        self.restart_button = Button((screen_obj.width - 450) / 2, screen_obj.height / 2, 200, 100,
-                                     "image/UI/Buttons/PlayText/Default@3x.png", "Restart",
-                                     "image/UI/Buttons/PlayText/Hover@3x.png", "sound/knopka-schelchok.mp3")
+        self.streamer.update(self.absolute_x, budget=None)
+        self.take_snapshot()
 
-        self.continue_button = Button((screen_obj.width - 450) / 2, screen_obj.height / 2, 200, 100,
-                                      "image/UI/Buttons/PlayText/Default@3x.png", "Continue",
-                                      "image/UI/Buttons/PlayText/Hover@3x.png", "sound/knopka-schelchok.mp3")
+    def take_snapshot(self):
+        """
+        Record the state of the level and the player, to restart the game in place with reset.
+        The clock belongs to the SceneManager running the game and is kept.
 
-        self.menu_defeat_button = Button((screen_obj.width + 50) / 2, screen_obj.height / 2, 200, 100,
-                                         "image/UI/Buttons/PlayText/Default@3x.png",
-                                         "Menu", "image/UI/Buttons/PlayText/Hover@3x.png", "sound/knopka-schelchok.mp3")
+        :rtype: None
+        """
+        self.snapshot = Snapshot(self, self.player, *self.enemies,
+                                 *[enemy for enemy_group in self.enemies for enemy in enemy_group],
+                                 *self.platforms.dynamic, *self.npcs, skip=("clock",))
+        self.streamer.take_snapshot()
 
-    def handle_events(self, screen, events):
+    def reset(self):
         """
-        Handle game events.
+        Put the level and the player back in their recorded state, reusing all images and sounds.
+        The boss and the gates are removed, so they are created again when the player reaches the arena.
 
-        :param screen: The screen surface to draw on.
-        :param events: The list of events to handle.
         :rtype: None
         """
-        for event in events:
-            if event.type == pygame.QUIT:
-                self.running = False
-                pygame.quit()
-                sys.exit()
+        self.snapshot.restore()
+        self.streamer.reset()
+        self.camera.reset()
+        self.broadphase.rebuild(self.enemies)
 
-            elif event.type == pygame.KEYDOWN:
-                if self.gameplay and event.key == pygame.K_ESCAPE:
-                    self.pause = True
+    def handle_event(self, event, manager):
+        """
+        Handle a game event.
+
+        :param event: The event to handle.
+        :param manager: The SceneManager running the game, or None while run_frames runs it.
+        :rtype: None
+        """
+        if event.type != pygame.KEYDOWN:
+            return
+
+        if event.key == pygame.K_F3:
+            profiler_obj.toggle_overlay()
 
-                if event.key == pygame.K_e:
-                    collided_npc = pygame.sprite.spritecollideany(self.player, self.npcs)
-                    if collided_npc and collided_npc.has_shop:
-                        collided_npc.open_shop(screen, self.player)
+        if event.key == pygame.K_F4 and profiler_obj.enabled:
+            profiler_obj.export_csv()
 
-            elif event.type == pygame.USEREVENT:
-                if event.button == self.restart_button or event.button == self.menu_defeat_button:
-                    self.main_location.sound.stop()
-                    self.gameplay = True
-                    self.player.x = screen_obj.width // 2
-                    self.player.y = screen_obj.height - 100 * screen_obj.height_scale
-                    self.player.current_hp = 5
+        if manager is None or not self.gameplay:
+            return
 
-                if event.button == self.menu_defeat_button:
-                    self.running = False
+        if event.key == pygame.K_ESCAPE:
+            manager.push(self.pause_scene)
 
-                if event.button == self.restart_button:
-                    self.is_restart = True
+        if event.key == pygame.K_e and manager.top() is self:
+            collided_npc = pygame.sprite.spritecollideany(self.player, self.npcs)
+            if collided_npc and collided_npc.has_shop:
+                self.shop_scene.npc = collided_npc
+                manager.push(self.shop_scene)
 
-                if event.button == self.continue_button:
-                    self.main_location.sound.play()
-                    self.pause = False
+    def handle_events(self, events):
+        """
+        Handle the events of a frame run by run_frames, which has no overlays.
+
+        :param events: The list of events to handle.
+        :rtype: None
+        """
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
 
-            if self.pause:
-                for btn in [self.menu_defeat_button, self.continue_button]:
-                    btn.handle_event(event)
-            elif not self.gameplay:
-                for btn in [self.menu_defeat_button, self.restart_button]:
-                    btn.handle_event(event)
+            self.handle_event(event, None)
 
     def draw_back_and_platforms(self, screen):
         """
@@ -198,74 +288,239 @@ class GameOn:
 
         for part_back in self.partial_backgrounds:
             part_back.draw(screen)
+        profiler_obj.mark("background")
+
+        for platform in self.platforms:
+            platform.draw(screen)
+        profiler_obj.mark("platforms.draw")
+
+    def update_enemies(self):
+        """
+        Update the enemies by one simulation step.
+        Enemies that can be culled are skipped while they are off the screen.
+
+        :rtype: None
+        """
+        for enemy_group in self.enemies:
+            for enemy in enemy_group.sprites():
+                if not enemy.can_cull or self.camera.is_visible(enemy.rect):
+                    enemy.update(enemy_group, self)
+
+    def draw_enemies(self, screen):
+        """
+        Draw the enemies.
+        Enemies that can be culled are skipped while they are off the screen.
 
-        self.platforms.draw(screen)
+        :param screen: The screen surface to draw on.
+        :rtype: None
+        """
+        for enemy_group in self.enemies:
+            for enemy in enemy_group:
+                if not enemy.can_cull or self.camera.is_visible(enemy.rect):
+                    enemy.draw(screen)
+
+    @property
+    def absolute_x(self):
+        """
+        Return the absolute x-coordinate of the game world, which is the camera offset.
+
+        :rtype: float
+        """
+        return self.camera.x
 
     def change_absolute_x(self, dx):
         """
-        Change the absolute x-coordinate by a given amount.
+        Scroll the camera by a given amount.
+
+        :param dx: The amount to change the absolute x-coordinate by, before scaling to the screen width.
+        :rtype: None
+        """
+        self.camera.scroll(dx * screen_obj.width_scale)
+
+    def record_counters(self):
+        """
+        Store the objects drawn and culled in this frame and the entity counts in the profiler.
 
-        :param dx: The amount to change the absolute x-coordinate by.
         :rtype: None
         """
-        self.absolute_x += dx * screen_obj.width_scale
+        stats = self.camera.get_stats()
+        profiler_obj.count("drawn", stats["drawn"])
+        profiler_obj.count("culled", stats["culled"])
+
+        profiler_obj.count("platforms", len(self.platforms))
+        profiler_obj.count("enemies", sum(len(group) for group in self.enemies))
+        profiler_obj.count("npcs", len(self.npcs))
+        profiler_obj.count("chunks", len(self.streamer.loaded))
+
+        projectiles = len(getattr(self.player, "arrows", ()))
+        if self.bosses:
+            projectiles += sum(len(boss.fireballs) for boss in self.bosses)
+        profiler_obj.count("projectiles", projectiles)
+
+    def update(self):
+        """
+        Advance the game by one fixed simulation step.
+
+        :rtype: None
+        """
+        self.camera.save_position()
+
+        for platform in self.platforms.dynamic:
+            platform.slide()
+        profiler_obj.mark("platforms.update")
+
+        if self.gameplay and not self.pause:
+            self.update_enemies()
+            profiler_obj.mark("enemies.update")
+
+            self.broadphase.rebuild(self.enemies)
+            profiler_obj.mark("broadphase")
 
-    def start(self, screen):
+            self.npcs.update()
+            profiler_obj.mark("npcs.update")
+
+            if self.player.current_hp <= 0:
+                self.gameplay = False
+
+            self.player.update(self)
+            profiler_obj.mark("player.update")
+
+            self.streamer.update(self.absolute_x)
+            profiler_obj.mark("streaming")
+
+            if self.absolute_x >= self.level.arena_trigger and not self.is_boss_created:
+                self.bosses, self.gates = self.streamer.open_arena()
+                self.is_boss_created = True
+        else:
+            self.main_location.sound.stop()
+        profiler_obj.mark("level")
+
+    def draw(self, screen):
         """
-        Start the game loop.
+        Draw the current state of the game.
 
         :param screen: The screen surface to draw on.
-        :return: Whether the game was restarted.
-        :rtype: bool
+        :rtype: None
+        """
+        self.camera.begin_frame()
+        self.draw_back_and_platforms(screen)
+
+        if self.gameplay and not self.pause:
+            self.draw_enemies(screen)
+            profiler_obj.mark("enemies.draw")
+
+            for npc in self.npcs:
+                npc.animation(screen)
+            profiler_obj.mark("npcs.draw")
+
+            self.player.draw(screen)
+            profiler_obj.mark("player.draw")
+
+    def enter(self, manager):
+        """
+        Start the music, hide the cursor, pin the assets and use the clock of the manager.
+        The first frame runs exactly one simulation step.
+
+        :param manager: The SceneManager running the game.
+        :rtype: None
         """
         self.main_location.sound.set_volume(0.5)
         self.main_location.sound.play(-1)
+        # The menus show a hardware cursor; the pause and defeat overlays show it again.
+        pygame.mouse.set_visible(False)
 
-        while self.running:
-            self.draw_back_and_platforms(screen)
+        ImageCache.pin(self.asset_dirs)
+
+        self.clock = manager.clock
+        self.lag = 1000 / constants.SIMULATION_FPS
+
+    def exit(self, manager):
+        """
+        Stop the music, drop the animations shared by the enemies and projectiles, and unpin the assets,
+        so the cache can free the frames of this game.
+
+        :param manager: The SceneManager running the game.
+        :rtype: None
+        """
+        self.main_location.sound.stop()
+        Enemy.clear_animation_sets()
+        Shockwave.clear_animation_sets()
+        ImageCache.unpin(self.asset_dirs)
+
+    def advance(self, manager, dt):
+        """
+        Run the simulation steps due after dt milliseconds.
+        If the frame rate drops, at most constants.MAX_SIMULATION_STEPS steps are run per frame.
+        When the player has died, the defeat overlay is shown.
 
-            for platform in self.platforms:
-                if isinstance(platform, MovingPlatform):
-                    platform.slide()
+        :param manager: The SceneManager running the game.
+        :param dt: Milliseconds since the previous frame.
+        :rtype: None
+        """
+        step_time = 1000 / constants.SIMULATION_FPS
+        self.lag = min(self.lag + dt, step_time * constants.MAX_SIMULATION_STEPS)
 
-            if self.gameplay and not self.pause:
-                for enemy_group in self.enemies:
-                    enemy_group.update(screen, enemy_group, self)
+        while self.lag >= step_time:
+            self.update()
+            self.lag -= step_time
 
-                self.npcs.update(screen)
+        if not self.gameplay and manager.top() is not self.defeat_scene:
+            manager.pop_to(self)
+            manager.push(self.defeat_scene)
 
-                if self.player.current_hp <= 0:
-                    self.gameplay = False
+    def render(self, screen):
+        """
+        Draw the frame, interpolated between the last two simulation steps, and the profiler overlay.
 
-                self.player.update(screen, self)
+        :param screen: The screen surface to draw on.
+        :rtype: None
+        """
+        step_time = 1000 / constants.SIMULATION_FPS
 
-                if self.absolute_x >= screen_obj.width * 4.6 and not self.is_boss_created:
-                    self.bosses = creater.add_boss(self.enemies)
-                    self.is_boss_created = True
-                    self.gates = creater.create_and_add_gates(self.platforms)
-            else:
-                self.main_location.sound.stop()
+        self.camera.alpha = self.lag / step_time if constants.INTERPOLATION else 1
+        self.draw(screen)
+        self.camera.alpha = 1
 
-                if self.pause:
-                    self.pause_label.draw(screen)
-                    self.continue_button.draw(screen)
-                else:
-                    self.lose_label.draw(screen)
-                    self.restart_button.draw(screen)
+        if profiler_obj.enabled:
+            self.record_counters()
+            if profiler_obj.overlay:
+                profiler_obj.draw_overlay(screen, self.clock.get_fps())
+            profiler_obj.mark("profiler")
 
-                self.menu_defeat_button.draw(screen)
+    def run_frames(self, screen, frames, until=None):
+        """
+        Run a fixed number of frames as fast as possible, without sound, frame rate limit or overlays.
+        Every frame runs exactly one simulation step, so runs are repeatable.
+        Used for automated measurements in headless mode (constants.HEADLESS).
 
-                for btn in [self.restart_button, self.menu_defeat_button, self.continue_button]:
-                    btn.check_hover(pygame.mouse.get_pos())
+        :param screen: The screen surface to draw on.
+        :param frames: The maximum number of frames to run.
+        :param until: Optional function of the game; the run stops after the frame where it returns True.
+        :return: The number of frames run before until returned True.
+        :rtype: int
+        """
+        ImageCache.pin(self.asset_dirs)
 
-                self.lose_label.draw_cursor(screen)
+        frame = 0
+        while frame < frames:
+            profiler_obj.begin_frame()
+            self.handle_events(pygame.event.get())
+            profiler_obj.mark("events")
 
-            pygame.display.update()
-            self.handle_events(screen, pygame.event.get())
+            self.update()
+            self.draw(screen)
 
-            if self.is_restart:
-                return self.is_restart
+            if profiler_obj.enabled:
+                self.record_counters()
+                profiler_obj.mark("profiler")
 
-            pygame.time.delay(constants.DELAY)
-            self.clock.tick(constants.MAX_FPS)
             pygame.display.flip()
+            profiler_obj.mark("present")
+            profiler_obj.end_frame()
+            frame += 1
+
+            if until and until(self):
+                break
+
+        ImageCache.unpin(self.asset_dirs)
+        return frame
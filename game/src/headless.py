@@ -0,0 +1,95 @@
+"""
+Module: game.src.headless
+
+This module runs the game without a window or a sound card, for automated performance
+measurements on build machines.
+
+Headless mode is selected by the CS3_HEADLESS environment variable, which is read by
+`constants.HEADLESS` when the game is imported. `screen.py` then switches SDL to its dummy video
+and audio drivers and draws the game on an off-screen surface.
+
+Attributes:
+- HEROES (dict): Hero name -> hero class, for choosing the hero from the command line.
+
+Functions:
+- create_game(hero="leaf_ranger"):
+    Create a GameOn with the hero placed where the character menu puts it.
+- run(frames, hero="leaf_ranger"):
+    Run a fixed number of frames as fast as possible and return the timing.
+- main(args):
+    Command-line entry point.
+
+Usage (from the `game` directory):
+CS3_HEADLESS=1 PYTHONPATH=.. python -m game.src.headless 600 leaf_ranger
+"""
+
+import sys
+import time
+from game.src import constants
+from game.src.Heroes.fire_knight import FireKnight
+from game.src.Heroes.leaf_ranger import LeafRanger
+from game.src.Heroes.standard_hero import StandardHero
+from game.src.Heroes.water_princess import WaterPrincess
+from game.src.Heroes.wind_hashahin import WindHashahin
+from game.src.game_start import GameOn
+from game.src.screen import screen_obj
+import pygame
+
+HEROES = {
+    "standard_hero": StandardHero,
+    "fire_knight": FireKnight,
+    "wind_hashahin": WindHashahin,
+    "water_princess": WaterPrincess,
+    "leaf_ranger": LeafRanger,
+}
+
+
+def create_game(hero="leaf_ranger"):
+    """
+    Create a GameOn with the hero placed where the character menu puts it.
+
+    :param hero: The name of the hero, a key of HEROES.
+    :rtype: GameOn
+    """
+    player = HEROES[hero](screen_obj.width // 2, screen_obj.height - 120 * screen_obj.height_scale)
+    return GameOn(player)
+
+
+def run(frames, hero="leaf_ranger"):
+    """
+    Run a fixed number of frames as fast as possible.
+
+    :param frames: The number of frames to run.
+    :param hero: The name of the hero, a key of HEROES.
+    :rtype: dict
+    :return: the number of frames run, the elapsed seconds and the frames per second.
+    """
+    game = create_game(hero)
+
+    start = time.perf_counter()
+    done = game.run_frames(screen_obj.screen, frames)
+    elapsed = time.perf_counter() - start
+
+    return {"frames": done, "seconds": elapsed, "fps": done / elapsed if elapsed else 0}
+
+
+def main(args):
+    """
+    Run the game headless and print the timing.
+
+    :param args: Command-line arguments: the number of frames and the hero name, both optional.
+    :rtype: None
+    """
+    if not constants.HEADLESS:
+        print("Warning: CS3_HEADLESS is not set to 1, a window will be opened.")
+
+    frames = int(args[0]) if args else 600
+    hero = args[1] if len(args) > 1 else "leaf_ranger"
+
+    pygame.init()
+    result = run(frames, hero)
+    print(f"{result['frames']} frames in {result['seconds']:.3f} s ({result['fps']:.1f} FPS)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -29,6 +29,7 @@ Dependencies:
   - pygame: Library for game development in Python with multimedia capabilities.
 """
 
+from game.src.text import font_registry_obj
 import pygame
 
 
@@ -66,7 +67,7 @@ class Label:
         :param color: The color of the text (default is black).
         :param background_path: The path to the background image file (optional).
         """
-        self.font = pygame.font.Font(font_path, size)
+        self.font = font_registry_obj.get_font(size, font_path)
         self.text_surface = self.font.render(text, True, color)
         self.cursor = pygame.image.load("image/UI/cursor/cursor.png").convert_alpha()
 
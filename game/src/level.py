@@ -0,0 +1,361 @@
+"""
+Module: game.src.level
+
+This module defines the `LevelCompiler` class, which turns a level file into a `CompiledLevel`,
+and the `CompiledLevel` class, which holds the placements of everything in a level.
+
+A level file is a JSON document in design units, the pixels of the default 960x600 screen, so it
+never mentions the screen resolution. Compiling a level multiplies every position and size by the
+scaling factors of the screen and computes the platform grid cells of every static platform, so
+creating the level objects afterwards is only a matter of calling their constructors.
+
+The compiled level is also written to a binary file cached per resolution. The file is read with
+a single read and decoded with struct, so later launches skip parsing and compiling the JSON.
+
+Level file:
+- backgrounds (list): Paths of the parallax background layers.
+- sound (str): Path of the background music.
+- decorations (list): Partial backgrounds with x, y, width, height and image.
+- platforms (list): Static platforms with x, y, width, height, an optional image and an optional
+  repeat count, which places that many copies side by side.
+- moving_platforms (list): Moving platforms with x, y, width, height, up, to and direction ('x' or 'y').
+- enemies (list): Enemies with type, x, y and range.
+- npcs (list): NPCs with type, x and y.
+- arena (dict): The boss arena: trigger, the camera offset that starts it, and bosses and gates,
+  placed relative to the camera offset at that moment.
+
+Classes:
+- CompiledLevel:
+    Pre-scaled placements of a level.
+
+    Methods:
+    - to_bytes():
+        Encode the level in its binary form.
+    - from_bytes(blob):
+        Decode a level from its binary form.
+- LevelCompiler:
+    Compiles level files and caches the results in memory and on disk.
+
+    Methods:
+    - load(path=constants.LEVEL_FILE):
+        Return the compiled level for the current resolution.
+    - compile(path):
+        Compile a level file for the current resolution.
+    - get_cache_path(path):
+        Return the path of the binary file of a level.
+    - read_cache(path):
+        Read the binary file of a level.
+    - write_cache(path, level):
+        Write the binary file of a level.
+
+Usage:
+from game.src.level import LevelCompiler
+
+level = LevelCompiler.load()
+for x, y, width, height, image_type, *bounds in level.platforms:
+    platforms.add_indexed(Platform(x, y, width, height, image_type), bounds)
+
+Notes:
+- The binary files depend on the modification time of the level file, the screen resolution and
+  constants.PLATFORM_GRID_CELL, so editing the level or changing either produces a new file.
+- Bumping constants.LEVEL_CACHE_VERSION invalidates every binary file.
+"""
+
+import hashlib
+import json
+import os
+import struct
+from game.src import constants
+from game.src.platforms import PlatformGroup
+from game.src.screen import screen_obj
+import pygame
+
+LEVEL_MAGIC = b"CS3L"
+LEVEL_HEADER = "<4sIIIIId"
+STRING_HEADER = "<H"
+SECTION_HEADER = "<I"
+
+
+class CompiledLevel:
+    """
+        Pre-scaled placements of a level, in world pixels of the current resolution.
+
+        Attributes:
+            SECTIONS (tuple): (attribute, record format) of every list of records in the binary form.
+                'S' in a format is a string, stored as an index into the string table.
+            width (int): Screen width the level was compiled for.
+            height (int): Screen height the level was compiled for.
+            cell_size (int): Side of the platform grid cells.
+            sound (str): Path of the background music.
+            arena_trigger (float): Camera offset at which the boss arena starts.
+            backgrounds (list): (path,) of every parallax layer.
+            decorations (list): (x, y, width, height, image) of every partial background.
+            platforms (list): (x, y, width, height, image, left, top, right, bottom) of every static platform,
+                where the last four are its platform grid cell bounds.
+            moving_platforms (list): (x, y, width, height, up, to, direction, image) of every moving platform.
+            enemies (list): (type, x, y, range) of every enemy.
+            npcs (list): (type, x, y) of every NPC.
+            bosses (list): (type, x, y) of every boss, relative to the camera offset when the arena starts.
+            gates (list): (x, y, width, height, image) of every gate, relative to the same offset.
+
+        Methods:
+            to_bytes(): Encode the level in its binary form.
+            from_bytes(blob): Decode a level from its binary form.
+        """
+
+    SECTIONS = (
+        ("backgrounds", "S"),
+        ("decorations", "ddddS"),
+        ("platforms", "ddddSiiii"),
+        ("moving_platforms", "ddddddSS"),
+        ("enemies", "Sddd"),
+        ("npcs", "Sdd"),
+        ("bosses", "Sdd"),
+        ("gates", "ddddS"),
+    )
+
+    def __init__(self, width, height, cell_size, sound, arena_trigger):
+        """
+        Initialize an empty CompiledLevel.
+
+        :param width: Screen width the level is compiled for.
+        :param height: Screen height the level is compiled for.
+        :param cell_size: Side of the platform grid cells.
+        :param sound: Path of the background music.
+        :param arena_trigger: Camera offset at which the boss arena starts.
+        :rtype: object
+        """
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.sound = sound
+        self.arena_trigger = arena_trigger
+
+        for name, _ in CompiledLevel.SECTIONS:
+            setattr(self, name, [])
+
+    def to_bytes(self):
+        """
+        Encode the level in its binary form: a header, a string table and one block of records per section.
+
+        :rtype: bytes
+        """
+        strings = [self.sound]
+        indexes = {self.sound: 0}
+        sections = []
+
+        for name, record_format in CompiledLevel.SECTIONS:
+            packer = struct.Struct("<" + record_format.replace("S", "I"))
+            records = []
+
+            for record in getattr(self, name):
+                values = []
+                for kind, value in zip(record_format, record):
+                    if kind == "S":
+                        if value not in indexes:
+                            indexes[value] = len(strings)
+                            strings.append(value)
+                        value = indexes[value]
+                    values.append(value)
+                records.append(packer.pack(*values))
+
+            sections.append(struct.pack(SECTION_HEADER, len(records)) + b"".join(records))
+
+        chunks = [struct.pack(LEVEL_HEADER, LEVEL_MAGIC, constants.LEVEL_CACHE_VERSION, self.width, self.height,
+                              self.cell_size, indexes[self.sound], self.arena_trigger),
+                  struct.pack(SECTION_HEADER, len(strings))]
+
+        for string in strings:
+            encoded = string.encode()
+            chunks.append(struct.pack(STRING_HEADER, len(encoded)) + encoded)
+
+        return b"".join(chunks + sections)
+
+    @staticmethod
+    def from_bytes(blob):
+        """
+        Decode a level from its binary form.
+
+        :param blob: The bytes written by to_bytes.
+        :rtype: CompiledLevel
+        :raises ValueError: If the blob is not a level of the current cache version.
+        """
+        magic, version, width, height, cell_size, sound, arena_trigger = struct.unpack_from(LEVEL_HEADER, blob)
+        if magic != LEVEL_MAGIC or version != constants.LEVEL_CACHE_VERSION:
+            raise ValueError("not a compiled level of this version")
+        offset = struct.calcsize(LEVEL_HEADER)
+
+        (count,) = struct.unpack_from(SECTION_HEADER, blob, offset)
+        offset += struct.calcsize(SECTION_HEADER)
+        strings = []
+        for _ in range(count):
+            (length,) = struct.unpack_from(STRING_HEADER, blob, offset)
+            offset += struct.calcsize(STRING_HEADER)
+            strings.append(bytes(blob[offset:offset + length]).decode())
+            offset += length
+
+        level = CompiledLevel(width, height, cell_size, strings[sound], arena_trigger)
+
+        for name, record_format in CompiledLevel.SECTIONS:
+            unpacker = struct.Struct("<" + record_format.replace("S", "I"))
+            (count,) = struct.unpack_from(SECTION_HEADER, blob, offset)
+            offset += struct.calcsize(SECTION_HEADER)
+
+            string_fields = [i for i, kind in enumerate(record_format) if kind == "S"]
+            records = getattr(level, name)
+            for values in unpacker.iter_unpack(blob[offset:offset + count * unpacker.size]):
+                values = list(values)
+                for i in string_fields:
+                    values[i] = strings[values[i]]
+                records.append(tuple(values))
+
+            offset += count * unpacker.size
+
+        return level
+
+
+class LevelCompiler:
+    """
+        Compiles level files for the current resolution and caches the results in memory and on disk.
+
+        Attributes:
+            levels (dict): (level path, screen width, screen height) -> CompiledLevel.
+            disk_hits (int): Number of levels read from their binary files instead of being compiled.
+
+        Methods:
+            load(path=constants.LEVEL_FILE): Return the compiled level for the current resolution.
+            compile(path): Compile a level file for the current resolution.
+            get_cache_path(path): Return the path of the binary file of a level.
+            read_cache(path): Read the binary file of a level.
+            write_cache(path, level): Write the binary file of a level.
+        """
+
+    levels = {}
+    disk_hits = 0
+
+    @staticmethod
+    def load(path=constants.LEVEL_FILE):
+        """
+        Return the compiled level for the current resolution,
+        reading it from its binary file or compiling it on first use.
+
+        :param path: Path of the level file.
+        :rtype: CompiledLevel
+        """
+        key = (path, screen_obj.width, screen_obj.height)
+        level = LevelCompiler.levels.get(key)
+
+        if level is None:
+            level = LevelCompiler.read_cache(path)
+            if level is None:
+                level = LevelCompiler.compile(path)
+                LevelCompiler.write_cache(path, level)
+            LevelCompiler.levels[key] = level
+
+        return level
+
+    @staticmethod
+    def compile(path):
+        """
+        Compile a level file for the current resolution: scale it from design units to world pixels
+        and compute the platform grid cells of the static platforms.
+
+        :param path: Path of the level file.
+        :rtype: CompiledLevel
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+
+        width_scale, height_scale = screen_obj.width_scale, screen_obj.height_scale
+        grid = PlatformGroup()
+
+        def scale_box(entry):
+            return (entry["x"] * width_scale, entry["y"] * height_scale,
+                    entry["width"] * width_scale, entry["height"] * height_scale)
+
+        arena = data["arena"]
+        level = CompiledLevel(screen_obj.width, screen_obj.height, grid.cell_size, data["sound"],
+                              arena["trigger"] * width_scale)
+
+        level.backgrounds = [(background,) for background in data["backgrounds"]]
+
+        level.decorations = [scale_box(entry) + (entry.get("image", "brick_wall"),)
+                             for entry in data.get("decorations", ())]
+
+        for entry in data.get("platforms", ()):
+            x, y, width, height = scale_box(entry)
+            for i in range(entry.get("repeat", 1)):
+                # Same rect as Platform builds from these values.
+                rect = pygame.Rect(int(x + i * width), int(y), int(width), int(height))
+                level.platforms.append((x + i * width, y, width, height, entry.get("image", "main_platform"))
+                                       + grid.get_bounds(rect))
+
+        for entry in data.get("moving_platforms", ()):
+            direction = entry.get("direction", "x")
+            bound_scale = width_scale if direction == "x" else height_scale
+            level.moving_platforms.append(scale_box(entry) + (entry["up"] * bound_scale, entry["to"] * bound_scale,
+                                                              direction, entry.get("image", "moving_platform")))
+
+        level.enemies = [(entry["type"], entry["x"] * width_scale, entry["y"] * height_scale,
+                          entry["range"] * width_scale) for entry in data.get("enemies", ())]
+
+        level.npcs = [(entry["type"], entry["x"] * width_scale, entry["y"] * height_scale)
+                      for entry in data.get("npcs", ())]
+
+        level.bosses = [(entry["type"], entry["x"] * width_scale, entry["y"] * height_scale)
+                        for entry in arena.get("bosses", ())]
+
+        level.gates = [scale_box(entry) + (entry.get("image", "gate"),) for entry in arena.get("gates", ())]
+
+        return level
+
+    @staticmethod
+    def get_cache_path(path):
+        """
+        Return the path of the binary file of a level.
+        The name depends on the level file's modification time, the screen resolution and the grid cell size.
+
+        :param path: Path of the level file.
+        :rtype: str
+        """
+        name = repr((path, os.path.getmtime(path), screen_obj.width, screen_obj.height,
+                     constants.PLATFORM_GRID_CELL))
+        return os.path.join(constants.LEVEL_CACHE_DIR, f"v{constants.LEVEL_CACHE_VERSION}",
+                            hashlib.sha1(name.encode()).hexdigest() + ".level")
+
+    @staticmethod
+    def read_cache(path):
+        """
+        Read the binary file of a level in one read.
+
+        :param path: Path of the level file.
+        :rtype: CompiledLevel | None
+        :return: the compiled level, or None if it has no binary file yet or the file is unusable.
+        """
+        try:
+            with open(LevelCompiler.get_cache_path(path), "rb") as file:
+                level = CompiledLevel.from_bytes(memoryview(file.read()))
+        except (OSError, ValueError, IndexError, UnicodeDecodeError, struct.error):
+            return None
+
+        LevelCompiler.disk_hits += 1
+        return level
+
+    @staticmethod
+    def write_cache(path, level):
+        """
+        Write the binary file of a level. Failing to write it only costs compiling the level again.
+
+        :param path: Path of the level file.
+        :param level: The compiled level.
+        :rtype: None
+        """
+        cache_path = LevelCompiler.get_cache_path(path)
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path + ".tmp", "wb") as file:
+                file.write(level.to_bytes())
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError:
+            pass
@@ -7,51 +7,50 @@ Classes:
     Represents a location in the game with multiple background layers and associated sound.
 
     Attributes:
-    - backgrounds (list): List of background images and their x-coordinate.
-    - background_speed (float): Speed at which the backgrounds move.
+    - background_speed (float): Scroll speed of each next background layer per VELOCITY of camera movement.
+    - layers (list): List of [surface, speed] pairs, from the farthest to the nearest.
+      Consecutive background images with the same speed are baked into one surface.
     - sound (pygame.mixer.Sound): Sound object for the location.
 
     Methods:
     - __init__(background_paths, sound_path, scale):
         Initializes the Locations object with background images and sound.
+    - bake_layers(backgrounds, background_speed):
+        Merges consecutive background images that scroll at the same speed.
     - draw_background(screen):
-        Draws the location's background on the screen.
-    - move_background(direction):
-        Moves the background layers in the specified direction ('right' or 'left').
+        Draws the location's background layers with parallax relative to the camera.
 
 - PartialBackground:
-    Represents a single moving background image in the game.
+    Represents a single background image placed in the game world.
 
     Attributes:
     - background (pygame.Surface): Surface of the partial background image.
-    - x (int): X-coordinate of the background's position.
+    - x (int): World x-coordinate of the background's position.
     - y (int): Y-coordinate of the background's position.
-    - background_speed (float): Speed at which the background moves.
 
     Methods:
     - __init__(x, y, width, height, image_name="brick_wall"):
         Initializes the PartialBackground object with specific coordinates, size, and image name.
     - draw(screen):
-        Draws the partial background on the screen.
-    - move_background(direction):
-        Moves the partial background in the specified direction ('right' or 'left').
+        Draws the partial background at its position relative to the camera, unless it is culled.
 
 Dependencies:
 - From game.src:
   - constants: Constants used for defining speeds and paths.
   - cache.ImageCache: Cache mechanism for managing and loading images.
-  - screen.screen_obj: Screen object containing screen dimensions and scales.
+  - camera.camera_obj: Camera holding the scroll offset of the level.
 - External dependencies:
   - pygame: Main library for game development in Python with multimedia capabilities.
   - pygame.mixer: Module for handling sound playback.
 
 """
 
-# Import statements for game dependencies (constants, cache.ImageCache, screen.screen_obj, pygame)
+# Import statements for game dependencies
+# (constants, cache.ImageCache, camera.camera_obj, pygame)
 
 from game.src import constants
 from game.src.cache import ImageCache
-from game.src.screen import screen_obj
+from game.src.camera import camera_obj
 import pygame
 
 pygame.mixer.init()
@@ -62,14 +61,16 @@ class Locations:
     Locations class handles the backgrounds and sound for a location in the game.
 
     Attributes:
-        backgrounds (list): List of background images and their x-coordinate.
-        background_speed (float): Speed at which the backgrounds move.
+        background_speed (float):
+            Scroll speed of each next background layer per VELOCITY of camera movement.
+        layers (list): List of [surface, speed] pairs, from the farthest to the nearest.
         sound (pygame.mixer.Sound): Sound object for the location.
 
     Methods:
         __init__(background_paths, sound_path, scale): Initializes the Locations object.
-        draw_background(screen): Draws the background on the screen.
-        move_background(direction): Moves the background in the specified direction.
+        bake_layers(backgrounds, background_speed):
+            Merges consecutive background images that scroll at the same speed.
+        draw_background(screen): Draws the background layers relative to the camera.
     """
 
     def __init__(self, background_paths, sound_path, scale):
@@ -80,65 +81,86 @@ class Locations:
         :param sound_path: Path to the sound file for the location.
         :param scale: Tuple containing the width and height to scale the backgrounds to.
         """
-        self.backgrounds = \
-            [[pygame.transform.scale(pygame.image.load(background_path).convert_alpha(), scale), 0]
-             for background_path in background_paths]
+        backgrounds = [pygame.transform.scale(ImageCache.load_image(background_path), scale)
+                       for background_path in background_paths]
 
-        self.background_speed = constants.BACKGROUND_SPEED * screen_obj.width_scale
+        self.background_speed = constants.BACKGROUND_SPEED
+        self.layers = self.bake_layers(backgrounds, self.background_speed)
 
         self.sound = pygame.mixer.Sound(sound_path)
 
-    def draw_background(self, screen):
+    @staticmethod
+    def bake_layers(backgrounds, background_speed):
         """
-        Draw the background on the screen.
-
-        :param screen: The screen surface to draw on.
+        Merge consecutive background images that scroll at the same speed into one surface.
+        Image i moves by i * background_speed pixels per VELOCITY pixels of camera movement.
+        The farthest layer covers the whole screen, so it is made opaque with convert().
+        The other layers keep per-pixel alpha and are RLE-accelerated.
+
+        :param backgrounds: List of background images, from the farthest to the nearest.
+        :param background_speed: Scroll speed of each next background image.
+        :rtype: list
+        :return: list of [surface, speed] pairs.
         """
-        for background in self.backgrounds:
-            screen.blit(background[0], (background[1], 0))
-            screen.blit(background[0], (background[1] + screen_obj.width, 0))
-            screen.blit(background[0], (background[1] - screen_obj.width, 0))
+        layers = []
+        for i, background in enumerate(backgrounds):
+            speed = background_speed * i
+            if layers and layers[-1][1] == speed:
+                layers[-1][0].blit(background, (0, 0))
+            else:
+                layers.append([background.copy(), speed])
+
+        if layers:
+            base = pygame.Surface(layers[0][0].get_size())
+            base.blit(layers[0][0], (0, 0))
+            layers[0][0] = base.convert()
+
+        # The nearer layers are mostly transparent; run-length encoding skips those pixels when blitting.
+        for layer in layers[1:]:
+            layer[0].set_alpha(255, pygame.RLEACCEL)
+
+        return layers
 
-    def move_background(self, direction):
+    def draw_background(self, screen):
         """
-        Move the background in the specified direction.
+        Draw the background on the screen.
+        A moving layer wraps around the screen and is drawn with at most two clipped blits.
 
-        :param direction: The direction to move the background ('right' or 'left').
+        :param screen: The screen surface to draw on.
         """
-        if direction == 'right':
-            self.background_speed = -constants.BACKGROUND_SPEED * screen_obj.width_scale
-        elif direction == 'left':
-            self.background_speed = constants.BACKGROUND_SPEED * screen_obj.width_scale
+        for background, speed in self.layers:
+            if not speed:
+                screen.blit(background, (0, 0))
+                continue
 
-        for i, background in enumerate(self.backgrounds):
-            if background[1] <= -screen_obj.width or background[1] >= screen_obj.width:
-                background[1] = 0
+            width, height = background.get_size()
+            x = int(-camera_obj.get_position() * speed / abs(constants.VELOCITY) % width)
 
-            background[1] += self.background_speed * i
+            screen.blit(background, (x, 0), (0, 0, width - x, height))
+            if x:
+                screen.blit(background, (0, 0), (width - x, 0, x, height))
 
 
 class PartialBackground:
     """
-    PartialBackground class represents a background image that can move in the game.
+    PartialBackground class represents a background image placed in the game world.
 
     Attributes:
         background (pygame.Surface): Surface of the partial background image.
-        x (int): X-coordinate of the background's position.
+        x (int): World x-coordinate of the background's position.
         y (int): Y-coordinate of the background's position.
-        background_speed (float): Speed at which the background moves.
 
     Methods:
         __init__(x, y, width, height, image_name="brick_wall"):
             Initializes the PartialBackground object.
-        draw(screen): Draws the partial background on the screen.
-        move_background(direction): Moves the partial background in the specified direction.
+        draw(screen): Draws the partial background relative to the camera, unless it is culled.
     """
 
     def __init__(self, x, y, width, height, image_name="brick_wall"):
         """
         Initialize the PartialBackground object.
 
-        :param x: The x-coordinate of the background's position.
+        :param x: The world x-coordinate of the background's position.
         :param y: The y-coordinate of the background's position.
         :param width: The width to scale the background to.
         :param height:
@@ -162,23 +184,12 @@ class PartialBackground:
         self.background = pygame.transform.scale(image[0], (width, height))
         self.x = x
         self.y = y
-        self.background_speed = constants.PARTIAL_BACKGROUND_SPEED * screen_obj.width_scale
 
     def draw(self, screen):
         """
-        Draw the partial background on the screen.
+        Draw the partial background on the screen, unless it is off the screen.
 
         :param screen: The screen surface to draw on.
         """
-        screen.blit(self.background, (self.x, self.y))
-
-    def move_background(self, direction):
-        """
-        Move the partial background in the specified direction.
-
-        :param direction: The direction to move the background ('right' or 'left').
-        """
-        if direction == 'right':
-            self.x += -self.background_speed
-        elif direction == 'left':
-            self.x += self.background_speed
+        if camera_obj.is_visible(self.background.get_rect(topleft=(self.x, self.y))):
+            screen.blit(self.background, camera_obj.apply_point(self.x, self.y))
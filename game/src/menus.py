@@ -2,7 +2,8 @@
 This module defines classes for various menus and menu-related functionality in a Pygame-based game.
 
 Classes:
-- Menu: Represents a basic menu with common menu operations and attributes.
+- Menu: Represents a basic menu with common menu operations and attributes, run as a scene.
+- Fade: Represents a fade to black drawn over a menu, run as an overlay scene.
 - MainMenu: Represents the main menu of the game, inheriting from Menu.
 - SettingsMenu: Represents the settings menu of the game, inheriting from Menu.
 - VideoMenu: Represents the video settings menu, inheriting from Menu.
@@ -13,10 +14,9 @@ Classes:
 Attributes and Methods:
 - Menu Class:
     Attributes:
-    - MAX_FPS (int): Maximum frames per second for the menu.
-    - clock (pygame.time.Clock): Pygame clock object for timing.
-    - cursor (pygame.Surface): Surface for the cursor image.
-    - is_restart (bool): Flag indicating if the menu should restart.
+    - cursor (pygame.Surface): Surface for the cursor image, used as a hardware cursor where supported.
+    - hardware_cursor (bool): Whether the cursor is a hardware cursor.
+    - redraw (bool): Whether the menu has changed since it was last drawn.
     - can_move_buttons (bool): Flag indicating if buttons can be moved.
     - title (str): Title of the menu.
     - WIDTH (int): Width of the menu screen.
@@ -24,8 +24,11 @@ Attributes and Methods:
     - main_background (pygame.Surface): Background surface for the menu.
 
     Methods:
-    - draw_menu(menu_obj, screen): Draws the menu on the screen.
-    - fade(screen): Creates a fade effect on the screen.
+    - handle_event(event, manager): Passes an event to the menu and its buttons.
+    - advance(manager, dt): Moves the buttons and updates their hover state.
+    - render(screen): Draws the menu, which the SceneManager only does when it has changed.
+    - fade(manager, action=None): Pushes the fade scene, which runs an action once the screen is dark.
+    - draw_progress(screen, progress): Draws the loading progress bar.
     - check_size(): Checks and updates the menu size based on the screen size.
 
 - MainMenu Class (Inherits from Menu):
@@ -36,9 +39,11 @@ Attributes and Methods:
     - buttons (list): List of all buttons in the main menu.
     - title (str): Title of the main menu.
     - settings_menu (SettingsMenu): Settings menu object.
+    - selector (SelectorCharacter): Character selector object.
 
     Methods:
-    - handle_events(event, screen, running): Handle events specific to the main menu.
+    - handle_events(event, manager): Handle events specific to the main menu.
+    - choose_hero(manager): Preload the level and show the character selector.
 
 - SettingsMenu Class (Inherits from Menu):
     Attributes:
@@ -50,7 +55,7 @@ Attributes and Methods:
     - video_menu (VideoMenu): Video settings menu object.
 
     Methods:
-    - handle_events(event, screen, running): Handle events specific to the settings menu.
+    - handle_events(event, manager): Handle events specific to the settings menu.
 
 - VideoMenu Class (Inherits from Menu):
     Attributes:
@@ -62,7 +67,7 @@ Attributes and Methods:
     - title (str): Title of the menu, set to "Video Settings".
 
     Methods:
-    - handle_events(event, screen, running): Handle events specific to the video settings menu.
+    - handle_events(event, manager): Handle events specific to the video settings menu.
 
 - SelectorMenu Class (Inherits from Menu):
     Attributes:
@@ -72,8 +77,9 @@ Attributes and Methods:
     - returned (list): List of returned values corresponding to each button.
 
     Methods:
-    - handle_events(event, screen, running): Handle events specific to the selector menu.
-    - choice(screen): Display the choice menu and handle interaction.
+    - layout(): Lay the buttons out again if the menu size has changed.
+    - handle_events(event, manager): Handle events specific to the selector menu.
+    - start_game(manager, returned): Create the selected hero and replace the selector with the game.
 
 - SelectorCharacter Class (Inherits from SelectorMenu):
     Attributes:
@@ -84,9 +90,8 @@ Attributes and Methods:
 """
 
 # Import statements for game dependencies
-# (constants, various hero classes, Button, GameOn, screen_obj, sys, pygame)
+# (various hero classes, Button, GameOn, scenes, preloader, screen_obj, text cache, sys, pygame)
 import sys
-from game.src import constants
 from game.src.Heroes.fire_knight import FireKnight
 from game.src.Heroes.leaf_ranger import LeafRanger
 from game.src.Heroes.standard_hero import StandardHero
@@ -94,30 +99,47 @@ from game.src.Heroes.water_princess import WaterPrincess
 from game.src.Heroes.wind_hashahin import WindHashahin
 from game.src.button import Button
 from game.src.game_start import GameOn
+from game.src.preloader import preloader_obj, LEVEL_ASSETS, ENEMY_ASSETS
+from game.src.scenes import Scene, show_cursor
 from game.src.screen import screen_obj
+from game.src.text import text_cache_obj
 import pygame
 
 
-class Menu:
+class Menu(Scene):
     """
         A class representing a menu in a game.
 
+        Menus are idle scenes: they are drawn again only when a button's hover state changes,
+        a button is clicked, a scene above them is popped or the window is exposed.
+
         Attributes:
-            MAX_FPS (int): Maximum frames per second for the menu.
-            clock (pygame.time.Clock): Pygame clock object for timing.
-            cursor (pygame.Surface): Surface for the cursor image.
-            is_restart (bool): Flag indicating if the menu should restart.
+            cursor (pygame.Surface): Surface for the cursor image, used as a hardware cursor where supported.
+            hardware_cursor (bool): Whether the cursor is a hardware cursor.
+            redraw (bool): Whether the menu has changed since it was last drawn.
             can_move_buttons (bool): Flag indicating if buttons can be moved.
             title (str): Title of the menu.
+            buttons (list): List of the buttons of the menu.
             WIDTH (int): Width of the menu screen.
             HEIGHT (int): Height of the menu screen.
             main_background (pygame.Surface): Background surface for the menu.
+            REDRAW_EVENTS (set): Event types after which the menu is drawn again.
 
         Methods:
-            draw_menu(menu_obj, screen):
+            enter(manager) / resume(manager, scene):
+                Shows the cursor and draws the menu again.
+            handle_event(event, manager):
+                Passes an event to the menu and its buttons.
+            handle_events(event, manager):
+                Handles the events specific to the menu.
+            advance(manager, dt):
+                Moves the buttons and updates their hover state.
+            render(screen):
                 Draws the menu on the screen.
-            fade(screen):
-                Creates a fade effect on the screen.
+            fade(manager, action=None):
+                Fades the screen out, then runs an action.
+            draw_progress(screen, progress):
+                Draws the loading progress bar.
             check_size():
                 Checks and updates the menu size based on the screen size.
         """
@@ -128,101 +150,148 @@ class Menu:
 
         :rtype: object
         """
-        self.MAX_FPS = constants.MAX_FPS
-        self.clock = pygame.time.Clock()
         self.cursor = pygame.image.load("image/UI/cursor/cursor.png").convert_alpha()
-        self.is_restart = False
+        self.hardware_cursor = False
+        self.redraw = True
 
         self.can_move_buttons = True
         self.title = ""
+        self.buttons = []
 
     WIDTH = screen_obj.width
     HEIGHT = screen_obj.height
     main_background = pygame.transform.scale(pygame.image.load("image/UI/Panel/Window/Big.png").convert_alpha(),
                                              (WIDTH, HEIGHT))
+    REDRAW_EVENTS = {pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN, pygame.USEREVENT,
+                     pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED, pygame.WINDOWFOCUSGAINED}
 
-    @staticmethod
-    def draw_menu(menu_obj, screen):
+    def enter(self, manager):
         """
-        Draw the menu on the screen.
+        Show the cursor and draw the menu again.
 
-        :param menu_obj: The menu object to be drawn.
-        :param screen: The screen surface to draw on.
-        :rtype: None | object
-        :return: Result of menu interaction, if any.
+        :param manager: The SceneManager.
+        :rtype: None
         """
-        pygame.mouse.set_visible(False)
+        self.hardware_cursor = show_cursor(self.cursor)
+        self.redraw = True
 
-        running = [True]
-        while running[0]:
-            screen.fill((0, 0, 0))
+    def resume(self, manager, scene):
+        """
+        Show the cursor and draw the menu again, as the scene above may have changed both.
 
-            if menu_obj.is_restart:
-                menu_obj.is_restart = False
-                menu_obj.fade(screen)
-                player = SelectorCharacter().choice(screen_obj.screen)
-                menu_obj.fade(screen)
-                menu_obj.is_restart = GameOn(player).start(screen)
+        :param manager: The SceneManager.
+        :param scene: The scene that was popped from above the menu.
+        :rtype: None
+        """
+        self.enter(manager)
 
-            screen.blit(menu_obj.main_background, (0, 0))
+    def handle_event(self, event, manager):
+        """
+        Pass an event to the menu and its buttons.
 
-            font = pygame.font.Font(None, 72)
-            text_surface = font.render(menu_obj.title, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=(Menu.WIDTH / 2, 60))
-            screen.blit(text_surface, text_rect)
+        :param event: The event to handle.
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+        if event.type in Menu.REDRAW_EVENTS or event.type == pygame.MOUSEMOTION and not self.hardware_cursor:
+            self.redraw = True
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running[0] = False
-                    pygame.quit()
-                    sys.exit()
+        self.handle_events(event, manager)
 
-                result = menu_obj.handle_events(event, screen, running)
+        for btn in self.buttons:
+            btn.handle_event(event)
 
-                if result:
-                    return result
+    def handle_events(self, event, manager):
+        """
+        Handle the events specific to the menu. Does nothing by default.
 
-                for btn in menu_obj.buttons:
-                    btn.handle_event(event)
+        :param event: The event to handle.
+        :param manager: The SceneManager.
+        :rtype: None
+        """
 
-            for btn in menu_obj.buttons:
-                if menu_obj.can_move_buttons:
-                    btn.set_pos((Menu.WIDTH - 252) / 2)
-                btn.check_hover(pygame.mouse.get_pos())
-                btn.draw(screen)
+    def advance(self, manager, dt):
+        """
+        Move the buttons to the middle of the screen and update their hover state.
 
-            screen.blit(menu_obj.cursor, pygame.mouse.get_pos())
+        :param manager: The SceneManager.
+        :param dt: Milliseconds since the previous frame.
+        :rtype: None
+        """
+        for btn in self.buttons:
+            if self.can_move_buttons:
+                btn.set_pos((Menu.WIDTH - 252) / 2)
 
-            pygame.display.flip()
+            was_hovered = btn.is_hovered
+            btn.check_hover(pygame.mouse.get_pos())
+            self.redraw = self.redraw or btn.is_hovered != was_hovered
 
-    def fade(self, screen):
+    def render(self, screen):
         """
-        Create a fade effect on the screen.
+        Draw the menu on the screen.
 
         :param screen: The screen surface to draw on.
         :rtype: None
         """
-        running = True
-        fade_alpha = 0  # level of transparency
+        screen.fill((0, 0, 0))
+        screen.blit(Menu.main_background, (0, 0))
+
+        text_surface = text_cache_obj.render(self.title, 72, (255, 255, 255))
+        text_rect = text_surface.get_rect(center=(Menu.WIDTH / 2, 60))
+        screen.blit(text_surface, text_rect)
+
+        for btn in self.buttons:
+            btn.draw(screen)
+
+        if not self.hardware_cursor:
+            screen.blit(self.cursor, pygame.mouse.get_pos())
+
+        self.redraw = False
+
+    def is_idle(self):
+        """
+        Return True, menus only change on events.
 
-        while running:
+        :rtype: bool
+        """
+        return True
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
+    def needs_redraw(self):
+        """
+        Return whether the menu has changed since it was last drawn.
 
-            fade_surface = pygame.Surface((Menu.WIDTH, Menu.HEIGHT))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(fade_alpha)
-            screen.blit(fade_surface, (0, 0))
+        :rtype: bool
+        """
+        return self.redraw
 
-            fade_alpha += 10
-            if fade_alpha >= 200:
-                fade_alpha = 255
-                running = False
+    @staticmethod
+    def fade(manager, action=None):
+        """
+        Fade the screen out over the menu, then run an action.
 
-            pygame.display.flip()
-            self.clock.tick(self.MAX_FPS)
+        :param manager: The SceneManager.
+        :param action: Optional function of the manager, run once the fade is over.
+        :rtype: None
+        """
+        fade_obj.action = action
+        manager.push(fade_obj)
+
+    @staticmethod
+    def draw_progress(screen, progress):
+        """
+        Draw the loading progress bar at the bottom of the screen.
+
+        :param screen: The screen surface to draw on.
+        :param progress: Loaded fraction from 0 to 1.
+        :rtype: None
+        """
+        width = Menu.WIDTH / 2
+        x = (Menu.WIDTH - width) / 2
+        y = Menu.HEIGHT - 60 * screen_obj.height_scale
+        height = 10 * screen_obj.height_scale
+
+        pygame.draw.rect(screen, (60, 60, 60), (x, y, width, height))
+        pygame.draw.rect(screen, (193, 196, 199), (x, y, width * progress, height))
 
     @staticmethod
     def check_size():
@@ -237,6 +306,84 @@ class Menu:
             Menu.main_background = pygame.transform.scale(Menu.main_background, (Menu.WIDTH, Menu.HEIGHT))
 
 
+class Fade(Scene):
+    """
+        A fade to black drawn over the current scene.
+        While the preloader is decoding images, the fade keeps the screen dark
+        and draws the loading progress.
+
+        Attributes:
+            action (function or None): Function of the manager, run once the fade is over.
+            alpha (int): Current opacity of the black surface.
+            surface (pygame.Surface or None): The black surface, created on first use for the screen size.
+
+        Methods:
+            enter(manager): Start the fade from transparent.
+            advance(manager, dt): Darken the screen, then pop the fade and run the action.
+            render(screen): Draw the black surface and the loading progress.
+        """
+
+    overlay = True
+
+    def __init__(self):
+        """
+        Initialize the Fade.
+
+        :rtype: object
+        """
+        self.action = None
+        self.alpha = 0
+        self.surface = None
+
+    def enter(self, manager):
+        """
+        Start the fade from transparent.
+
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+        self.alpha = 0
+
+    def advance(self, manager, dt):
+        """
+        Darken the screen by one step per frame. Once it is dark and the preloader is idle,
+        pop the fade and run the action.
+
+        :param manager: The SceneManager.
+        :param dt: Milliseconds since the previous frame.
+        :rtype: None
+        """
+        if self.alpha < 255:
+            self.alpha += 10
+            if self.alpha >= 200:
+                self.alpha = 255
+        elif not preloader_obj.is_busy():
+            manager.pop()
+            if self.action:
+                self.action(manager)
+
+    def render(self, screen):
+        """
+        Draw the black surface and, while the preloader is busy, the loading progress.
+        The surface is only created again when the screen size changes.
+
+        :param screen: The screen surface to draw on.
+        :rtype: None
+        """
+        if self.surface is None or self.surface.get_size() != (Menu.WIDTH, Menu.HEIGHT):
+            self.surface = pygame.Surface((Menu.WIDTH, Menu.HEIGHT))
+            self.surface.fill((0, 0, 0))
+
+        self.surface.set_alpha(self.alpha)
+        screen.blit(self.surface, (0, 0))
+
+        if preloader_obj.is_busy():
+            Menu.draw_progress(screen, preloader_obj.progress())
+
+
+fade_obj = Fade()
+
+
 class MainMenu(Menu):
     """
         A class representing the main menu in a game, inherits from Menu.
@@ -248,10 +395,13 @@ class MainMenu(Menu):
             buttons (list): List of all buttons in the main menu.
             title (str): Title of the main menu.
             settings_menu (SettingsMenu): Settings menu object.
+            selector (SelectorCharacter): Character selector object.
 
         Methods:
-            handle_events(event, screen, running):
+            handle_events(event, manager):
                 Handle events specific to the main menu.
+            choose_hero(manager):
+                Preload the level and show the character selector.
         """
 
     def __init__(self):
@@ -275,31 +425,37 @@ class MainMenu(Menu):
         self.title = "Menu"
 
         self.settings_menu = SettingsMenu()
+        self.selector = SelectorCharacter()
 
-    def handle_events(self, event, screen, running):
+    def handle_events(self, event, manager):
         """
         Handle events for the main menu.
 
         :param event: The event to handle.
-        :param screen: The screen surface to draw on.
-        :param running: A list with a boolean indicating if the menu is running.
+        :param manager: The SceneManager.
         :rtype: None
         """
         if event.type == pygame.USEREVENT:
 
             if event.button == self.exit_button:
-                running[0] = False
                 pygame.quit()
                 sys.exit()
 
             if event.button == self.settings_button:
-                self.fade(screen)
-                Menu.draw_menu(self.settings_menu, screen)
+                self.fade(manager, lambda manager: manager.push(self.settings_menu))
 
             if event.button == self.start_button:
-                self.fade(screen)
-                player = SelectorCharacter().choice(screen_obj.screen)
-                self.is_restart = GameOn(player).start(screen)
+                self.choose_hero(manager)
+
+    def choose_hero(self, manager):
+        """
+        Start preloading the level and show the character selector.
+
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+        preloader_obj.preload(LEVEL_ASSETS + ENEMY_ASSETS)
+        self.fade(manager, lambda manager: manager.push(self.selector))
 
 
 class SettingsMenu(Menu):
@@ -315,7 +471,7 @@ class SettingsMenu(Menu):
             video_menu (VideoMenu): Video settings menu object.
 
         Methods:
-            handle_events(event, screen, running):
+            handle_events(event, manager):
                 Handle events specific to the settings menu.
         """
 
@@ -339,23 +495,20 @@ class SettingsMenu(Menu):
 
         self.video_menu = VideoMenu()
 
-    def handle_events(self, event, screen, running):
+    def handle_events(self, event, manager):
         """
         Handle events for the settings menu.
 
         :param event: The event to handle.
-        :param screen: The screen surface to draw on.
-        :param running: A list with a boolean indicating if the menu is running.
+        :param manager: The SceneManager.
         :rtype: None
         """
         if (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE or
                 event.type == pygame.USEREVENT and event.button == self.back_button):
-            self.fade(screen)
-            running[0] = False
+            self.fade(manager, lambda manager: manager.pop())
 
         if event.type == pygame.USEREVENT and event.button == self.video_button:
-            self.fade(screen)
-            Menu.draw_menu(self.video_menu, screen)
+            self.fade(manager, lambda manager: manager.push(self.video_menu))
 
 
 class VideoMenu(Menu):
@@ -372,7 +525,7 @@ class VideoMenu(Menu):
 
         Methods:
             __init__(): Initialize the VideoMenu object.
-            handle_events(event, screen, running):
+            handle_events(event, manager):
                 Handle events specific to the video settings menu.
         """
 
@@ -402,21 +555,19 @@ class VideoMenu(Menu):
 
         self.title = "Video Settings"
 
-    def handle_events(self, event, screen, running):
+    def handle_events(self, event, manager):
         """
         Handle events for the video settings menu.
 
         :param event: The event to handle.
-        :param screen: The screen surface to draw on.
-        :param running: A list with a boolean indicating if the menu is running.
+        :param manager: The SceneManager.
         :rtype: None
         """
         if (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE or
                 event.type == pygame.USEREVENT and event.button == self.back_button):
-            self.fade(screen)
-            running[0] = False
+            self.fade(manager, lambda manager: manager.pop())
 
-        if event.type == pygame.USEREVENT:
+        elif event.type == pygame.USEREVENT:
 
             if event.button == self.resolution1_button:
                 screen_obj.change_screen_size(960, 600)
@@ -427,8 +578,8 @@ class VideoMenu(Menu):
             if event.button == self.resolution3_button:
                 screen_obj.change_screen_size(1920, 1080)
 
-            self.fade(screen)
             Menu.check_size()
+            self.fade(manager)
 
 
 # {
@@ -443,13 +594,17 @@ class SelectorMenu(Menu):
         Attributes:
             can_move_buttons (bool): Flag indicating if buttons can be moved.
             title (str): Title of the menu.
+            items (tuple): The selectable items.
             buttons (list): List of buttons in the menu.
             returned (list): List of returned values corresponding to each button.
+            layout_width (int): Menu width the buttons were laid out for.
 
         Methods:
             __init__(*args): Initialize the SelectorMenu object with a list of selectable items.
-            handle_events(event, screen, running): Handle events specific to the selector menu.
-            choice(screen): Display the choice menu and handle interaction.
+            layout(): Lay the buttons out again if the menu size has changed.
+            enter(manager): Lay the buttons out and show the menu.
+            handle_events(event, manager): Handle events specific to the selector menu.
+            start_game(manager, returned): Create the selected hero and replace the selector with the game.
         """
 
     def __init__(self, *args):
@@ -465,11 +620,28 @@ class SelectorMenu(Menu):
 
         self.title = "Chose character"
 
+        self.items = args
+        self.buttons = []
+        self.returned = []
+        self.layout_width = None
+
+        self.layout()
+
+    def layout(self):
+        """
+        Lay the buttons out again if the menu size has changed since they were created.
+
+        :rtype: None
+        """
+        if self.layout_width == Menu.WIDTH:
+            return
+
+        self.layout_width = Menu.WIDTH
         self.buttons = []
         self.returned = []
 
         y = 150
-        for (i, obj) in enumerate(args):
+        for (i, obj) in enumerate(self.items):
             if i != 0 and i % 3 == 0:
                 y += 230 * screen_obj.height_scale
 
@@ -483,39 +655,51 @@ class SelectorMenu(Menu):
 
             self.returned.append(obj["returned"])
 
-    def handle_events(self, event, screen, running):
+    def enter(self, manager):
+        """
+        Lay the buttons out for the current resolution and show the menu.
+
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+        self.layout()
+        super().enter(manager)
+
+    def handle_events(self, event, manager):
         """
         Handle events for the selector menu.
 
         :param event: The event to handle.
-        :param screen: The screen surface to draw on.
-        :param running: A list with a boolean indicating if the menu is running.
-        :rtype: object
-        :return: The selected item, if any.
+        :param manager: The SceneManager.
+        :rtype: None
         """
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            self.fade(screen)
-            running[0] = False
+            self.fade(manager, lambda manager: manager.pop())
 
         if event.type == pygame.USEREVENT:
 
             for (i, btn) in enumerate(self.buttons):
                 if event.button == btn:
-                    x = screen_obj.width // 2
-                    y = screen_obj.height - 120 * screen_obj.height_scale
+                    returned = self.returned[i]
 
-                    self.fade(screen)
-                    return self.returned[i](x, y)
+                    preloader_obj.preload(getattr(returned, "asset_dirs", ()))
+                    self.fade(manager, lambda manager: self.start_game(manager, returned))
+                    return
 
-    def choice(self, screen):
+    def start_game(self, manager, returned):
         """
-        Display the choice menu.
+        Create the selected hero and replace the selector with the game.
 
-        :param screen: The screen surface to draw on.
-        :rtype: object
-        :return: The result of the menu interaction, if any.
+        :param manager: The SceneManager.
+        :param returned: The class of the selected hero.
+        :rtype: None
         """
-        return self.draw_menu(self, screen)
+        preloader_obj.finish()
+
+        x = screen_obj.width // 2
+        y = screen_obj.height - 120 * screen_obj.height_scale
+
+        manager.replace(GameOn(returned(x, y)))
 
 
 class SelectorCharacter(SelectorMenu):
@@ -9,20 +9,17 @@ Attributes and Methods:
 - Npc Class:
     Attributes:
     - animation_images: List of images for animating the NPC.
-    - direction: Current direction of movement ('right' or 'left').
-    - velocity: Speed of movement.
     - animation_count: Index of the current animation frame.
     - const_delay: Constant delay between animation frames.
     - delay: Current delay count for animation frame change.
-    - rect: Rectangle defining the position and size of the NPC.
+    - rect: Rectangle defining the position (in world coordinates) and size of the NPC.
     - has_shop: Boolean indicating if the NPC has a shop interface.
 
     Methods:
     - __init__(self, x, y): Initializes the NPC object.
     - animation(self, screen): Animates the NPC by blitting the current frame onto the screen.
     - check_animation_count(self): Updates the animation frame count based on the delay.
-    - move_npc(self, direction): Moves the NPC in the specified direction.
-    - update(self, screen): Updates the NPC's animation and position.
+    - update(self): Advances the NPC's animation by one simulation step.
 
 - Blacksmith Class (Inherits from Npc):
     Attributes:
@@ -33,15 +30,15 @@ Attributes and Methods:
 
     Methods:
     - __init__(self, x, y): Initializes the Blacksmith object.
-    - open_shop(self, screen, player): Opens the shop interface for the player to buy items.
+    - draw_shop(self, screen): Draws the shop interface over the game.
+    - handle_shop_key(self, key, player): Buys the item bound to a number key.
     - buy_item(self, player, item): Handles the logic for buying an item from the shop.
 """
 
-# Import statements for game dependencies (constants, screen_obj, ImageCache, sys, pygame)
-import sys
-from game.src import constants
-from game.src.screen import screen_obj
+# Import statements for game dependencies (camera_obj, ImageCache, text_cache_obj, pygame)
+from game.src.camera import camera_obj
 from game.src.cache import ImageCache
+from game.src.text import text_cache_obj
 import pygame
 
 
@@ -51,20 +48,17 @@ class Npc(pygame.sprite.Sprite):
 
         Attributes:
         - animation_images: List of images for animating the NPC.
-        - direction: Current direction of movement ('right' or 'left').
-        - velocity: Speed of movement.
         - animation_count: Index of the current animation frame.
         - const_delay: Constant delay between animation frames.
         - delay: Current delay count for animation frame change.
-        - rect: Rectangle defining the position and size of the NPC.
+        - rect: Rectangle defining the position (in world coordinates) and size of the NPC.
         - has_shop: Boolean indicating if the NPC has a shop interface.
 
         Methods:
         - __init__(self, x, y): Initializes the NPC object.
         - animation(self, screen): Animates the NPC by blitting the current frame onto the screen.
         - check_animation_count(self): Updates the animation frame count based on the delay.
-        - move_npc(self, direction): Moves the NPC in the specified direction.
-        - update(self, screen): Updates the NPC's animation and position.
+        - update(self): Advances the NPC's animation by one simulation step.
         """
 
     animation_images = None
@@ -73,15 +67,12 @@ class Npc(pygame.sprite.Sprite):
         """
         Initialize the NPC object.
 
-        :param x: Initial x-coordinate of the NPC.
+        :param x: Initial world x-coordinate of the NPC.
         :param y: Initial y-coordinate of the NPC.
         :rtype: object
         """
         super().__init__()
 
-        self.direction = 'right'
-        self.velocity = constants.VELOCITY * screen_obj.width_scale
-
         self.animation_count = 0
         self.const_delay = 0
         self.delay = 0
@@ -94,12 +85,13 @@ class Npc(pygame.sprite.Sprite):
 
     def animation(self, screen):
         """
-        Animate the NPC by blitting the current frame onto the screen.
+        Animate the NPC by blitting the current frame onto the screen, unless the NPC is off the screen.
 
         :param screen: The screen surface to draw on.
         :rtype: None
         """
-        screen.blit(self.animation_images[self.animation_count], (self.rect.x, self.rect.y))
+        if camera_obj.is_visible(self.rect):
+            screen.blit(self.animation_images[self.animation_count], camera_obj.apply(self.rect))
 
     def check_animation_count(self):
         """
@@ -115,27 +107,12 @@ class Npc(pygame.sprite.Sprite):
             self.delay = 0
             self.animation_count += 1
 
-    def move_npc(self, direction):
-        """
-        Move the NPC in the specified direction.
-
-        :param direction: The direction to move the NPC.
-        :rtype: None
-        """
-        if direction != self.direction:
-            self.velocity *= -1
-            self.direction = direction
-
-        self.rect.x += self.velocity
-
-    def update(self, screen):
+    def update(self):
         """
-        Update the NPC's animation and position.
+        Advance the NPC's animation by one simulation step.
 
-        :param screen: The screen surface to draw on.
         :rtype: None
         """
-        self.animation(screen)
         self.check_animation_count()
 
 
@@ -151,7 +128,8 @@ class Blacksmith(Npc):
 
         Methods:
         - __init__(self, x, y): Initializes the Blacksmith object.
-        - open_shop(self, screen, player): Opens the shop interface for the player to buy items.
+        - draw_shop(self, screen): Draws the shop interface over the game.
+        - handle_shop_key(self, key, player): Buys the item bound to a number key.
         - buy_item(self, player, item): Handles the logic for buying an item from the shop.
         """
 
@@ -178,38 +156,33 @@ class Blacksmith(Npc):
             'Potion': 50,
         }
 
-    def open_shop(self, screen, player):
+    def draw_shop(self, screen):
         """
-        Open the shop interface, allowing the player to buy items.
+        Draw the shop interface over the game. The item texts are rendered once and then reused.
 
         :param screen: The screen surface to draw the shop interface on.
-        :param player: The player object interacting with the shop.
         :rtype: None
         """
-        font = pygame.font.Font(None, 36)
         y_offset = 50
         for item, price in self.shop_items.items():
-            item_text = font.render(f"{item}: {price} coins", True, (255, 255, 255))
+            item_text = text_cache_obj.render(f"{item}: {price} coins", 36, (255, 255, 255))
             screen.blit(item_text, (50, y_offset))
             y_offset += 40
 
-        pygame.display.flip()
-
-        buying = True
-        while buying:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_e:
-                        buying = False
-                    elif event.key == pygame.K_1:
-                        self.buy_item(player, 'Sword')
-                    elif event.key == pygame.K_2:
-                        self.buy_item(player, 'Shield')
-                    elif event.key == pygame.K_3:
-                        self.buy_item(player, 'Potion')
+    def handle_shop_key(self, key, player):
+        """
+        Buy the item bound to a number key while the shop is open.
+        The n-th number key buys the n-th item of the shop.
+
+        :param key: The key code of the pressed key.
+        :param player: The player object buying the item.
+        :rtype: None
+        """
+        items = list(self.shop_items)
+        index = key - pygame.K_1
+
+        if 0 <= index < len(items):
+            self.buy_item(player, items[index])
 
     def buy_item(self, player, item):
         """
@@ -5,18 +5,19 @@ Classes:
 - Platform: Represents static platforms in the game.
 - MovingPlatform:
     Subclass of Platform, represents platforms that can slide horizontally or vertically.
+- PlatformGroup:
+    Sprite group of platforms that indexes the static ones in a uniform grid.
 
 Attributes and Methods:
 - Platform:
   Attributes:
   - image: Surface object representing the platform's image.
   - rect: Rect object representing the position and size of the platform.
-  - velocity: Horizontal movement speed of the platform.
-  - direction: Direction of movement ('right' or 'left').
+  - dynamic: Whether the platform moves, so it cannot be kept in the grid of a PlatformGroup.
 
   Methods:
   - __init__(self, x, y, width, height, image_type="main_platform"): Initializes a Platform object.
-  - move_platform(self, direction): Moves the platform horizontally in the specified direction.
+  - draw(self, screen): Draws the platform at its position relative to the camera, unless it is culled.
 
 - MovingPlatform:
   Attributes:
@@ -24,23 +25,41 @@ Attributes and Methods:
   - to: Lower bound for sliding.
   - slide_direction: Direction of sliding ('x' or 'y').
   - slide_velocity: Speed of sliding movement.
+  - prev_rect: Rect before the last simulation step, used for interpolation.
 
   Methods:
   - __init__(self, x, y, width, height, up, to, slide_direction='x', image_type="moving_platform"):
     Initializes a MovingPlatform object.
   - slide(self):
       Slides the platform within specified bounds based on slide_direction.
-  - move_platform(self, direction):
-      Moves the platform horizontally in the specified direction and adjusts slide bounds.
+  - draw(self, screen):
+      Draws the platform interpolated between its last two simulation steps, unless it is culled.
+
+- PlatformGroup:
+  Attributes:
+  - cell_size: Side of a grid cell in world pixels.
+  - cells: Grid cell (column, row) -> set of the static platforms overlapping it.
+  - dynamic: Set of the moving platforms, checked on every query.
+  - order: Platform -> order in which it was added, so queries return platforms in group order.
+  - added: Number of platforms added so far.
+  - bounds: Platform -> grid cell bounds computed beforehand, used once when it is added.
+
+  Methods:
+  - __init__(self, *sprites, cell_size=constants.PLATFORM_GRID_CELL): Initializes an empty grid.
+  - get_bounds(self, rect): Returns the first and last grid columns and rows a rect overlaps.
+  - get_cells(self, rect, bounds=None): Returns the grid cells a rect overlaps.
+  - add_indexed(self, platform, bounds): Adds a static platform whose grid cell bounds are known.
+  - query(self, rect): Returns the platforms colliding with a rect.
 
 This module provides definitions for
 both static and moving platforms used within the game environment,
 allowing for varied platform behaviors and appearances based on specified parameters.
+Platform rects and slide bounds are in world coordinates.
 """
 
 from game.src import constants
 from game.src.cache import ImageCache
-from game.src.screen import screen_obj
+from game.src.camera import camera_obj
 import pygame
 
 # from random import randint
@@ -53,15 +72,16 @@ class Platform(pygame.sprite.Sprite):
     Attributes:
     - image: Surface object representing the platform's image.
     - rect: Rect object representing the position and size of the platform.
-    - velocity: Horizontal movement speed of the platform.
-    - direction: Direction of movement ('right' or 'left').
+    - dynamic: Whether the platform moves, so it cannot be kept in the grid of a PlatformGroup.
 
     Methods:
     - __init__(self, x, y, width, height, image_type="main_platform"): 
         Initializes the Platform object.
-    - move_platform(self, direction): Moves the platform horizontally in the specified direction.
+    - draw(self, screen): Draws the platform at its position relative to the camera, unless it is culled.
     """
 
+    dynamic = False
+
     def __init__(self, x, y, width, height, image_type="main_platform"):
         """
         Initialize the Platform object.
@@ -91,21 +111,15 @@ class Platform(pygame.sprite.Sprite):
         self.rect.x = x
         self.rect.y = y
 
-        self.velocity = constants.VELOCITY * screen_obj.width_scale
-        self.direction = "right"
-
-    def move_platform(self, direction):
+    def draw(self, screen):
         """
-        Move the platform in the specified direction.
+        Draw the platform at its position relative to the camera, unless it is off the screen.
 
-        :param direction: The direction to move the platform.
-        :rtype: object
+        :param screen: The screen surface to draw on.
+        :rtype: None
         """
-        if direction != self.direction:
-            self.velocity *= -1
-            self.direction = direction
-
-        self.rect.x += self.velocity
+        if camera_obj.is_visible(self.rect):
+            screen.blit(self.image, camera_obj.apply(self.rect))
 
 
 class MovingPlatform(Platform):
@@ -117,19 +131,21 @@ class MovingPlatform(Platform):
     - to: Lower bound for sliding.
     - slide_direction: Direction of sliding ('x' or 'y').
     - slide_velocity: Speed of sliding movement.
+    - prev_rect: Rect before the last simulation step, used for interpolation.
 
     Methods:
     - __init__(self, x, y, width, height, up, to, slide_direction='x',
                image_type="moving_platform"):
     Initializes the MovingPlatform object.
     - slide(self): Slides the platform within specified bounds based on slide_direction.
-    - move_platform(self, direction):
-        Moves the platform horizontally in the specified direction and adjusts slide bounds.
+    - draw(self, screen): Draws the platform interpolated between its last two simulation steps.
 
     This docstring provides an overview of the `Platform` class and its `MovingPlatform` subclass,
     describing their attributes and methods for clarity and reference.
     """
 
+    dynamic = True
+
     def __init__(self, x, y, width, height, up, to, slide_direction='x',
                  image_type="moving_platform"):
         """
@@ -151,6 +167,7 @@ class MovingPlatform(Platform):
         self.to = to
         self.slide_direction = slide_direction
         self.slide_velocity = constants.VELOCITY // 2
+        self.prev_rect = self.rect.copy()
 
     def slide(self):
         """
@@ -158,6 +175,8 @@ class MovingPlatform(Platform):
 
         :rtype: None
         """
+        self.prev_rect.topleft = self.rect.topleft
+
         if self.slide_direction == 'x':
             self.rect.x += self.slide_velocity
             if self.rect.right > max(self.to, self.up) or self.rect.left < min(self.up, self.to):
@@ -168,18 +187,15 @@ class MovingPlatform(Platform):
             if self.rect.top > max(self.to, self.up) or self.rect.bottom < min(self.up, self.to):
                 self.slide_velocity *= -1
 
-    def move_platform(self, direction):
+    def draw(self, screen):
         """
-        Move the platform in the specified direction and adjust bounds for sliding.
+        Draw the moving platform interpolated between its last two simulation steps, unless it is off the screen.
 
-        :param direction: The direction to move the platform.
+        :param screen: The screen surface to draw on.
         :rtype: None
         """
-        super().move_platform(direction)
-
-        if self.slide_direction == 'x':
-            self.up += self.velocity
-            self.to += self.velocity
+        if camera_obj.is_visible(self.rect):
+            screen.blit(self.image, camera_obj.apply_interpolated(self.prev_rect, self.rect))
 
     # @staticmethod
     # def grouper_random(levels, group=None):
@@ -197,3 +213,142 @@ class MovingPlatform(Platform):
     #
     #
     #     return platforms
+
+
+class PlatformGroup(pygame.sprite.Group):
+    """
+    A sprite group of platforms that indexes the static platforms in a uniform grid.
+
+    Static platforms are put in every grid cell their rect overlaps when they are added,
+    and moving platforms are kept in a small set. A collision query then only looks at
+    the cells around the queried rect and at the moving platforms.
+
+    Attributes:
+    - cell_size: Side of a grid cell in world pixels.
+    - cells: Grid cell (column, row) -> set of the static platforms overlapping it.
+    - dynamic: Set of the moving platforms, checked on every query.
+    - order: Platform -> order in which it was added, so queries return platforms in group order.
+    - added: Number of platforms added so far.
+    - bounds: Platform -> grid cell bounds computed beforehand, used once when it is added.
+
+    Methods:
+    - __init__(self, *sprites, cell_size=constants.PLATFORM_GRID_CELL): Initializes an empty grid.
+    - get_bounds(self, rect): Returns the first and last grid columns and rows a rect overlaps.
+    - get_cells(self, rect, bounds=None): Returns the grid cells a rect overlaps.
+    - add_indexed(self, platform, bounds): Adds a static platform whose grid cell bounds are known.
+    - query(self, rect): Returns the platforms colliding with a rect.
+    """
+
+    def __init__(self, *sprites, cell_size=constants.PLATFORM_GRID_CELL):
+        """
+        Initialize the PlatformGroup.
+
+        :param sprites: Platforms to add.
+        :param cell_size: Side of a grid cell in world pixels.
+        :rtype: object
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.dynamic = set()
+        self.order = {}
+        self.added = 0
+        self.bounds = {}
+        super().__init__(*sprites)
+
+    def get_bounds(self, rect):
+        """
+        Return the first and last grid columns and rows a rect overlaps.
+
+        :param rect: The rect in world coordinates.
+        :rtype: tuple
+        :return: (left, top, right, bottom) cell bounds, inclusive.
+        """
+        left, top = rect.left // self.cell_size, rect.top // self.cell_size
+        right = max(rect.left, rect.right - 1) // self.cell_size
+        bottom = max(rect.top, rect.bottom - 1) // self.cell_size
+
+        return left, top, right, bottom
+
+    def get_cells(self, rect, bounds=None):
+        """
+        Return the grid cells a rect overlaps.
+
+        :param rect: The rect in world coordinates.
+        :param bounds: The cell bounds of the rect, if they are already known.
+        :rtype: list
+        :return: list of (column, row) tuples.
+        """
+        left, top, right, bottom = bounds or self.get_bounds(rect)
+
+        return [(column, row) for column in range(left, right + 1) for row in range(top, bottom + 1)]
+
+    def add_indexed(self, platform, bounds):
+        """
+        Add a static platform whose grid cell bounds were computed beforehand, such as by the level compiler.
+
+        :param platform: The platform to add.
+        :param bounds: The (left, top, right, bottom) cell bounds of its rect.
+        :rtype: None
+        """
+        self.bounds[platform] = bounds
+        self.add(platform)
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Add a platform to the group and index it.
+        Static platforms must not move while they are in the group.
+
+        :param sprite: The platform to add.
+        :param layer: Unused, kept for the pygame.sprite.Group interface.
+        :rtype: None
+        """
+        super().add_internal(sprite, layer)
+
+        self.order[sprite] = self.added
+        self.added += 1
+
+        if sprite.dynamic:
+            self.dynamic.add(sprite)
+        else:
+            for cell in self.get_cells(sprite.rect, self.bounds.pop(sprite, None)):
+                self.cells.setdefault(cell, set()).add(sprite)
+
+    def remove_internal(self, sprite):
+        """
+        Remove a platform from the group and from the index.
+
+        :param sprite: The platform to remove.
+        :rtype: None
+        """
+        super().remove_internal(sprite)
+
+        del self.order[sprite]
+
+        if sprite.dynamic:
+            self.dynamic.discard(sprite)
+        else:
+            for cell in self.get_cells(sprite.rect):
+                platforms = self.cells.get(cell)
+                if platforms:
+                    platforms.discard(sprite)
+                    if not platforms:
+                        del self.cells[cell]
+
+    def query(self, rect):
+        """
+        Return the platforms colliding with a rect, in the order they were added to the group.
+
+        :param rect: The rect in world coordinates.
+        :rtype: list
+        """
+        found = set()
+        for cell in self.get_cells(rect):
+            for platform in self.cells.get(cell, ()):
+                if platform not in found and platform.rect.colliderect(rect):
+                    found.add(platform)
+
+        for platform in self.dynamic:
+            if platform.rect.colliderect(rect):
+                found.add(platform)
+
+        return sorted(found, key=self.order.__getitem__)
@@ -0,0 +1,169 @@
+"""
+Module: game.src.preloader
+
+This module defines the `AssetPreloader` class, which decodes image files on a
+background thread pool while menus and fades are on screen.
+
+Decoding (file I/O and PNG decompression) runs on worker threads. Finished surfaces are
+handed to `convert_alpha` on the main thread only, by calling `pump()` from the menu loops,
+and are then stored in `ImageCache`, so hero and enemy constructors find them already loaded.
+Frames packed into a texture atlas are loaded as their whole atlas, which `ImageCache` counts
+and evicts like any other source image.
+When the disk cache of `ImageCache` is on, sources whose scaled images were stored by an earlier
+launch are skipped, as the cache reads those images back without decoding the source.
+
+Attributes:
+- LEVEL_ASSETS (tuple): Directories with the images of the level and NPCs.
+- ENEMY_ASSETS (tuple): Directories with the images of the enemies, the boss and its fireballs.
+- preloader_obj (AssetPreloader): The shared preloader used by the menus.
+
+Classes:
+- AssetPreloader:
+    Decodes images in the background and reports the loading progress.
+
+    Methods:
+    - preload(directories):
+        Start decoding every PNG file in the directories.
+    - pump():
+        Move finished surfaces into the caches. Must be called from the main thread.
+        Images that fail to decode are dropped and loaded on demand by ImageCache instead.
+    - finish():
+        Wait for all pending images and pump them.
+    - is_busy():
+        Return whether any image is still pending.
+    - progress():
+        Return the loaded fraction of the requested images.
+
+Usage:
+from game.src.preloader import preloader_obj, LEVEL_ASSETS
+
+preloader_obj.preload(LEVEL_ASSETS)
+while preloader_obj.is_busy():
+    preloader_obj.pump()
+    draw_progress(preloader_obj.progress())
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from game.src import constants
+from game.src.atlas import TextureAtlas, collect_frames
+from game.src.cache import ImageCache
+import pygame
+
+LEVEL_ASSETS = ("image/locations", "image/npc")
+ENEMY_ASSETS = ("image/enemys/satyr", "image/enemys/sculwolf", "image/enemys/ramses_snail",
+                "image/enemys/boss", "image/enemys/fireball")
+
+
+class AssetPreloader:
+    """
+        A class that decodes images on a thread pool and hands them to the caches
+        on the main thread.
+
+        Attributes:
+            executor (ThreadPoolExecutor): Worker threads that decode the files.
+            pending (dict): File path -> future decoding it, for images not yet pumped.
+            total (int): Number of images requested since the preloader was last idle.
+            loaded (int): Number of those images already stored in the caches.
+
+        Methods:
+            preload(directories): Start decoding every PNG file in the directories.
+            pump(): Move finished surfaces into the caches.
+            finish(): Wait for all pending images and pump them.
+            is_busy(): Return whether any image is still pending.
+            progress(): Return the loaded fraction of the requested images.
+        """
+
+    def __init__(self, max_workers=constants.PRELOADER_WORKERS):
+        """
+        Initialize the AssetPreloader.
+
+        :param max_workers: Number of decoding threads.
+        :rtype: object
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preloader")
+        self.pending = {}
+        self.total = 0
+        self.loaded = 0
+
+    def preload(self, directories):
+        """
+        Start decoding every PNG file in the directories.
+        Frames packed into a texture atlas are loaded as their whole atlas. Sources whose scaled images
+        are already in the disk cache of ImageCache are not decoded, as the cache reads those images back.
+
+        :param directories: Iterable of directories to preload.
+        :rtype: None
+        """
+        if not self.pending:
+            self.total = 0
+            self.loaded = 0
+
+        checked = set()
+
+        for directory in directories:
+            for path in collect_frames(directory):
+                path = TextureAtlas.get_atlas_path(path) or path
+
+                if path in checked or path in ImageCache.cache or path in self.pending:
+                    continue
+
+                checked.add(path)
+                if ImageCache.is_on_disk(path):
+                    continue
+
+                self.pending[path] = self.executor.submit(pygame.image.load, path)
+                self.total += 1
+
+    def pump(self):
+        """
+        Convert the finished surfaces and store them in the caches.
+        Must be called from the main thread.
+
+        :rtype: None
+        """
+        for path, future in list(self.pending.items()):
+            if not future.done():
+                continue
+
+            del self.pending[path]
+            self.loaded += 1
+
+            try:
+                image = future.result()
+            except (pygame.error, OSError):
+                # Left to ImageCache.load_image, which loads the file on demand.
+                continue
+
+            if path not in ImageCache.cache:
+                ImageCache.store("cache", path, image.convert_alpha())
+
+    def finish(self):
+        """
+        Wait for all pending images and store them in the caches.
+
+        :rtype: None
+        """
+        wait(list(self.pending.values()))
+        self.pump()
+
+    def is_busy(self):
+        """
+        Return whether any requested image has not been stored yet.
+
+        :rtype: bool
+        """
+        return bool(self.pending)
+
+    def progress(self):
+        """
+        Return the loaded fraction of the images requested since the preloader was last idle.
+
+        :rtype: float
+        :return: value from 0 to 1.
+        """
+        if not self.total:
+            return 1
+        return self.loaded / self.total
+
+
+preloader_obj = AssetPreloader()
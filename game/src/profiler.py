@@ -0,0 +1,269 @@
+"""
+Module: game.src.profiler
+
+This module defines the `FrameProfiler` class, which measures how long each phase of a frame
+takes: background, platforms, enemies, the player, collisions, the UI and so on.
+
+The game loop calls `begin_frame()` and `end_frame()` around every frame, and `mark(name)` after
+each phase. A mark adds the time since the previous mark to the named section, so sections cost
+one clock read each. Counters such as the number of drawn objects or enemies are stored with
+`count(name, value)`. While the profiler is disabled, every method returns at once.
+
+In the game, F3 toggles an overlay with the frame time, FPS, section times and counters, averaged
+over the last constants.PROFILER_OVERLAY_FRAMES frames. The profiler keeps collecting while the
+overlay is shown, and F4 exports the rolling log of the last constants.PROFILER_HISTORY frames to
+constants.PROFILER_CSV_PATH.
+
+Attributes:
+- profiler_obj (FrameProfiler): The shared profiler used by the game loop.
+
+Classes:
+- FrameProfiler:
+    Collects per-section timings of the last frames.
+
+    Methods:
+    - enable(history=constants.PROFILER_HISTORY):
+        Start collecting timings, keeping the given number of frames.
+    - disable():
+        Stop collecting timings.
+    - begin_frame():
+        Start timing a frame.
+    - mark(name):
+        Add the time since the previous mark to a section.
+    - count(name, value):
+        Store a counter of the frame.
+    - end_frame():
+        Store the timings of the frame.
+    - get_frames():
+        Return the stored frames.
+    - get_averages(frames):
+        Return the mean of every column over the last frames.
+    - toggle_overlay():
+        Show or hide the overlay, enabling the profiler while it is shown.
+    - draw_overlay(screen, fps):
+        Draw the overlay.
+    - export_csv(path=constants.PROFILER_CSV_PATH):
+        Write the stored frames to a CSV file.
+
+Usage:
+from game.src.profiler import profiler_obj
+
+profiler_obj.enable()
+profiler_obj.begin_frame()
+draw_background(screen)
+profiler_obj.mark("background")
+profiler_obj.end_frame()
+"""
+
+from collections import deque
+import csv
+import time
+from game.src import constants
+import pygame
+
+
+class FrameProfiler:
+    """
+        A class collecting per-section timings of the last frames.
+
+        Attributes:
+            enabled (bool): Whether timings are collected.
+            frames (deque): Timings of the last frames, as dicts of section -> milliseconds.
+                The "frame" key holds the time of the whole frame.
+            sections (dict): Section -> seconds of the current frame.
+            counters (dict): Counter -> value of the current frame.
+            counter_names (set): Names of all counters stored so far, to tell them from sections.
+            frame_start (float): Clock value when the current frame began.
+            last_mark (float): Clock value of the previous mark.
+            overlay (bool): Whether the overlay is shown.
+            font (pygame.font.Font or None): Font of the overlay, created when it is first shown.
+
+        Methods:
+            enable(history): Start collecting timings.
+            disable(): Stop collecting timings.
+            begin_frame(): Start timing a frame.
+            mark(name): Add the time since the previous mark to a section.
+            count(name, value): Store a counter of the frame.
+            end_frame(): Store the timings of the frame.
+            get_frames(): Return the stored frames.
+            get_averages(frames): Return the mean of every column over the last frames.
+            toggle_overlay(): Show or hide the overlay.
+            draw_overlay(screen, fps): Draw the overlay.
+            export_csv(path): Write the stored frames to a CSV file.
+        """
+
+    def __init__(self):
+        """
+        Initialize the FrameProfiler, disabled.
+
+        :rtype: object
+        """
+        self.enabled = False
+        self.frames = deque(maxlen=constants.PROFILER_HISTORY)
+        self.sections = {}
+        self.counters = {}
+        self.counter_names = set()
+        self.frame_start = 0
+        self.last_mark = 0
+        self.overlay = False
+        self.font = None
+
+    def enable(self, history=constants.PROFILER_HISTORY):
+        """
+        Start collecting timings. Previously stored frames are dropped.
+
+        :param history: Number of frames to keep, or None to keep all of them.
+        :rtype: None
+        """
+        self.enabled = True
+        self.frames = deque(maxlen=history)
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.sections = {}
+        self.counters = {}
+
+    def disable(self):
+        """
+        Stop collecting timings. Stored frames are kept.
+
+        :rtype: None
+        """
+        self.enabled = False
+
+    def begin_frame(self):
+        """
+        Start timing a frame.
+
+        :rtype: None
+        """
+        if not self.enabled:
+            return
+
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.sections = {}
+        self.counters = {}
+
+    def mark(self, name):
+        """
+        Add the time since the previous mark (or the start of the frame) to a section.
+
+        :param name: The name of the section that has just finished.
+        :rtype: None
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        self.sections[name] = self.sections.get(name, 0) + now - self.last_mark
+        self.last_mark = now
+
+    def count(self, name, value):
+        """
+        Store a counter of the current frame, such as the number of drawn objects.
+
+        :param name: The name of the counter.
+        :param value: The value of the counter.
+        :rtype: None
+        """
+        if not self.enabled:
+            return
+
+        self.counters[name] = value
+        self.counter_names.add(name)
+
+    def end_frame(self):
+        """
+        Store the timings of the frame in milliseconds, together with its counters.
+
+        :rtype: None
+        """
+        if not self.enabled:
+            return
+
+        frame = {name: seconds * 1000 for name, seconds in self.sections.items()}
+        frame["frame"] = (time.perf_counter() - self.frame_start) * 1000
+        frame.update(self.counters)
+        self.frames.append(frame)
+
+    def get_frames(self):
+        """
+        Return the stored frames, from the oldest to the newest.
+
+        :rtype: list
+        :return: list of dicts of section -> milliseconds.
+        """
+        return list(self.frames)
+
+    def get_averages(self, frames=constants.PROFILER_OVERLAY_FRAMES):
+        """
+        Return the mean of every section and counter over the last frames.
+        A column missing from a frame counts as 0 in it.
+
+        :param frames: The number of frames to average.
+        :rtype: dict
+        """
+        last = list(self.frames)[-frames:]
+        totals = {}
+        for frame in last:
+            for name, value in frame.items():
+                totals[name] = totals.get(name, 0) + value
+
+        return {name: total / len(last) for name, total in totals.items()}
+
+    def toggle_overlay(self):
+        """
+        Show or hide the overlay. The profiler is enabled while the overlay is shown.
+
+        :rtype: None
+        """
+        self.overlay = not self.overlay
+
+        if self.overlay:
+            self.enable()
+        else:
+            self.disable()
+
+    def draw_overlay(self, screen, fps):
+        """
+        Draw the frame time, FPS, section times and counters in the top right corner of the screen.
+
+        :param screen: The screen surface to draw on.
+        :param fps: The frame rate measured by the game clock.
+        :rtype: None
+        """
+        if not self.font:
+            self.font = pygame.font.Font(None, 20)
+
+        averages = self.get_averages()
+        lines = [f"FPS {fps:.0f}   frame {averages.get('frame', 0):.2f} ms"]
+        lines += [f"{name} {value:.2f} ms" for name, value in sorted(averages.items())
+                  if name != "frame" and name not in self.counter_names]
+        lines += [f"{name} {value:.0f}" for name, value in sorted(averages.items())
+                  if name in self.counter_names]
+
+        line_height = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 10
+        panel = pygame.Surface((width, line_height * len(lines) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+
+        for i, line in enumerate(lines):
+            panel.blit(self.font.render(line, True, (255, 255, 255)), (5, 5 + i * line_height))
+
+        screen.blit(panel, (screen.get_width() - width - 10, 10))
+
+    def export_csv(self, path=constants.PROFILER_CSV_PATH):
+        """
+        Write the stored frames to a CSV file, one row per frame, oldest first.
+
+        :param path: The path of the CSV file.
+        :rtype: None
+        """
+        frames = list(self.frames)
+        columns = sorted({name for frame in frames for name in frame} - {"frame"})
+
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, ["frame"] + columns, restval=0)
+            writer.writeheader()
+            writer.writerows(frames)
+
+
+profiler_obj = FrameProfiler()
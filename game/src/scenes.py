@@ -0,0 +1,561 @@
+"""
+Module: game.src.scenes
+
+This module defines the scene stack that runs the whole game from a single top-level loop.
+
+Every screen of the game is a `Scene`: the menus, the character selector, the game itself and the
+pause, defeat and shop overlays. The `SceneManager` keeps the scenes in a stack. Each frame it
+reads the events once, passes them to the top scene, advances the top scene (and the scenes below
+it that keep running under an overlay), draws the visible scenes and presents the frame once,
+ticking its single clock. Opening a menu pushes its scene and going back pops it, so no transition
+nests another event loop, and scenes are kept and reused instead of being rebuilt.
+
+When every running scene is idle (a menu waiting for input), the manager sleeps in
+pygame.event.wait instead of polling, and skips drawing frames in which nothing changed.
+
+Classes:
+- Scene:
+    Base class of all scenes, doing nothing by default.
+- SceneManager:
+    Stack of scenes driven by one loop and one clock.
+- PauseScene:
+    Pause or defeat overlay of a game, with its label and buttons.
+- ShopScene:
+    Shop overlay of a game, while the game keeps running below it.
+
+Functions:
+- show_cursor(image):
+    Show an image as a hardware cursor where supported.
+
+Usage:
+from game.src.scenes import SceneManager
+
+manager = SceneManager()
+manager.push(MainMenu())
+manager.run()
+"""
+
+import sys
+from game.src import constants
+from game.src.button import Button
+from game.src.labels import Label
+from game.src.preloader import preloader_obj
+from game.src.profiler import profiler_obj
+from game.src.screen import screen_obj
+import pygame
+
+
+def show_cursor(image):
+    """
+    Show an image as a hardware cursor, which the system draws without the scene being redrawn.
+    Where hardware cursors are not supported (such as the headless dummy driver), the system cursor
+    is hidden and the scene has to blit the image itself.
+
+    :param image: The cursor image.
+    :rtype: bool
+    :return: Whether the hardware cursor is used.
+    """
+    try:
+        pygame.mouse.set_cursor(pygame.cursors.Cursor((0, 0), image))
+    except pygame.error:
+        pygame.mouse.set_visible(False)
+        return False
+
+    pygame.mouse.set_visible(True)
+    return True
+
+
+class Scene:
+    """
+        Base class of the scenes run by a SceneManager. Every method does nothing by default.
+
+        Attributes:
+            overlay (bool): Whether the scene is drawn over the scene below it instead of hiding it.
+            updates_below (bool): Whether the scene below keeps being advanced while this one is on top.
+
+        Methods:
+            enter(manager): Called when the scene is pushed.
+            exit(manager): Called when the scene is popped.
+            resume(manager, scene): Called when the scene is on top again after a scene above was popped.
+            handle_event(event, manager): Handle an event while the scene is on top.
+            advance(manager, dt): Advance the scene by one frame.
+            render(screen): Draw the scene.
+            is_idle(): Return whether the scene only changes on events.
+            needs_redraw(): Return whether the scene has to be drawn this frame.
+        """
+
+    overlay = False
+    updates_below = False
+
+    def enter(self, manager):
+        """
+        Called when the scene is pushed onto the stack.
+
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+
+    def exit(self, manager):
+        """
+        Called when the scene is popped from the stack.
+
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+
+    def resume(self, manager, scene):
+        """
+        Called when the scene is on top of the stack again.
+
+        :param manager: The SceneManager.
+        :param scene: The scene that was popped from above this one.
+        :rtype: None
+        """
+
+    def handle_event(self, event, manager):
+        """
+        Handle an event while the scene is on top of the stack.
+
+        :param event: The Pygame event.
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+
+    def advance(self, manager, dt):
+        """
+        Advance the scene by one frame.
+
+        :param manager: The SceneManager.
+        :param dt: Milliseconds since the previous frame, 0 on the first frame after the stack changed.
+        :rtype: None
+        """
+
+    def render(self, screen):
+        """
+        Draw the scene.
+
+        :param screen: The screen surface to draw on.
+        :rtype: None
+        """
+
+    def is_idle(self):
+        """
+        Return whether the scene only changes on events, so the loop may sleep until the next event.
+
+        :rtype: bool
+        """
+        return False
+
+    def needs_redraw(self):
+        """
+        Return whether the scene has changed since it was last drawn.
+
+        :rtype: bool
+        """
+        return True
+
+
+class SceneManager:
+    """
+        A stack of scenes driven by one loop and one clock.
+
+        Attributes:
+            stack (list): The scenes, the top scene last.
+            clock (pygame.time.Clock): The clock limiting the frame rate of every scene.
+            changed (bool): Whether the stack changed during the current frame.
+
+        Methods:
+            top(): Return the top scene.
+            push(scene): Push a scene onto the stack.
+            pop(): Pop the top scene.
+            replace(scene): Replace the top scene with another one.
+            pop_to(scene): Pop the scenes above a scene.
+            get_active(): Return the scenes advanced this frame.
+            get_visible(): Return the scenes drawn this frame.
+            handle_events(events): Pass events to the top scene.
+            render(screen): Draw the visible scenes.
+            run(screen=None): Run the loop until the stack is empty.
+        """
+
+    def __init__(self):
+        """
+        Initialize an empty SceneManager.
+
+        :rtype: object
+        """
+        self.stack = []
+        self.clock = pygame.time.Clock()
+        self.changed = False
+
+    def top(self):
+        """
+        Return the top scene, or None if the stack is empty.
+
+        :rtype: Scene or None
+        """
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        """
+        Push a scene onto the stack and enter it.
+
+        :param scene: The scene.
+        :rtype: None
+        """
+        self.stack.append(scene)
+        self.changed = True
+        scene.enter(self)
+
+    def pop(self):
+        """
+        Pop the top scene, exit it and resume the scene below it.
+
+        :rtype: Scene
+        :return: the popped scene.
+        """
+        scene = self.stack.pop()
+        self.changed = True
+        scene.exit(self)
+
+        if self.stack:
+            self.stack[-1].resume(self, scene)
+
+        return scene
+
+    def replace(self, scene):
+        """
+        Replace the top scene with another one, without resuming the scene below.
+
+        :param scene: The new top scene.
+        :rtype: None
+        """
+        self.stack.pop().exit(self)
+        self.push(scene)
+
+    def pop_to(self, scene):
+        """
+        Pop every scene above a scene, so that it is on top.
+
+        :param scene: A scene on the stack.
+        :rtype: None
+        """
+        while self.stack[-1] is not scene:
+            self.pop()
+
+    def get_active(self):
+        """
+        Return the scenes advanced this frame: the top scene and,
+        while a scene lets the one below keep running, the scenes below it.
+
+        :rtype: list
+        """
+        active = []
+        for scene in reversed(self.stack):
+            active.append(scene)
+            if not scene.updates_below:
+                break
+
+        return active
+
+    def get_visible(self):
+        """
+        Return the scenes drawn this frame, from the bottom one: the top scene and the scenes
+        below it down to the first one that is not an overlay.
+
+        :rtype: list
+        """
+        start = len(self.stack) - 1
+        while start > 0 and self.stack[start].overlay:
+            start -= 1
+
+        return self.stack[start:]
+
+    def handle_events(self, events):
+        """
+        Pass events to the top scene. Quitting the window exits the game from any scene.
+
+        :param events: The list of events.
+        :rtype: None
+        """
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            if event.type != pygame.NOEVENT and self.stack:
+                self.stack[-1].handle_event(event, self)
+
+    def render(self, screen):
+        """
+        Draw the visible scenes, unless none of them changed.
+
+        :param screen: The screen surface to draw on.
+        :rtype: bool
+        :return: Whether anything was drawn.
+        """
+        visible = self.get_visible()
+        if not any(scene.needs_redraw() for scene in visible):
+            return False
+
+        for scene in visible:
+            scene.render(screen)
+
+        return True
+
+    def run(self, screen=None):
+        """
+        Run the loop until the stack is empty.
+
+        While every active scene is idle, the loop sleeps in pygame.event.wait for at most
+        constants.MENU_WAIT_TIMEOUT milliseconds, or one frame while the preloader is busy.
+
+        :param screen: The screen surface to draw on, or None for screen_obj.screen,
+            which follows resolution changes.
+        :rtype: None
+        """
+        dt = 0
+        self.clock.tick()
+
+        while self.stack:
+            profiler_obj.begin_frame()
+            self.changed = False
+            preloader_obj.pump()
+
+            if all(scene.is_idle() for scene in self.get_active()):
+                timeout = 1000 // constants.MAX_FPS if preloader_obj.is_busy() else constants.MENU_WAIT_TIMEOUT
+                events = [pygame.event.wait(timeout)] + pygame.event.get()
+            else:
+                events = pygame.event.get()
+
+            self.handle_events(events)
+            profiler_obj.mark("events")
+
+            for scene in self.get_active():
+                scene.advance(self, 0 if self.changed else dt)
+
+            if not self.stack:
+                break
+
+            if self.render(screen or screen_obj.screen):
+                pygame.display.flip()
+                profiler_obj.mark("present")
+            profiler_obj.end_frame()
+
+            dt = self.clock.tick(constants.MAX_FPS)
+
+
+class PauseScene(Scene):
+    """
+        The pause or defeat overlay of a game.
+
+        Both show a label, a button returning to the main menu, and either a button continuing the
+        game (pause) or a button restarting it in place (defeat). The game is drawn below the
+        overlay but is not advanced.
+
+        Attributes:
+            game (GameOn): The game the overlay belongs to.
+            defeat (bool): Whether this is the defeat overlay.
+            label (Label): The 'Pause' or 'You Lose!' label.
+            action_button (Button): The Continue or Restart button.
+            menu_button (Button): The button returning to the main menu.
+            buttons (list): Both buttons.
+            hardware_cursor (bool): Whether the cursor is a hardware cursor.
+            redraw (bool): Whether the overlay has changed since it was last drawn.
+
+        Methods:
+            enter(manager): Stop the game's music and show the cursor.
+            exit(manager): Hide the cursor again.
+            handle_event(event, manager): Handle the buttons.
+            advance(manager, dt): Update the hover state of the buttons.
+            render(screen): Draw the label, the buttons and the cursor.
+        """
+
+    overlay = True
+
+    def __init__(self, game, defeat=False):
+        """
+        Initialize the PauseScene.
+
+        :param game: The game the overlay belongs to.
+        :param defeat: Whether this is the defeat overlay.
+        :rtype: object
+        """
+        self.game = game
+        self.defeat = defeat
+        self.label = Label(screen_obj.width, screen_obj.height, None, 72, 'You Lose!' if defeat else 'Pause',
+                           (193, 196, 199), "image/UI/Panel/Window/Medium.png")
+
+        self.action_button = Button((screen_obj.width - 450) / 2, screen_obj.height / 2, 200, 100,
+                                    "image/UI/Buttons/PlayText/Default@3x.png", "Restart" if defeat else "Continue",
+                                    "image/UI/Buttons/PlayText/Hover@3x.png", "sound/knopka-schelchok.mp3")
+        self.menu_button = Button((screen_obj.width + 50) / 2, screen_obj.height / 2, 200, 100,
+                                  "image/UI/Buttons/PlayText/Default@3x.png",
+                                  "Menu", "image/UI/Buttons/PlayText/Hover@3x.png", "sound/knopka-schelchok.mp3")
+        self.buttons = [self.action_button, self.menu_button]
+
+        self.hardware_cursor = False
+        self.redraw = True
+
+    def enter(self, manager):
+        """
+        Stop the game's music, pause the game and show the cursor.
+
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+        self.game.main_location.sound.stop()
+        self.game.pause = not self.defeat
+        self.hardware_cursor = show_cursor(self.label.cursor)
+        self.redraw = True
+
+    def exit(self, manager):
+        """
+        Hide the cursor again for the game.
+
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+        pygame.mouse.set_visible(False)
+
+    def handle_event(self, event, manager):
+        """
+        Continue the game, restart it in place or leave it for the main menu.
+
+        :param event: The Pygame event.
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+        if event.type == pygame.USEREVENT:
+            if event.button == self.action_button and not self.defeat:
+                self.game.main_location.sound.play()
+                self.game.pause = False
+                manager.pop()
+
+            elif event.button == self.action_button:
+                self.game.reset()
+                self.game.main_location.sound.play(-1)
+                manager.pop()
+
+            elif event.button == self.menu_button:
+                manager.pop_to(self.game)
+                manager.pop()
+
+        elif event.type == pygame.MOUSEMOTION and not self.hardware_cursor:
+            self.redraw = True
+
+        for btn in self.buttons:
+            btn.handle_event(event)
+
+    def advance(self, manager, dt):
+        """
+        Update the hover state of the buttons.
+
+        :param manager: The SceneManager.
+        :param dt: Milliseconds since the previous frame.
+        :rtype: None
+        """
+        for btn in self.buttons:
+            was_hovered = btn.is_hovered
+            btn.check_hover(pygame.mouse.get_pos())
+            self.redraw = self.redraw or btn.is_hovered != was_hovered
+
+    def render(self, screen):
+        """
+        Draw the label, the buttons and, without a hardware cursor, the cursor.
+
+        :param screen: The screen surface to draw on.
+        :rtype: None
+        """
+        self.label.draw(screen)
+        for btn in self.buttons:
+            btn.draw(screen)
+
+        if not self.hardware_cursor:
+            self.label.draw_cursor(screen)
+
+        self.redraw = False
+        profiler_obj.mark("ui")
+
+    def is_idle(self):
+        """
+        Return True, the overlay only changes on events.
+
+        :rtype: bool
+        """
+        return True
+
+    def needs_redraw(self):
+        """
+        Return whether the hover state of a button changed or the cursor moved.
+
+        :rtype: bool
+        """
+        return self.redraw
+
+
+class ShopScene(Scene):
+    """
+        The shop overlay of a game. The game keeps running and is drawn below it.
+
+        E closes the shop, number keys buy its items, and every other event is passed to the game.
+        The shop also closes when the player walks away from the NPC.
+
+        Attributes:
+            game (GameOn): The game the overlay belongs to.
+            npc (Npc or None): The NPC whose shop is open.
+
+        Methods:
+            handle_event(event, manager): Buy items, close the shop or pass the event to the game.
+            advance(manager, dt): Close the shop once the player has walked away.
+            render(screen): Draw the shop.
+        """
+
+    overlay = True
+    updates_below = True
+
+    def __init__(self, game):
+        """
+        Initialize the ShopScene.
+
+        :param game: The game the overlay belongs to.
+        :rtype: object
+        """
+        self.game = game
+        self.npc = None
+
+    def handle_event(self, event, manager):
+        """
+        Close the shop on E, buy the item of a number key, and pass other events to the game.
+
+        :param event: The Pygame event.
+        :param manager: The SceneManager.
+        :rtype: None
+        """
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_e:
+            manager.pop()
+        elif event.type == pygame.KEYDOWN and pygame.K_1 <= event.key <= pygame.K_9:
+            self.npc.handle_shop_key(event.key, self.game.player)
+        else:
+            self.game.handle_event(event, manager)
+
+    def advance(self, manager, dt):
+        """
+        Close the shop once the player no longer touches the NPC.
+        The game below is advanced by the manager after this scene.
+
+        :param manager: The SceneManager.
+        :param dt: Milliseconds since the previous frame.
+        :rtype: None
+        """
+        if manager.top() is self and not pygame.sprite.collide_rect(self.game.player, self.npc):
+            manager.pop()
+
+    def render(self, screen):
+        """
+        Draw the shop.
+
+        :param screen: The screen surface to draw on.
+        :rtype: None
+        """
+        self.npc.draw_shop(screen)
+        profiler_obj.mark("ui")
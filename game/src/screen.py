@@ -10,22 +10,36 @@ Attributes:
 - height: Height of the screen.
 - width_scale: Scaling factor for width relative to a default width of 960.
 - height_scale: Scaling factor for height relative to a default height of 600.
-- screen: Pygame display surface representing the game screen.
+- headless: Whether the game runs without a window (constants.HEADLESS).
+- screen: Pygame display surface representing the game screen, or an off-screen surface in headless mode.
 
 Methods:
 - __init__(self):
     Initializes the Screen object with default width, height, and creates a Pygame display surface.
 - change_screen_size(self, width, height):
     Changes the size of the screen and adjusts scaling factors accordingly.
+- create_surface(self, width, height, flags=0):
+    Creates the surface the game is drawn on.
 
 Usage:
 Create an instance of Screen using Screen() to manage and adjust the game screen size and scaling.
 
+Headless mode:
+When constants.HEADLESS is set, SDL uses its dummy video and audio drivers, so no window or sound
+card is needed. A 1x1 display mode is still set, because convert and convert_alpha need one, and
+the game is drawn on an off-screen surface of the full size.
+
 Note: Requires the pygame library for display management.
 """
 
+import os
+from game.src import constants
 import pygame
 
+if constants.HEADLESS:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
 
 class Screen:
     """
@@ -36,13 +50,16 @@ class Screen:
     - height: Height of the screen.
     - width_scale: Scaling factor for width relative to a default width of 960.
     - height_scale: Scaling factor for height relative to a default height of 600.
-    - screen: Pygame display surface representing the game screen.
+    - headless: Whether the game runs without a window (constants.HEADLESS).
+    - screen: Pygame display surface representing the game screen, or an off-screen surface in headless mode.
 
     Methods:
     - __init__(self): Initializes the Screen object with default width, height,
     and creates a Pygame display surface.
     - change_screen_size(self, width, height):
         Changes the size of the screen and adjusts scaling factors accordingly.
+    - create_surface(self, width, height, flags=0):
+        Creates the surface the game is drawn on.
     """
 
     def __init__(self):
@@ -55,7 +72,8 @@ class Screen:
         self.height = 600
         self.width_scale = 1
         self.height_scale = 1
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        self.headless = constants.HEADLESS
+        self.screen = self.create_surface(self.width, self.height)
 
     def change_screen_size(self, width, height):
         """
@@ -75,9 +93,25 @@ class Screen:
             self.height_scale = 1
 
         if width == 1920 and height == 1080:
-            self.screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
+            self.screen = self.create_surface(width, height, pygame.FULLSCREEN)
         else:
-            self.screen = pygame.display.set_mode((width, height))
+            self.screen = self.create_surface(width, height)
+
+    def create_surface(self, width, height, flags=0):
+        """
+        Create the surface the game is drawn on.
+        In headless mode it is an off-screen surface, and the display mode is only 1x1.
+
+        :param width: The width of the surface.
+        :param height: The height of the surface.
+        :param flags: Display flags, such as pygame.FULLSCREEN. Ignored in headless mode.
+        :rtype: pygame.Surface
+        """
+        if self.headless:
+            pygame.display.set_mode((1, 1))
+            return pygame.Surface((width, height))
+
+        return pygame.display.set_mode((width, height), flags)
 
 
 screen_obj = Screen()
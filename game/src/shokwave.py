@@ -1,25 +1,52 @@
 """
-A class representing a shockwave sprite in a Pygame-based game.
+A class representing a shockwave sprite in a Pygame-based game, and a pool that recycles them.
 
-Attributes:
+Shockwaves are the boss's fireballs and the Leaf Ranger's arrows. They are created through a
+`ShockwavePool`, a sprite group that keeps the shockwaves that left it and reuses them for the
+next shots, and that refuses new shots while it holds constants.MAX_PROJECTILES live ones.
+The frames of each type are resolved once per resolution and shared by all shockwaves.
+
+Classes:
+- Shockwave: A projectile.
+- ShockwavePool: A sprite group of shockwaves that recycles them.
+
+Attributes (Shockwave):
+- animation_paths: Type of image -> list of frame paths.
+- animation_sets: (type of image, screen width scale, screen height scale) -> shared frames.
 - velocity: A vector indicating the movement speed and direction of the shockwave.
 - damage_dealt: Boolean indicating if damage has already been dealt by the shockwave.
 - direction: Direction of the shockwave (1 for right, -1 for left).
 - animation_count: Counter for animation frames of the shockwave.
+- position: World position of the image of the shockwave.
+- prev_position: Position before the last simulation step, used for interpolation.
 
-Methods:
+Methods (Shockwave):
 - __init__(self, x, y, dx, dy, direction=1, type_image="fireball"):
     Initializes the shockwave with given parameters.
+- get_images(type_image): Returns the shared frames of a type of image.
+- clear_animation_sets(): Drops the shared frames of every type of image.
+- reset(self, x, y, dx, dy, direction=1, type_image="fireball"):
+    Places the shockwave at a new start, so it can be reused.
 - draw(self, screen): Draws the shockwave on the specified screen surface.
-- update(self, screen, sprites, game, damage_to="player"):
-    Updates the position of the shockwave and checks for collisions.
-- move_sprite(self, direction): Moves the shockwave sprite in the specified direction.
+- update(self, sprites, game, damage_to="player"):
+    Updates the position and animation frame of the shockwave and checks for collisions.
 - deal_damage_player(self, player): Deals damage to the player if collision occurs.
-- deal_damage_enemy(self, enemies): Deals damage to enemies if collision occurs.
+- deal_damage_enemy(self, broadphase): Deals damage to enemies if collision occurs.
+
+Methods (ShockwavePool):
+- __init__(self, cap=constants.MAX_PROJECTILES): Initializes an empty pool.
+- spawn(self, x, y, dx, dy, direction=1, type_image="fireball"):
+    Adds a recycled or new shockwave to the group, unless the cap is reached.
+
+Usage:
+fireballs = ShockwavePool()
+fireballs.spawn(x, y, 5, 0, direction, "fireball")
+fireballs.update(fireballs, game)
 """
 
 from game.src import constants
 from game.src.cache import ImageCache
+from game.src.camera import camera_obj
 from game.src.screen import screen_obj
 
 import pygame
@@ -30,27 +57,41 @@ class Shockwave(pygame.sprite.Sprite):
     A class representing a shockwave sprite in a Pygame-based game.
 
     Attributes:
+    - animation_paths: Type of image -> list of frame paths.
+    - animation_sets: (type of image, screen width scale, screen height scale) -> shared frames.
     - velocity: A vector indicating the movement speed and direction of the shockwave.
     - damage_dealt: Boolean indicating if damage has already been dealt by the shockwave.
     - direction: Direction of the shockwave (1 for right, -1 for left).
     - animation_count: Counter for animation frames of the shockwave.
+    - position: World position of the image of the shockwave.
+    - prev_position: Position before the last simulation step, used for interpolation.
 
     Methods:
     - __init__(self, x, y, dx, dy, direction=1, type_image="fireball"):
         Initializes the shockwave with given parameters.
+    - get_images(type_image): Returns the shared frames of a type of image.
+    - clear_animation_sets(): Drops the shared frames of every type of image.
+- clear_animation_sets(): Drops the shared frames of every type of image.
+    - reset(self, x, y, dx, dy, direction=1, type_image="fireball"):
+        Places the shockwave at a new start, so it can be reused.
     - draw(self, screen): Draws the shockwave on the specified screen surface.
-    - update(self, screen, sprites, game, damage_to="player"):
-        Updates the position of the shockwave and checks for collisions.
-    - move_sprite(self, direction): Moves the shockwave sprite in the specified direction.
+    - update(self, sprites, game, damage_to="player"):
+        Updates the position and animation frame of the shockwave and checks for collisions.
     - deal_damage_player(self, player): Deals damage to the player if collision occurs.
-    - deal_damage_enemy(self, enemies): Deals damage to enemies if collision occurs.
+    - deal_damage_enemy(self, broadphase): Deals damage to enemies if collision occurs.
     """
 
+    animation_paths = {
+        "fireball": [f"image/enemys/fireball/1_{i}.png" for i in range(61)],
+        "arrow": ["image/Heros/leaf_ranger/arrow/arrow_.png"],
+    }
+    animation_sets = {}
+
     def __init__(self, x, y, dx, dy, direction=1, type_image="fireball"):
         """
         Initialize the Shockwave object.
 
-        :param x: Initial x-coordinate of the shockwave.
+        :param x: Initial world x-coordinate of the shockwave.
         :param y: Initial y-coordinate of the shockwave.
         :param dx: Change in x-coordinate per update.
         :param dy: Change in y-coordinate per update.
@@ -58,54 +99,85 @@ class Shockwave(pygame.sprite.Sprite):
         :param type_image: Type of image for the shockwave ("fireball" or other).
         """
         super().__init__()
-        self.velocity = pygame.Vector2(direction * dx, dy)
-        self.damage_dealt = False
-        self.direction = direction
-        self.animation_count = 0
+        self.velocity = pygame.Vector2()
+        self.position = [0, 0]
+        self.prev_position = [0, 0]
+        self.image_rect = pygame.Rect(0, 0, 0, 0)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, dx, dy, direction, type_image)
 
-        if type_image == "fireball":
-            image_paths = [f"image/enemys/fireball/1_{i}.png" for i in range(61)]
-        else:
-            image_paths = ["image/Heros/leaf_ranger/arrow/arrow_.png"]
+    @staticmethod
+    def get_images(type_image):
+        """
+        Return the frames of a type of image, loading them once per resolution.
 
-        self.images = ImageCache.get_images(image_paths)
+        :param type_image: Type of image for the shockwave ("fireball" or other).
+        :rtype: Animation
+        """
+        if type_image not in Shockwave.animation_paths:
+            type_image = "arrow"
 
-        self.main_velocity = constants.VELOCITY * screen_obj.width_scale
-        self.main_direction = 'right'
+        key = (type_image, screen_obj.width_scale, screen_obj.height_scale)
+        images = Shockwave.animation_sets.get(key)
 
-        image_rect = self.images[0].get_rect()
-        image_rect.center = (x + 20 * screen_obj.width_scale, y - 15 * screen_obj.height_scale)
+        if images is None:
+            Shockwave.animation_sets = {other: frames for other, frames in Shockwave.animation_sets.items()
+                                        if other[1:] == key[1:]}
+            images = ImageCache.get_animation(Shockwave.animation_paths[type_image])
+            Shockwave.animation_sets[key] = images
 
-        rect_x = 20 * screen_obj.width_scale
-        rect_y = 20 * screen_obj.height_scale
+        return images
 
-        small_rect_size = (rect_x, rect_y)
-        self.position = [image_rect.x, image_rect.y]
-        self.rect = pygame.Rect(0, 0, *small_rect_size)
-        self.rect.center = image_rect.center
+    @staticmethod
+    def clear_animation_sets():
+        """
+        Drop the shared frames of every type of image, so evicting them from ImageCache frees them.
 
-    def draw(self, screen):
+        :rtype: None
         """
-        Draw the shockwave on the screen.
+        Shockwave.animation_sets = {}
 
-        :param screen: The screen surface to draw on.
+    def reset(self, x, y, dx, dy, direction=1, type_image="fireball"):
+        """
+        Place the shockwave at a new start with a new velocity, reusing its vector and rects.
+
+        :param x: World x-coordinate of the shooter.
+        :param y: Y-coordinate of the shooter.
+        :param dx: Change in x-coordinate per update.
+        :param dy: Change in y-coordinate per update.
+        :param direction: Direction of the shockwave (1 for right, -1 for left).
+        :param type_image: Type of image for the shockwave ("fireball" or other).
         :rtype: None
         """
-        if self.direction == -1:
-            screen.blit(pygame.transform.flip(self.images[self.animation_count], True, False),
-                        self.position)
-        elif self.direction == 1:
-            screen.blit(self.images[self.animation_count], self.position)
+        self.velocity.update(direction * dx, dy)
+        self.damage_dealt = False
+        self.direction = direction
+        self.animation_count = 0
+        self.images = self.get_images(type_image)
 
-        self.animation_count += 1
-        if self.animation_count == len(self.images):
-            self.animation_count = 0
+        self.image_rect.size = self.images[0].get_size()
+        self.image_rect.center = (x + 20 * screen_obj.width_scale, y - 15 * screen_obj.height_scale)
+
+        self.position[0] = self.image_rect.x
+        self.position[1] = self.image_rect.y
+        self.prev_position[:] = self.position
+        self.rect.size = (20 * screen_obj.width_scale, 20 * screen_obj.height_scale)
+        self.rect.center = self.image_rect.center
 
-    def update(self, screen, sprites, game, damage_to="player"):
+    def draw(self, screen):
         """
-        Update the shockwave's position and check for collisions.
+        Draw the shockwave on the screen, interpolated between its last two simulation steps.
 
         :param screen: The screen surface to draw on.
+        :rtype: None
+        """
+        position = camera_obj.apply_interpolated_point(*self.prev_position, *self.position)
+        screen.blit(self.images.get(self.animation_count, self.direction), position)
+
+    def update(self, sprites, game, damage_to="player"):
+        """
+        Update the shockwave's position and animation frame and check for collisions.
+
         :param sprites: The group of sprites to which the shockwave belongs.
         :param game: The game object containing game state and entities.
         :param damage_to: The type of entity to deal damage to ("player" or "enemy").
@@ -114,32 +186,22 @@ class Shockwave(pygame.sprite.Sprite):
         self.rect.x += self.velocity.x * screen_obj.width_scale
         self.rect.y += self.velocity.y * screen_obj.height_scale
 
+        self.prev_position[:] = self.position
         self.position[0] += self.velocity.x * screen_obj.width_scale
         self.position[1] += self.velocity.y * screen_obj.height_scale
 
-        self.draw(screen)
+        self.animation_count += 1
+        if self.animation_count == len(self.images):
+            self.animation_count = 0
+
         if damage_to == "player":
             self.deal_damage_player(game.player)
         else:
-            self.deal_damage_enemy(game.enemies)
+            self.deal_damage_enemy(game.broadphase)
 
-        if self.rect.x > screen_obj.width or self.rect.x < 0:
+        screen_x = self.rect.x - camera_obj.get_offset()
+        if screen_x > screen_obj.width or screen_x < 0:
             self.kill()
-            sprites.remove(self)
-
-    def move_sprite(self, direction):
-        """
-        Move the shockwave in the specified direction.
-
-        :param direction: The direction to move the shockwave.
-        :rtype: None
-        """
-        if direction != self.main_direction:
-            self.main_velocity *= -1
-            self.main_direction = direction
-
-        self.rect.x += self.main_velocity
-        self.position[0] += self.main_velocity
 
     def deal_damage_player(self, player):
         """
@@ -153,16 +215,79 @@ class Shockwave(pygame.sprite.Sprite):
                 player.take_damage()
                 self.damage_dealt = True
 
-    def deal_damage_enemy(self, enemies):
+    def deal_damage_enemy(self, broadphase):
         """
         Deal damage to enemies if the shockwave collides with them.
 
-        :param enemies: The group of enemies to potentially deal damage to.
+        :param broadphase: The Broadphase of the enemies to potentially deal damage to.
         :rtype: None
         """
         if not self.damage_dealt:
-            for group in enemies:
-                for enemy in group:
-                    if pygame.sprite.collide_rect(self, enemy):
-                        enemy.take_damage()
-                        self.damage_dealt = True
+            for enemy in broadphase.query(self.rect):
+                enemy.take_damage()
+                self.damage_dealt = True
+
+
+class ShockwavePool(pygame.sprite.Group):
+    """
+    A sprite group of shockwaves that recycles the shockwaves removed from it.
+
+    A shockwave that leaves the screen kills itself, which puts it on the pool's free list.
+    The next shot resets a free shockwave instead of creating a new one, so a long fight
+    allocates no sprites once the pool holds as many shockwaves as are in flight at once.
+
+    Attributes:
+    - cap: Maximum number of live shockwaves in the group.
+    - free: Shockwaves removed from the group, ready to be reused.
+
+    Methods:
+    - __init__(self, cap=constants.MAX_PROJECTILES): Initializes an empty pool.
+    - spawn(self, x, y, dx, dy, direction=1, type_image="fireball"):
+        Adds a recycled or new shockwave to the group, unless the cap is reached.
+    """
+
+    def __init__(self, cap=constants.MAX_PROJECTILES):
+        """
+        Initialize the ShockwavePool.
+
+        :param cap: Maximum number of live shockwaves in the group.
+        :rtype: object
+        """
+        super().__init__()
+        self.cap = cap
+        self.free = []
+
+    def spawn(self, x, y, dx, dy, direction=1, type_image="fireball"):
+        """
+        Add a shockwave to the group, reusing a free one when there is one.
+
+        :param x: World x-coordinate of the shooter.
+        :param y: Y-coordinate of the shooter.
+        :param dx: Change in x-coordinate per update.
+        :param dy: Change in y-coordinate per update.
+        :param direction: Direction of the shockwave (1 for right, -1 for left).
+        :param type_image: Type of image for the shockwave ("fireball" or other).
+        :rtype: Shockwave or None
+        :return: the shockwave, or None if the group already holds cap shockwaves.
+        """
+        if len(self) >= self.cap:
+            return None
+
+        if self.free:
+            shockwave = self.free.pop()
+            shockwave.reset(x, y, dx, dy, direction, type_image)
+        else:
+            shockwave = Shockwave(x, y, dx, dy, direction, type_image)
+
+        self.add(shockwave)
+        return shockwave
+
+    def remove_internal(self, sprite):
+        """
+        Remove a shockwave from the group and keep it for reuse.
+
+        :param sprite: The shockwave to remove.
+        :rtype: None
+        """
+        super().remove_internal(sprite)
+        self.free.append(sprite)
@@ -0,0 +1,136 @@
+"""
+Module: game.src.snapshot
+
+This module defines the `Snapshot` class, which records the state of the game objects right after a
+level is created so that the level can be put back in that state in place, without creating it again.
+
+Only the plain state of each object is recorded: numbers, flags, strings, tuples, rects, vectors and
+lists, plus the members of its sprite groups. Surfaces and sounds are recorded by reference, so restoring
+a snapshot reuses them instead of loading, scaling or decoding them again. Other objects held by an
+object, such as fonts, clocks or dictionaries shared between instances, are assumed not to change
+during a game and are left as they are.
+
+Classes:
+- Snapshot:
+    The recorded state of a list of objects.
+
+    Methods:
+    - take_state(obj, skip=()):
+        Return the recorded state of a single object.
+    - restore_members(group, members):
+        Give a sprite group back its recorded members.
+    - restore():
+        Put every object back in its recorded state.
+
+Usage:
+from game.src.snapshot import Snapshot
+
+snapshot = Snapshot(game, game.player, *game.enemies)
+...
+snapshot.restore()
+
+Notes:
+- Sprite groups passed as objects themselves get their members back, in their recorded order.
+- Attributes added to an object after the snapshot was taken are kept as they are.
+"""
+
+import pygame
+
+
+class Snapshot:
+    """
+        The recorded state of a list of objects.
+
+        Attributes:
+            SHARED_TYPES (tuple): Types recorded by reference, as they are immutable or never modified.
+            COPIED_TYPES (tuple): Types recorded and restored as copies.
+            states (list): (object, attributes, groups) tuples, where attributes maps attribute names to
+                recorded values and groups maps attribute names of sprite groups to their members.
+            members (list): (group, members) tuples of the sprite groups passed as objects.
+            skip (tuple): Names of the attributes that are never recorded.
+
+        Methods:
+            take_state(obj, skip=()): Return the recorded state of a single object.
+            restore_members(group, members): Give a sprite group back its recorded members.
+            restore(): Put every object back in its recorded state.
+        """
+
+    SHARED_TYPES = (bool, int, float, str, tuple, type(None), pygame.Surface)
+    COPIED_TYPES = (list, pygame.Rect, pygame.Vector2)
+
+    def __init__(self, *objects, skip=()):
+        """
+        Record the state of the objects.
+
+        :param objects: The objects and sprite groups to record.
+        :param skip: Names of the attributes that are never recorded, such as state set up when a scene is entered.
+        :rtype: object
+        """
+        self.states = []
+        self.members = []
+        self.skip = skip
+
+        for obj in objects:
+            if isinstance(obj, pygame.sprite.AbstractGroup):
+                self.members.append((obj, obj.sprites()))
+            else:
+                self.states.append((obj, *Snapshot.take_state(obj, skip)))
+
+    @staticmethod
+    def take_state(obj, skip=()):
+        """
+        Return the recorded state of a single object.
+
+        :param obj: The object to record.
+        :param skip: Names of the attributes that are not recorded.
+        :rtype: tuple
+        :return: The recorded attributes and the members of the sprite groups of the object.
+        """
+        attributes = {}
+        groups = {}
+
+        for name, value in vars(obj).items():
+            if name in skip:
+                continue
+
+            if isinstance(value, Snapshot.SHARED_TYPES):
+                attributes[name] = value
+            elif isinstance(value, Snapshot.COPIED_TYPES):
+                attributes[name] = value.copy()
+            elif isinstance(value, pygame.sprite.AbstractGroup):
+                groups[name] = value.sprites()
+
+        return attributes, groups
+
+    @staticmethod
+    def restore_members(group, members):
+        """
+        Give a sprite group back its recorded members, in their recorded order.
+        Sprites added since the snapshot are removed; the group is only refilled when sprites are missing.
+
+        :param group: The sprite group.
+        :param members: The recorded members of the group.
+        :rtype: None
+        """
+        recorded = set(members)
+        group.remove(*[sprite for sprite in group if sprite not in recorded])
+
+        if len(group) != len(members):
+            group.empty()
+            group.add(*members)
+
+    def restore(self):
+        """
+        Put every object back in its recorded state.
+
+        :rtype: None
+        """
+        for obj, attributes, groups in self.states:
+            for name, value in attributes.items():
+                setattr(obj, name, value.copy() if isinstance(value, Snapshot.COPIED_TYPES) else value)
+
+            for name, members in groups.items():
+                Snapshot.restore_members(getattr(obj, name), members)
+
+        for group, members in self.members:
+            Snapshot.restore_members(group, members)
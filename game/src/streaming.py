@@ -0,0 +1,381 @@
+"""
+Module: game.src.streaming
+
+This module defines the `LevelStreamer` class, which creates the objects of a level chunk by chunk
+as the camera moves and removes the chunks left far behind.
+
+The compiled level is split into horizontal chunks of constants.LEVEL_CHUNK_WIDTH design units.
+Every record belongs to the chunk of its left edge. Chunks from constants.STREAM_UNLOAD_BEHIND behind
+the left edge of the screen to constants.STREAM_LOAD_AHEAD ahead of its right edge are loaded:
+chunks on the screen are built at once, and chunks ahead of it are built a few objects per simulation
+step (constants.STREAM_BUILD_BUDGET), so the player never walks into a chunk that is still being built
+and no single step pays for a whole chunk. Chunks further than one more chunk away are unloaded, so the
+number of live objects, and the work done for them every step, does not depend on the length of the level.
+
+Enemies that were defeated are remembered, so unloading and loading their chunk again does not bring
+them back. Other objects are created again in their initial state.
+
+The boss arena is prefetched once the camera is within constants.ARENA_PREFETCH_DISTANCE of its trigger:
+the frames of the bosses and of their fireballs are scaled one image at a time with the budget left
+over by the chunks, and the bosses and gates are built last. They are only added to the game when the
+camera reaches the trigger, so neither the frame in which the boss appears nor its first fireball
+scales any image.
+
+Classes:
+- LevelStreamer:
+    Loads and unloads the chunks of a level around the camera.
+
+    Methods:
+    - get_chunk(x):
+        Return the chunk of a world x-coordinate.
+    - get_left(kind, record):
+        Return the left edge of a record.
+    - update(camera_x, budget=constants.STREAM_BUILD_BUDGET):
+        Load and unload chunks for the camera position.
+    - build(index, kind, record_id, record):
+        Create the object of a record and add it to the game.
+    - unload(index):
+        Remove the objects of a chunk from the game.
+    - get_arena_steps():
+        Return the steps that prefetch the arena.
+    - prefetch_arena(budget=None):
+        Run the next steps of the arena prefetch.
+    - build_arena():
+        Create the bosses and gates of the arena.
+    - open_arena():
+        Add the bosses and gates of the arena to the game.
+    - count_enemies_left():
+        Return the number of enemies of the level not defeated yet.
+    - take_snapshot():
+        Record which chunks are loaded.
+    - reset():
+        Go back to the recorded chunks.
+
+Usage:
+from game.src.streaming import LevelStreamer
+
+streamer = LevelStreamer(game, level)
+streamer.update(game.absolute_x)
+
+Notes:
+- Objects must not be wider than a chunk, so that unloading a chunk never removes anything on the screen.
+- The images of the level are decoded by the preloader before the game starts and pinned while it runs,
+  so building a chunk or prefetching the arena only scales images and creates objects.
+"""
+
+from collections import deque
+from functools import partial
+from game.src import constants
+from game.src import creater
+from game.src.cache import ImageCache
+from game.src.screen import screen_obj
+from game.src.shokwave import Shockwave
+import pygame
+
+
+class LevelStreamer:
+    """
+        Loads and unloads the chunks of a level around the camera.
+
+        Attributes:
+            KINDS (tuple): Sections of the compiled level that are streamed.
+            BUILDERS (dict): Section -> function creating the object of one of its records.
+            game (GameOn): The game the objects are added to.
+            level (CompiledLevel): The level.
+            chunk_width (float): Width of a chunk in world pixels.
+            load_ahead (float): Distance ahead of the screen within which chunks are loaded.
+            unload_behind (float): Distance behind the screen within which chunks are kept.
+            prefetch_distance (float): Distance before the arena trigger from which the arena is prefetched.
+            chunks (dict): Chunk index -> list of (section, record id, record) of the records in it.
+            groups (dict): Enemy type -> sprite group of the loaded enemies of that type.
+            loaded (dict): Chunk index -> list of (section, record id, record, object) of the objects built.
+            pending (dict): Chunk index -> deque of the records of a loaded chunk not built yet.
+            defeated (set): Record ids of the defeated enemies.
+            order (dict): Partial background -> record id, so they are drawn in the order of the level.
+            prefetch (deque or None): Steps of the arena prefetch not run yet, None before it starts.
+            arena (tuple or None): (bosses, gates) of the arena once they are built.
+            saved (tuple or None): Chunks recorded by take_snapshot.
+
+        Methods:
+            get_chunk(x): Return the chunk of a world x-coordinate.
+            get_left(kind, record): Return the left edge of a record.
+            update(camera_x, budget=constants.STREAM_BUILD_BUDGET): Load and unload chunks for the camera position.
+            build(index, kind, record_id, record): Create the object of a record and add it to the game.
+            unload(index): Remove the objects of a chunk from the game.
+            get_arena_steps(): Return the steps that prefetch the arena.
+            prefetch_arena(budget=None): Run the next steps of the arena prefetch.
+            build_arena(): Create the bosses and gates of the arena.
+            open_arena(): Add the bosses and gates of the arena to the game.
+            count_enemies_left(): Return the number of enemies of the level not defeated yet.
+            take_snapshot(): Record which chunks are loaded.
+            reset(): Go back to the recorded chunks.
+        """
+
+    KINDS = ("decorations", "platforms", "moving_platforms", "enemies", "npcs")
+    BUILDERS = {
+        "decorations": creater.create_decoration,
+        "platforms": creater.create_platform,
+        "moving_platforms": creater.create_moving_platform,
+        "enemies": creater.create_enemy,
+        "npcs": creater.create_npc,
+    }
+
+    def __init__(self, game, level):
+        """
+        Split a level into chunks. Nothing is built until the first update.
+
+        :param game: The game the objects are added to.
+        :param level: The compiled level.
+        :rtype: object
+        """
+        self.game = game
+        self.level = level
+
+        self.chunk_width = constants.LEVEL_CHUNK_WIDTH * screen_obj.width_scale
+        self.load_ahead = constants.STREAM_LOAD_AHEAD * screen_obj.width_scale
+        self.unload_behind = constants.STREAM_UNLOAD_BEHIND * screen_obj.width_scale
+        self.prefetch_distance = constants.ARENA_PREFETCH_DISTANCE * screen_obj.width_scale
+
+        self.chunks = {}
+        for kind in LevelStreamer.KINDS:
+            for record_id, record in enumerate(getattr(level, kind)):
+                index = self.get_chunk(LevelStreamer.get_left(kind, record))
+                self.chunks.setdefault(index, []).append((kind, record_id, record))
+
+        self.groups = {}
+        for enemy_type, *_ in level.enemies:
+            self.groups.setdefault(enemy_type, pygame.sprite.Group())
+
+        self.loaded = {}
+        self.pending = {}
+        self.defeated = set()
+        self.order = {}
+        self.prefetch = None
+        self.arena = None
+        self.saved = None
+
+    def get_chunk(self, x):
+        """
+        Return the chunk of a world x-coordinate.
+
+        :param x: The world x-coordinate.
+        :rtype: int
+        """
+        return int(x // self.chunk_width)
+
+    @staticmethod
+    def get_left(kind, record):
+        """
+        Return the left edge of a record. A moving platform reaches as far left as its sliding bounds.
+
+        :param kind: The section of the record.
+        :param record: The record.
+        :rtype: float
+        """
+        if kind in ("enemies", "npcs"):
+            return record[1]
+
+        if kind == "moving_platforms" and record[6] == "x":
+            return min(record[0], record[4], record[5])
+
+        return record[0]
+
+    def update(self, camera_x, budget=constants.STREAM_BUILD_BUDGET):
+        """
+        Load the chunks around the camera and unload those far behind or ahead of it.
+        Chunks on the screen are built at once, the others at most budget objects per call.
+        The budget they leave over is spent on the arena prefetch once the camera is close to the trigger.
+
+        :param camera_x: The camera offset.
+        :param budget: Maximum number of objects built for chunks off the screen, or None for no limit.
+        :rtype: None
+        """
+        first = self.get_chunk(camera_x - self.unload_behind)
+        last = self.get_chunk(camera_x + screen_obj.width + self.load_ahead)
+
+        for index in [index for index in self.loaded if index < first - 1 or index > last + 1]:
+            self.unload(index)
+
+        for index in range(first, last + 1):
+            if index in self.chunks and index not in self.loaded:
+                self.loaded[index] = []
+                self.pending[index] = deque(self.chunks[index])
+
+        # Objects of the chunk left of the screen may reach into it.
+        visible_first = self.get_chunk(camera_x) - 1
+        visible_last = self.get_chunk(camera_x + screen_obj.width)
+
+        for index in list(self.pending):
+            records = self.pending[index]
+            urgent = visible_first <= index <= visible_last
+
+            while records and (urgent or budget is None or budget > 0):
+                self.build(index, *records.popleft())
+                if budget is not None and not urgent:
+                    budget -= 1
+
+            if not records:
+                del self.pending[index]
+
+        if self.arena is None and camera_x + self.prefetch_distance >= self.level.arena_trigger:
+            self.prefetch_arena(budget)
+
+    def build(self, index, kind, record_id, record):
+        """
+        Create the object of a record and add it to the game, unless it is a defeated enemy.
+
+        :param index: The chunk of the record.
+        :param kind: The section of the record.
+        :param record_id: The index of the record in its section.
+        :param record: The record.
+        :rtype: None
+        """
+        if kind == "enemies" and record_id in self.defeated:
+            return
+
+        obj = LevelStreamer.BUILDERS[kind](record)
+
+        if kind == "decorations":
+            self.order[obj] = record_id
+            self.game.partial_backgrounds.append(obj)
+            self.game.partial_backgrounds.sort(key=self.order.__getitem__)
+        elif kind == "platforms":
+            self.game.platforms.add_indexed(obj, record[5:])
+        elif kind == "moving_platforms":
+            self.game.platforms.add(obj)
+        elif kind == "enemies":
+            self.groups[record[0]].add(obj)
+        elif kind == "npcs":
+            self.game.npcs.add(obj)
+
+        self.loaded[index].append((kind, record_id, record, obj))
+
+    def unload(self, index):
+        """
+        Remove the objects of a chunk from the game.
+        Enemies no longer in their group were defeated and are not built again.
+
+        :param index: The chunk.
+        :rtype: None
+        """
+        for kind, record_id, record, obj in self.loaded.pop(index):
+            if kind == "decorations":
+                self.game.partial_backgrounds.remove(obj)
+                del self.order[obj]
+            elif kind in ("platforms", "moving_platforms"):
+                self.game.platforms.remove(obj)
+            elif kind == "enemies":
+                group = self.groups[record[0]]
+                if group.has(obj):
+                    group.remove(obj)
+                else:
+                    self.defeated.add(record_id)
+            elif kind == "npcs":
+                self.game.npcs.remove(obj)
+
+        self.pending.pop(index, None)
+
+    def get_arena_steps(self):
+        """
+        Return the steps that prefetch the arena: scaling each frame of the bosses and of their fireballs,
+        resolving the fireball animation, and building the bosses and gates last.
+
+        :rtype: deque
+        :return: Functions taking no argument, each one worth about one object of the build budget.
+        """
+        steps = deque()
+
+        for boss_type in dict.fromkeys(boss_type for boss_type, *_ in self.level.bosses):
+            for paths, scale, mirrored in creater.ENEMY_TYPES[boss_type].animation_paths.values():
+                load = ImageCache.get_animation if mirrored else ImageCache.get_images
+                steps.extend(partial(load, [path], scale) for path in paths)
+
+        steps.extend(partial(ImageCache.get_animation, [path]) for path in Shockwave.animation_paths["fireball"])
+        steps.append(partial(Shockwave.get_images, "fireball"))
+        steps.append(self.build_arena)
+
+        return steps
+
+    def prefetch_arena(self, budget=None):
+        """
+        Run the next steps of the arena prefetch, starting it if needed.
+
+        :param budget: Maximum number of steps to run, or None to finish the prefetch.
+        :rtype: None
+        """
+        if self.prefetch is None:
+            self.prefetch = self.get_arena_steps()
+
+        while self.prefetch and (budget is None or budget > 0):
+            self.prefetch.popleft()()
+            if budget is not None:
+                budget -= 1
+
+    def build_arena(self):
+        """
+        Create the bosses and gates of the arena, placed relative to its trigger.
+
+        :rtype: None
+        """
+        self.arena = (creater.create_bosses(self.level, self.level.arena_trigger),
+                      creater.create_gates(self.level, self.level.arena_trigger))
+
+    def open_arena(self):
+        """
+        Add the bosses and gates of the arena to the game, finishing the prefetch now if it is not done.
+
+        :rtype: tuple
+        :return: The groups of the bosses and the gates.
+        """
+        if self.arena is None:
+            self.prefetch_arena()
+
+        bosses, gates = self.arena
+        self.game.enemies.append(bosses)
+        self.game.platforms.add(gates)
+
+        return bosses, gates
+
+    def count_enemies_left(self):
+        """
+        Return the number of enemies of the level not defeated yet, whether their chunk is loaded or not.
+        Loaded enemies count as defeated once they die.
+
+        :rtype: int
+        """
+        defeated = set(self.defeated)
+
+        for objects in self.loaded.values():
+            for kind, record_id, record, obj in objects:
+                if kind == "enemies" and (obj.is_dead or not self.groups[record[0]].has(obj)):
+                    defeated.add(record_id)
+
+        return len(self.level.enemies) - len(defeated)
+
+    def take_snapshot(self):
+        """
+        Record which chunks are loaded and which records are still to be built.
+        The objects themselves are recorded by the snapshot of the game.
+
+        :rtype: None
+        """
+        self.saved = ({index: list(objects) for index, objects in self.loaded.items()},
+                      {index: deque(records) for index, records in self.pending.items()},
+                      dict(self.order))
+
+    def reset(self):
+        """
+        Go back to the chunks recorded by take_snapshot, forgetting the defeated enemies and the arena.
+        The snapshot of the game puts the recorded objects back in their groups.
+        The images prefetched for the arena stay cached, so prefetching it again only builds it.
+
+        :rtype: None
+        """
+        loaded, pending, order = self.saved
+
+        self.loaded = {index: list(objects) for index, objects in loaded.items()}
+        self.pending = {index: deque(records) for index, records in pending.items()}
+        self.order = dict(order)
+        self.defeated.clear()
+        self.prefetch = None
+        self.arena = None
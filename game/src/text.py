@@ -0,0 +1,154 @@
+"""
+Module: game.src.text
+
+This module defines the `FontRegistry` class, which shares font objects, and the `TextCache`
+class, which keeps rendered strings so that drawing text costs a single blit after the first frame.
+
+Creating a `pygame.font.Font` reads and parses the font file, and `Font.render` rasterizes every
+glyph of the string, so doing either every frame is far more expensive than the blit itself.
+Damage numbers, button labels, menu titles and the shop list all repeat the same few strings,
+so their surfaces are rendered once and reused until they are evicted.
+
+Attributes:
+- font_registry_obj (FontRegistry): The shared font registry.
+- text_cache_obj (TextCache): The shared cache of rendered strings.
+
+Classes:
+- FontRegistry:
+    Creates every (font path, size) once and returns the same Font afterwards.
+
+    Methods:
+    - get_font(size, path=None):
+        Return the font of the given size.
+- TextCache:
+    Least recently used cache of rendered strings keyed by (font path, size, text, color).
+
+    Methods:
+    - render(text, size, color, path=None):
+        Return the rendered surface of a string.
+    - clear():
+        Drop all rendered strings.
+
+Usage:
+from game.src.text import text_cache_obj
+
+text_surface = text_cache_obj.render("Play", 36, (255, 255, 255))
+screen.blit(text_surface, text_surface.get_rect(center=button_rect.center))
+
+Notes:
+- Returned surfaces are shared between all callers with the same request,
+  so they must not be modified in place.
+- Strings that change every frame, such as timings, should be rendered directly,
+  as caching them would only evict the strings that repeat.
+"""
+from collections import OrderedDict
+from game.src import constants
+import pygame
+
+
+class FontRegistry:
+    """
+        A class that creates every font once and shares it between all callers.
+
+        Attributes:
+            fonts (dict): (font path, size) -> pygame.font.Font.
+
+        Methods:
+            get_font(size, path=None): Return the font of the given size.
+        """
+
+    def __init__(self):
+        """
+        Initialize an empty FontRegistry.
+
+        :rtype: object
+        """
+        self.fonts = {}
+
+    def get_font(self, size, path=None):
+        """
+        Return the font of the given size, creating it on first use.
+
+        :param size: The size of the font.
+        :param path: The path to the font file, or None for the default font.
+        :rtype: pygame.font.Font
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+
+        return font
+
+
+class TextCache:
+    """
+        A least recently used cache of rendered strings.
+
+        Attributes:
+            registry (FontRegistry): The registry the fonts are taken from.
+            surfaces (OrderedDict): (font path, size, text, color) -> rendered surface,
+                least recently used first.
+            capacity (int): Maximum number of rendered strings kept.
+            hits (int): Number of strings served from the cache.
+            misses (int): Number of strings that had to be rendered.
+
+        Methods:
+            render(text, size, color, path=None): Return the rendered surface of a string.
+            clear(): Drop all rendered strings.
+        """
+
+    def __init__(self, registry, capacity=constants.TEXT_CACHE_SIZE):
+        """
+        Initialize an empty TextCache.
+
+        :param registry: The FontRegistry the fonts are taken from.
+        :param capacity: Maximum number of rendered strings kept.
+        :rtype: object
+        """
+        self.registry = registry
+        self.surfaces = OrderedDict()
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, size, color, path=None):
+        """
+        Return the anti-aliased surface of a string, rendering it only if it is not cached.
+
+        :param text: The string to render.
+        :param size: The size of the font.
+        :param color: The color of the text as an (r, g, b) tuple.
+        :param path: The path to the font file, or None for the default font.
+        :rtype: pygame.Surface
+        """
+        key = (path, size, text, tuple(color))
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.registry.get_font(size, path).render(text, True, color)
+        self.surfaces[key] = surface
+
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self):
+        """
+        Drop all rendered strings.
+
+        :rtype: None
+        """
+        self.surfaces.clear()
+
+
+font_registry_obj = FontRegistry()
+text_cache_obj = TextCache(font_registry_obj)